@@ -7,7 +7,7 @@ class AgendaConfig(AppConfig):
     name = "pretalx.agenda"
 
     def ready(self):
-        from . import permissions  # noqa
+        from . import permissions, signals  # noqa
         from .phrases import AgendaPhrases  # noqa
 
 
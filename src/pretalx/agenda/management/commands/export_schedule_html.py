@@ -13,7 +13,8 @@ from django.test import Client, override_settings
 from django.utils.timezone import override as override_timezone
 from django_scopes import scope, scopes_disabled
 
-from pretalx.common.signals import register_data_exporters
+from pretalx.common.exporter import get_exporters
+from pretalx.common.urls import EventUrlBuilder
 from pretalx.common.utils import rolledback_transaction
 from pretalx.event.models import Event
 
@@ -44,6 +45,8 @@ def find_assets(html):
     try:
         for asset in soup.find_all(["script", "img"]):
             yield asset.attrs["src"]
+        for asset in soup.find_all(["source"]):
+            yield asset.attrs["srcset"]
         for asset in soup.find_all(["link"]):
             if asset.attrs["rel"][0] in ["icon", "stylesheet"]:
                 yield asset.attrs["href"]
@@ -55,45 +58,46 @@ def find_urls(css):
     return re.findall(r'url\("?(/[^")]+)"?\)', css.decode("utf-8"), re.IGNORECASE)
 
 
-def event_talk_urls(event):
-    for talk in event.talks:
-        yield talk.urls.public
-        yield talk.urls.ical
+def event_talk_urls(event, url_builder):
+    for talk in event.talks.prefetch_related("resources"):
+        yield url_builder.submission_url(talk.code, "public")
+        yield url_builder.submission_url(talk.code, "ical")
 
-        for resource in talk.active_resources:
-            yield resource.resource.url
+        for resource in talk.resources.all():
+            if resource.resource:
+                yield resource.resource.url
 
 
-def event_speaker_urls(event):
-    for speaker in event.speakers:
-        profile = speaker.event_profile(event)
-        yield profile.urls.public
-        yield profile.urls.talks_ical
+def event_speaker_urls(event, url_builder):
+    for code in event.speakers.values_list("code", flat=True):
+        yield url_builder.speaker_url(code, "public")
+        yield url_builder.speaker_url(code, "talks_ical")
 
 
 def event_exporter_urls(event):
-    for _, exporter in register_data_exporters.send(event):
+    for exporter in get_exporters(event).values():
+        exporter = exporter(event)
         if exporter.public:
-            yield exporter(event).urls.base
-            yield exporter(event).urls.base
+            yield exporter.urls.base
 
 
-def schedule_version_urls(event):
+def schedule_version_urls(event, url_builder):
     for schedule in event.schedules.filter(version__isnull=False):
-        yield schedule.urls.public
+        yield url_builder.schedule_url(schedule.url_version)
 
 
 def event_urls(event):
+    url_builder = EventUrlBuilder(event)
     yield event.urls.base
     yield event.urls.schedule
-    yield from schedule_version_urls(event)
+    yield from schedule_version_urls(event, url_builder)
     yield event.urls.sneakpeek
     yield event.urls.talks
     yield event.urls.talks_hope
-    yield from event_talk_urls(event)
+    yield from event_talk_urls(event, url_builder)
     yield event.urls.speakers
     yield event.urls.speakers_hope
-    yield from event_speaker_urls(event)
+    yield from event_speaker_urls(event, url_builder)
     yield from event_exporter_urls(event)
     yield event.urls.changelog
     yield event.urls.feed
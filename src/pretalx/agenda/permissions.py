@@ -8,14 +8,14 @@ def is_agenda_visible(user, event):
     return bool(
         event
         and event.is_public
-        and event.settings.show_schedule
+        and event.settings_snapshot.show_schedule
         and event.current_schedule
     )
 
 
 @rules.predicate
 def is_widget_always_visible(user, event):
-    return event.settings.show_widget_if_not_public
+    return event.settings_snapshot.show_widget_if_not_public
 
 
 @rules.predicate
@@ -25,7 +25,7 @@ def has_agenda(user, event):
 
 @rules.predicate
 def is_sneak_peek_visible(user, event):
-    return bool(event and event.is_public and event.settings.show_sneak_peek)
+    return bool(event and event.is_public and event.settings_snapshot.show_sneak_peek)
 
 
 @rules.predicate
@@ -1,4 +1,15 @@
+from django.db.models import signals
+from django.dispatch import receiver
+from django_scopes import scopes_disabled
+
+from pretalx.agenda.widget import update_widget_data
 from pretalx.common.signals import EventPluginSignal
+from pretalx.event.models import Event
+from pretalx.event.models.event import Event_SettingsStore
+from pretalx.person.models import User
+from pretalx.schedule.models import Room, TalkSlot
+from pretalx.submission.models import Submission, Track
+from pretalx.submission.signals import submission_state_change_bulk
 
 register_recording_provider = EventPluginSignal(providing_args=[])
 """
@@ -8,3 +19,56 @@ should return a subclass of pretalx.agenda.recording.BaseRecordingProvider.
 As with all event plugin signals, the ``sender`` keyword argument will contain
 the event.
 """
+
+WIDGET_SETTINGS = ("show_schedule", "show_widget_if_not_public")
+
+
+@receiver(signals.post_save, sender=Event, dispatch_uid="widget_event_save")
+def update_widget_for_event(sender, instance, **kwargs):
+    update_widget_data(instance)
+
+
+@receiver(signals.post_save, sender=Room, dispatch_uid="widget_room_save")
+@receiver(signals.post_delete, sender=Room, dispatch_uid="widget_room_delete")
+@receiver(signals.post_save, sender=Track, dispatch_uid="widget_track_save")
+@receiver(signals.post_delete, sender=Track, dispatch_uid="widget_track_delete")
+def update_widget_for_event_object(sender, instance, **kwargs):
+    update_widget_data(instance.event)
+
+
+@receiver(signals.post_save, sender=TalkSlot, dispatch_uid="widget_slot_save")
+@receiver(signals.post_delete, sender=TalkSlot, dispatch_uid="widget_slot_delete")
+def update_widget_for_slot(sender, instance, **kwargs):
+    if instance.schedule.version:  # The widget only shows released schedules
+        update_widget_data(instance.schedule.event)
+
+
+@receiver(signals.post_save, sender=Submission, dispatch_uid="widget_submission")
+def update_widget_for_submission(sender, instance, **kwargs):
+    with scopes_disabled():
+        schedule = instance.event.current_schedule
+        if schedule and schedule.talks.filter(submission=instance).exists():
+            update_widget_data(instance.event)
+
+
+@receiver(submission_state_change_bulk, dispatch_uid="widget_submission_states")
+def update_widget_for_submission_states(sender, **kwargs):
+    update_widget_data(sender)
+
+
+@receiver(signals.post_save, sender=User, dispatch_uid="widget_user_save")
+def update_widget_for_user(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= {"last_login", "pw_reset_token"}:
+        return
+    with scopes_disabled():
+        for profile in instance.profiles.all().select_related("event"):
+            update_widget_data(profile.event)
+
+
+@receiver(signals.post_save, sender=Event_SettingsStore, dispatch_uid="widget_settings")
+@receiver(
+    signals.post_delete, sender=Event_SettingsStore, dispatch_uid="widget_settings_del"
+)
+def update_widget_for_settings(sender, instance, **kwargs):
+    if instance.key in WIDGET_SETTINGS:
+        update_widget_data(instance.object)
@@ -1,5 +1,6 @@
 import logging
 
+from django.core.cache import cache
 from django_scopes import scope, scopes_disabled
 
 from pretalx.celery_app import app
@@ -31,3 +32,18 @@ def export_schedule_html(*, event_id: int, make_zip=True):
     if make_zip:
         cmd.append("--zip")
     call_command(*cmd)
+
+
+@app.task()
+def regenerate_widget_data(*, event_id: int):
+    from pretalx.agenda.widget import get_widget_update_key, store_widget_data
+
+    with scopes_disabled():
+        event = Event.objects.filter(pk=event_id).first()
+    if not event:
+        LOGGER.error(f"In regenerate_widget_data: Could not find Event ID {event_id}")
+        return
+    # Changes from now on need to be picked up by another task
+    cache.delete(get_widget_update_key(event))
+    with scope(event=event):
+        store_widget_data(event)
@@ -55,7 +55,7 @@ urlpatterns = [
                 ),
                 url(
                     r"^schedule/widget/v1.json$",
-                    widget.WidgetData.as_view(),
+                    widget.widget_data,
                     name="widget.data",
                 ),
                 *get_schedule_urls("^schedule"),
@@ -1,3 +1,4 @@
+import bisect
 import datetime as dt
 import hashlib
 import textwrap
@@ -13,20 +14,60 @@ from django.http import (
     HttpResponseNotModified,
     HttpResponsePermanentRedirect,
     HttpResponseRedirect,
+    StreamingHttpResponse,
 )
 from django.urls import resolve, reverse
 from django.utils.functional import cached_property
 from django.utils.timezone import now
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import TemplateView
 from django_context_decorator import context
 
+from pretalx.api.mixins import get_public_api_cache
 from pretalx.common.console import LR, UD, get_seperator
+from pretalx.common.exporter import get_exporter, get_exporters
 from pretalx.common.mixins.views import EventPermissionRequired
-from pretalx.common.signals import register_data_exporters
 from pretalx.common.utils import safe_filename
 
 
+def get_schedule_data(event, schedule, with_accepted=False):
+    """Returns the schedule data of all days, with display positions for all
+    talks, and the largest number of rooms on any day."""
+    from pretalx.schedule.exporters import ScheduleData
+
+    timezone = pytz.timezone(event.timezone)
+    data = ScheduleData(
+        event=event, schedule=schedule, with_accepted=with_accepted, with_breaks=True,
+    ).data
+    max_rooms = 0
+    for date in data:
+        if date.get("first_start") and date.get("last_end"):
+            start = (
+                date.get("first_start").astimezone(timezone).replace(second=0, minute=0)
+            )
+            end = date.get("last_end").astimezone(timezone)
+            height_seconds = (end - start).total_seconds()
+            date["display_start"] = start
+            date["height"] = int(height_seconds / 60 * 2)
+            date["hours"] = []
+            step = start
+            while step < end:
+                date["hours"].append(step.strftime("%H:%M"))
+                step += dt.timedelta(hours=1)
+            max_rooms = max(max_rooms, len(date["rooms"]))
+            for room in date["rooms"]:
+                for talk in room.get("talks", []):
+                    talk.top = int(
+                        (talk.start.astimezone(timezone) - start).total_seconds()
+                        / 60
+                        * 2
+                    )
+                    talk.height = int(talk.duration * 2)
+                    talk.is_active = talk.start <= now() <= talk.real_end
+    return list(data), max_rooms
+
+
 class ScheduleDataView(EventPermissionRequired, TemplateView):
     permission_required = "agenda.view_schedule"
 
@@ -94,12 +135,9 @@ class ExporterView(ScheduleDataView):
         exporter = (
             exporter[len("export.") :] if exporter.startswith("export.") else exporter
         )
-        responses = register_data_exporters.send(request.event)
-        for __, response in responses:
-            ex = response(request.event)
-            if ex.identifier == exporter:
-                if ex.public or request.is_orga:
-                    return ex
+        exporter = get_exporter(request.event, exporter)
+        if exporter and (exporter.public or request.is_orga):
+            return exporter
         return None
 
     def get(self, request, *args, **kwargs):
@@ -109,13 +147,17 @@ class ExporterView(ScheduleDataView):
         try:
             exporter.schedule = self.schedule
             exporter.is_orga = getattr(self.request, "is_orga", False)
-            file_name, file_type, data = exporter.render()
-            etag = hashlib.sha1(str(data).encode()).hexdigest()
-            if "If-None-Match" in request.headers:
-                if request.headers["If-None-Match"] == etag:
-                    return HttpResponseNotModified()
-            resp = HttpResponse(data, content_type=file_type)
-            resp["ETag"] = etag
+            if hasattr(exporter, "render_stream"):
+                file_name, file_type, data = exporter.render_stream()
+                resp = StreamingHttpResponse(data, content_type=file_type)
+            else:
+                file_name, file_type, data = exporter.render()
+                etag = hashlib.sha1(str(data).encode()).hexdigest()
+                if "If-None-Match" in request.headers:
+                    if request.headers["If-None-Match"] == etag:
+                        return HttpResponseNotModified()
+                resp = HttpResponse(data, content_type=file_type)
+                resp["ETag"] = etag
             if file_type not in ["application/json", "text/xml"]:
                 resp[
                     "Content-Disposition"
@@ -181,30 +223,32 @@ class ScheduleView(ScheduleDataView):
         cards_by_id = {talk.pk: self._card(talk, col_width) for talk in talk_list}
         rooms = list(talks_by_room.keys())
         lines = ["        | " + " | ".join(f"{room:<{col_width-2}}" for room in rooms)]
-        tick_times = rrule.rrule(
-            rrule.HOURLY, byminute=(0, 30), dtstart=global_start, until=global_end,
+        ticks = list(
+            rrule.rrule(
+                rrule.HOURLY,
+                byminute=range(0, 60, 5),
+                dtstart=global_start,
+                until=global_end,
+            )
+        )
+        tick_times = set(
+            rrule.rrule(
+                rrule.HOURLY, byminute=(0, 30), dtstart=global_start, until=global_end,
+            )
         )
+        timelines = {
+            room: self._get_room_timeline(talks_by_room[room], ticks) for room in rooms
+        }
 
-        for hour in rrule.rrule(
-            rrule.HOURLY,
-            byminute=range(0, 60, 5),
-            dtstart=global_start,
-            until=global_end,
-        ):
+        for hour in ticks:
             starting_events = {
-                room: next((e for e in talks_by_room[room] if e.start == hour), None)
-                for room in rooms
+                room: timeline[0].get(hour) for room, timeline in timelines.items()
             }
             running_events = {
-                room: next(
-                    (e for e in talks_by_room[room] if e.start < hour < e.real_end),
-                    None,
-                )
-                for room in rooms
+                room: timeline[1].get(hour) for room, timeline in timelines.items()
             }
             ending_events = {
-                room: next((e for e in talks_by_room[room] if e.real_end == hour), None)
-                for room in rooms
+                room: timeline[2].get(hour) for room, timeline in timelines.items()
             }
             lines.append(
                 self._get_dt_line(
@@ -220,6 +264,20 @@ class ScheduleView(ScheduleDataView):
             )
         return "\n".join(lines)
 
+    @staticmethod
+    def _get_room_timeline(talks, ticks):
+        """Maps ticks to the talks starting, running and ending at them in one
+        room, so that rendering a tick does not have to search all talks."""
+        starting, running, ending = {}, {}, {}
+        for talk in talks:
+            starting.setdefault(talk.start, talk)
+            ending.setdefault(talk.real_end, talk)
+            first = bisect.bisect_right(ticks, talk.start)
+            last = bisect.bisect_left(ticks, talk.real_end)
+            for tick in ticks[first:last]:
+                running.setdefault(tick, talk)
+        return starting, running, ending
+
     def _get_dt_line(
         self,
         dt,
@@ -367,7 +425,6 @@ class ScheduleView(ScheduleDataView):
         return result
 
     def get_text(self, request, **kwargs):
-        data, _ = self.get_schedule_data()
         response_start = textwrap.dedent(
             f"""
         \033[1m{request.event.name}\033[0m
@@ -381,13 +438,33 @@ class ScheduleView(ScheduleDataView):
         output_format = request.GET.get("format", "table")
         if output_format not in ["list", "table"]:
             output_format = "table"
+        return HttpResponse(
+            response_start + self.get_cached_text(output_format),
+            content_type="text/plain; charset=utf-8",
+        )
+
+    def get_cached_text(self, output_format):
+        """Returns the schedule in the text format, cached per released
+        schedule version, format and language.
+
+        The cache is shared with the public API responses, so it is cleared
+        whenever the public data of the event changes.
+        """
+        cache = key = None
+        if self.schedule and self.schedule.version:
+            cache = get_public_api_cache(self.request.event)
+            key = f"schedule_text:{output_format}:{self.schedule.pk}:{get_language()}"
+            result = cache.get(key)
+            if result is not None:
+                return result
+        data, __ = self.get_schedule_data()
         if output_format == "list":
             result = self._get_text_list(data)
         else:
             result = self._get_text_table(data)
-        return HttpResponse(
-            response_start + result, content_type="text/plain; charset=utf-8"
-        )
+        if key:
+            cache.set(key, result, 3600)
+        return result
 
     @cached_property
     def answer_type(self):
@@ -439,10 +516,10 @@ class ScheduleView(ScheduleDataView):
 
     @context
     def exporters(self):
-        return list(
+        return [
             exporter(self.request.event)
-            for _, exporter in register_data_exporters.send(self.request.event)
-        )
+            for exporter in get_exporters(self.request.event).values()
+        ]
 
     @context
     def search(self):
@@ -467,44 +544,12 @@ class ScheduleView(ScheduleDataView):
         return result
 
     def get_schedule_data(self):
-        from pretalx.schedule.exporters import ScheduleData
-
-        timezone = pytz.timezone(self.request.event.timezone)
-        data = ScheduleData(
-            event=self.request.event,
-            schedule=self.schedule,
+        return get_schedule_data(
+            self.request.event,
+            self.schedule,
             with_accepted=self.answer_type == "html"
             and self.schedule == self.request.event.wip_schedule,
-            with_breaks=True,
-        ).data
-        max_rooms = 0
-        for date in data:
-            if date.get("first_start") and date.get("last_end"):
-                start = (
-                    date.get("first_start")
-                    .astimezone(timezone)
-                    .replace(second=0, minute=0)
-                )
-                end = date.get("last_end").astimezone(timezone)
-                height_seconds = (end - start).total_seconds()
-                date["display_start"] = start
-                date["height"] = int(height_seconds / 60 * 2)
-                date["hours"] = []
-                step = start
-                while step < end:
-                    date["hours"].append(step.strftime("%H:%M"))
-                    step += dt.timedelta(hours=1)
-                max_rooms = max(max_rooms, len(date["rooms"]))
-                for room in date["rooms"]:
-                    for talk in room.get("talks", []):
-                        talk.top = int(
-                            (talk.start.astimezone(timezone) - start).total_seconds()
-                            / 60
-                            * 2
-                        )
-                        talk.height = int(talk.duration * 2)
-                        talk.is_active = talk.start <= now() <= talk.real_end
-        return list(data), max_rooms
+        )
 
 
 class ChangelogView(EventPermissionRequired, TemplateView):
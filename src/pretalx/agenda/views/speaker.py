@@ -1,6 +1,5 @@
 from urllib.parse import urlparse
 
-import vobject
 from csp.decorators import csp_update
 from django.conf import settings
 from django.core.files.storage import Storage
@@ -14,6 +13,7 @@ from django_context_decorator import context
 from pretalx.common.mixins.views import PermissionRequired
 from pretalx.common.utils import safe_filename
 from pretalx.person.models import SpeakerProfile, User
+from pretalx.schedule.ical import get_cached_ical
 from pretalx.submission.models import QuestionTarget
 
 
@@ -72,17 +72,15 @@ class SpeakerTalksIcalView(PermissionRequired, DetailView):
         speaker = self.get_object()
         slots = self.request.event.current_schedule.talks.filter(
             submission__speakers=speaker.user, is_visible=True
-        ).select_related("room", "submission")
-
-        cal = vobject.iCalendar()
-        cal.add(
-            "prodid"
-        ).value = f"-//pretalx//{netloc}//{request.event.slug}//{speaker.code}"
-
-        for slot in slots:
-            slot.build_ical(cal)
+        )
+        content = get_cached_ical(
+            request.event,
+            f"speaker:{speaker.code}",
+            slots,
+            prodid=f"-//pretalx//{netloc}//{request.event.slug}//{speaker.code}",
+        )
 
-        resp = HttpResponse(cal.serialize(), content_type="text/calendar")
+        resp = HttpResponse(content, content_type="text/calendar")
         speaker_name = Storage().get_valid_name(name=speaker.user.name)
         resp[
             "Content-Disposition"
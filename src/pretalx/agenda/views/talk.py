@@ -1,6 +1,5 @@
 from urllib.parse import urlparse
 
-import vobject
 from django.conf import settings
 from django.contrib import messages
 from django.db.models import Q
@@ -20,6 +19,7 @@ from pretalx.common.mixins.views import (
 )
 from pretalx.common.phrases import phrases
 from pretalx.person.models.profile import SpeakerProfile
+from pretalx.schedule.ical import get_cached_ical
 from pretalx.schedule.models import Schedule, TalkSlot
 from pretalx.submission.forms import FeedbackForm
 from pretalx.submission.models import QuestionTarget, Submission, SubmissionStates
@@ -250,22 +250,22 @@ class SingleICalView(EventPageMixin, DetailView):
     slug_field = "code"
 
     def get(self, request, event, **kwargs):
-        talk = (
-            self.get_object()
-            .slots.filter(schedule=self.request.event.current_schedule, is_visible=True)
-            .first()
+        submission = self.get_object()
+        slots = submission.slots.filter(
+            schedule=self.request.event.current_schedule, is_visible=True
         )
-        if not talk:
+        if not slots.exists():
             raise Http404()
 
+        code = submission.code
         netloc = urlparse(settings.SITE_URL).netloc
-        cal = vobject.iCalendar()
-        cal.add("prodid").value = "-//pretalx//{}//{}".format(
-            netloc, talk.submission.code
+        content = get_cached_ical(
+            request.event,
+            f"talk:{code}",
+            slots,
+            prodid=f"-//pretalx//{netloc}//{code}",
         )
-        talk.build_ical(cal)
-        code = talk.submission.code
-        resp = HttpResponse(cal.serialize(), content_type="text/calendar")
+        resp = HttpResponse(content, content_type="text/calendar")
         resp[
             "Content-Disposition"
         ] = f'attachment; filename="{request.event.slug}-{code}.ics"'
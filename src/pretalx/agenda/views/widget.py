@@ -1,94 +1,73 @@
+from contextlib import suppress
+
 from django.conf import settings
-from django.http import Http404, HttpResponse, JsonResponse
+from django.core.files.storage import default_storage
+from django.http import Http404, HttpResponse, HttpResponseRedirect
+from django.utils.cache import patch_cache_control
 from django.views.decorators.cache import cache_page
 from django.views.decorators.http import condition
-from i18nfield.utils import I18nJSONEncoder
 
-from pretalx.agenda.views.schedule import ScheduleView
-from pretalx.common.tasks import generate_widget_css, generate_widget_js
-from pretalx.common.utils import language
+from pretalx.agenda.widget import (
+    get_widget_data,
+    get_widget_data_name,
+    get_widget_locale,
+)
+from pretalx.common.tasks import (
+    generate_widget_css,
+    generate_widget_js,
+    get_widget_js_file,
+)
 
 
 def widget_css_etag(request, **kwargs):
     return request.event.settings.widget_css_checksum
 
 
-def widget_js_etag(request, locale, **kwargs):
-    return request.event.settings.get(f"widget_checksum_{locale}")
-
-
-class WidgetData(ScheduleView):
-    def dispatch(self, request, *args, **kwargs):
-        if not request.user.has_perm("agenda.view_widget", request.event):
-            raise Http404()
-        return super().dispatch(request, *args, **kwargs)
-
-    def get(self, request, *args, **kwargs):
-        locale = request.GET.get("locale", "en")
-        with language(locale):
-            schedule = list(self.get_schedule_data()[0])
-            for day in schedule:
-                for room in day["rooms"]:
-                    room["name"] = str(room["name"])
-                    room["talks"] = [
-                        {
-                            "title": talk.submission.title
-                            if talk.submission
-                            else str(talk.description),
-                            "code": talk.submission.code if talk.submission else None,
-                            "display_speaker_names": talk.submission.display_speaker_names
-                            if talk.submission
-                            else None,
-                            "speakers": [
-                                {"name": speaker.name, "code": speaker.code}
-                                for speaker in talk.submission.speakers.all()
-                            ]
-                            if talk.submission
-                            else None,
-                            "height": talk.height,
-                            "top": talk.top,
-                            "start": talk.start,
-                            "end": talk.end,
-                            "do_not_record": talk.submission.do_not_record
-                            if talk.submission
-                            else None,
-                            "track": getattr(talk.submission.track, "name", "")
-                            if talk.submission
-                            else None,
-                        }
-                        for talk in room["talks"]
-                    ]
-            response = JsonResponse(
-                {
-                    "schedule": schedule,
-                    "event": {
-                        "url": request.event.urls.schedule.full(),
-                        "tracks": [
-                            {"name": track.name, "color": track.color}
-                            for track in request.event.tracks.all()
-                        ],
-                    },
-                },
-                encoder=I18nJSONEncoder,
-            )
-            response["Access-Control-Allow-Origin"] = "*"
-            return response
-
-
-@condition(etag_func=widget_js_etag)
-@cache_page(60)
+def widget_data_etag(request, **kwargs):
+    name = get_widget_data_name(
+        request.event, get_widget_locale(request.GET.get("locale"))
+    )
+    with suppress(FileNotFoundError):
+        # Matches the ETag format of nginx, which may serve the files, too
+        modified = int(default_storage.get_modified_time(name).timestamp())
+        return f"{modified:x}-{default_storage.size(name):x}"
+
+
+def widget_data_last_modified(request, **kwargs):
+    name = get_widget_data_name(
+        request.event, get_widget_locale(request.GET.get("locale"))
+    )
+    with suppress(FileNotFoundError):
+        return default_storage.get_modified_time(name)
+
+
+@condition(etag_func=widget_data_etag, last_modified_func=widget_data_last_modified)
+def widget_data(request, event):
+    """Serves the stored widget data, see :mod:`pretalx.agenda.widget`."""
+    if not request.user.has_perm("agenda.view_widget", request.event):
+        raise Http404()
+    locale = get_widget_locale(request.GET.get("locale"))
+    response = HttpResponse(
+        get_widget_data(request.event, locale), content_type="application/json"
+    )
+    response["Access-Control-Allow-Origin"] = "*"
+    return response
+
+
 def widget_script(request, event, locale):
+    """Redirects to the widget script for the locale, which is the same for
+    all events, and stored under a content-hashed name. Its URL changes only
+    when its content changes, so it can be cached indefinitely."""
     if not request.user.has_perm("agenda.view_widget", request.event):
         raise Http404()
     if locale not in [lc for lc, ll in settings.LANGUAGES]:
         raise Http404()
 
-    existing_file = request.event.settings.get("widget_file_{}".format(locale))
-    if existing_file and not settings.DEBUG:
-        return HttpResponse(existing_file.read(), content_type="text/javascript")
-
-    data = generate_widget_js(request.event, locale, save=not settings.DEBUG)
-    return HttpResponse(data, content_type="text/javascript")
+    if settings.DEBUG:
+        return HttpResponse(generate_widget_js(locale), content_type="text/javascript")
+    response = HttpResponseRedirect(default_storage.url(get_widget_js_file(locale)))
+    patch_cache_control(response, public=True, max_age=300)
+    return response
 
 
 @condition(etag_func=widget_css_etag)
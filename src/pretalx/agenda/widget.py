@@ -0,0 +1,151 @@
+"""The schedule data shown by the widget.
+
+Embedded widgets request their data from pretalx on every page view of
+the embedding site. The data only changes when the schedule or its public
+content changes, so it is stored as JSON files per event and locale, and
+regenerated when the schedule, its rooms or tracks, or the visibility
+settings change. Web servers can serve these files directly, and pretalx
+serves them without building the data again.
+"""
+import datetime as dt
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django_scopes import scope
+
+from pretalx.common.serialize import dumps, serialize_datetime
+from pretalx.common.utils import language
+
+DEFAULT_LOCALE = "en"
+UPDATE_DELAY = 10
+
+
+def get_widget_locale(locale):
+    return locale if locale in dict(settings.LANGUAGES) else DEFAULT_LOCALE
+
+
+def get_widget_data_name(event, locale):
+    return f"widget-data/{event.slug}.{locale}.json"
+
+
+def get_widget_update_key(event):
+    return f"widget_data_update:{event.pk}"
+
+
+def delete_widget_data(event):
+    for locale in dict(settings.LANGUAGES):
+        default_storage.delete(get_widget_data_name(event, locale))
+
+
+def build_widget_data(event, locale) -> bytes:
+    from pretalx.agenda.views.schedule import get_schedule_data
+
+    with language(locale), scope(event=event):
+        schedule = get_schedule_data(event, event.current_schedule)[0]
+        for day in schedule:
+            for key, value in day.items():
+                if isinstance(value, dt.datetime):
+                    day[key] = serialize_datetime(value)
+            for room in day["rooms"]:
+                room["name"] = str(room["name"])
+                room["talks"] = [
+                    {
+                        "title": talk.submission.title
+                        if talk.submission
+                        else str(talk.description),
+                        "code": talk.submission.code if talk.submission else None,
+                        "display_speaker_names": talk.submission.display_speaker_names
+                        if talk.submission
+                        else None,
+                        "speakers": [
+                            {"name": speaker.name, "code": speaker.code}
+                            for speaker in talk.submission.speakers.all()
+                        ]
+                        if talk.submission
+                        else None,
+                        "height": talk.height,
+                        "top": talk.top,
+                        "start": serialize_datetime(talk.start),
+                        "end": serialize_datetime(talk.end),
+                        "do_not_record": talk.submission.do_not_record
+                        if talk.submission
+                        else None,
+                        "track": str(getattr(talk.submission.track, "name", ""))
+                        if talk.submission
+                        else None,
+                    }
+                    for talk in room["talks"]
+                ]
+        return dumps(
+            {
+                "schedule": schedule,
+                "event": {
+                    "url": event.urls.schedule.full(),
+                    "tracks": [
+                        {"name": str(track.name), "color": track.color}
+                        for track in event.tracks.all()
+                    ],
+                },
+            }
+        )
+
+
+def store_widget_data(event, locales=None):
+    """Builds and stores the widget data of the event for the given locales
+    (by default the event's locales and the default locale), and returns
+    the data of the last locale.
+
+    Files are only replaced when their content changes, so that their
+    modification time can be used for caching. If the widget is not public,
+    all files of the event are removed instead."""
+    if not AnonymousUser().has_perm("agenda.view_widget", event):
+        delete_widget_data(event)
+        return None
+    content = None
+    for locale in locales or {DEFAULT_LOCALE, *event.locales}:
+        name = get_widget_data_name(event, locale)
+        content = build_widget_data(event, locale)
+        if default_storage.exists(name):
+            with default_storage.open(name) as existing:
+                if existing.read() == content:
+                    continue
+            default_storage.delete(name)
+        default_storage.save(name, ContentFile(content))
+    return content
+
+
+def get_widget_data(event, locale):
+    """Returns the stored widget data, building it if necessary."""
+    name = get_widget_data_name(event, locale)
+    if default_storage.exists(name):
+        with default_storage.open(name) as stored:
+            return stored.read()
+    return store_widget_data(event, locales=[locale]) or build_widget_data(
+        event, locale
+    )
+
+
+def update_widget_data(event):
+    """Updates the stored widget data of the event once the current
+    transaction has been committed.
+
+    With Celery, the data is regenerated in a background task that starts
+    after ``UPDATE_DELAY`` seconds, and all changes until then are handled
+    by the same task. Saving a settings form, for example, saves every
+    setting separately. Without Celery, the stored files are removed and
+    regenerated on the next request."""
+    from pretalx.agenda.tasks import regenerate_widget_data
+
+    def update():
+        if not settings.HAS_CELERY:
+            delete_widget_data(event)
+        elif cache.add(get_widget_update_key(event), True, UPDATE_DELAY * 30):
+            regenerate_widget_data.apply_async(
+                kwargs={"event_id": event.pk}, countdown=UPDATE_DELAY
+            )
+
+    transaction.on_commit(update)
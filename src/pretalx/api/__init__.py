@@ -4,5 +4,8 @@ from django.apps import AppConfig
 class APIConfig(AppConfig):
     name = "pretalx.api"
 
+    def ready(self):
+        from . import signals  # noqa
+
 
 default_app_config = "pretalx.api.APIConfig"
@@ -0,0 +1,94 @@
+import hashlib
+import json
+
+from django.db import transaction
+from django.utils.http import parse_etags, quote_etag
+from django.utils.translation import get_language
+from rest_framework import status
+from rest_framework.response import Response
+
+from pretalx.common.cache import NamespacedCache
+from pretalx.common.serialize import dumps
+
+
+def get_public_api_cache(event) -> NamespacedCache:
+    """Returns the namespaced cache holding public API responses for an
+    event.
+
+    Clearing it bumps the namespace version, so all cached responses of
+    the event become unreachable at once, across all processes.
+    """
+    return NamespacedCache(prefixkey=f"api:{event.slug}")
+
+
+def invalidate_public_api_cache(event):
+    """Drops all cached public API responses of the event once the current
+    transaction has been committed, so that concurrent requests cannot
+    re-populate the cache with stale data."""
+    if event is None:
+        return
+    transaction.on_commit(lambda: get_public_api_cache(event).clear())
+
+
+class PublicResponseCacheMixin:
+    """Caches the responses of read-only viewsets for anonymous requests.
+
+    Responses are cached per event, current schedule, path, query string,
+    serializer class and language, and carry an ``ETag`` header.
+    Clients sending a matching ``If-None-Match`` header receive a ``304``
+    response. Authenticated requests are never cached, as their results
+    depend on the user's permissions.
+    """
+
+    public_cache_timeout = 3600
+
+    def list(self, request, *args, **kwargs):
+        return self.get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_public_cache_key(self, request) -> str:
+        event = request.event
+        serializer_class = self.get_serializer_class()
+        return ":".join(
+            str(part)
+            for part in (
+                request.path,
+                request._request.META.get("QUERY_STRING", ""),
+                f"{serializer_class.__module__}.{serializer_class.__qualname__}",
+                getattr(event.current_schedule, "pk", None),
+                event.is_public,
+                event.settings_snapshot.show_schedule,
+                get_language(),
+            )
+        )
+
+    def get_cached_response(self, method, request, *args, **kwargs):
+        if not request.user.is_anonymous or not getattr(request, "event", None):
+            return method(request, *args, **kwargs)
+
+        cache = get_public_api_cache(request.event)
+        key = self.get_public_cache_key(request)
+        cached = cache.get(key)
+        if cached is None:
+            response = method(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            content = dumps(response.data)
+            cached = {
+                "data": json.loads(content),
+                "etag": hashlib.sha1(content).hexdigest(),
+            }
+            cache.set(key, cached, self.public_cache_timeout)
+
+        etag = quote_etag(cached["etag"])
+        if_none_match = request._request.META.get("HTTP_IF_NONE_MATCH")
+        if if_none_match and (
+            etag in parse_etags(if_none_match) or if_none_match.strip() == "*"
+        ):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(cached["data"])
+        response["ETag"] = etag
+        return response
@@ -0,0 +1,22 @@
+from rest_framework.pagination import CursorPagination
+
+
+class OptionalCursorPagination(CursorPagination):
+    """Cursor based pagination that is only applied when the client asks for
+    it by passing a ``cursor`` or ``page_size`` query parameter, so that
+    endpoints that used to return plain lists keep doing so."""
+
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if (
+            self.cursor_query_param not in request.query_params
+            and self.page_size_query_param not in request.query_params
+        ):
+            return None
+        return super().paginate_queryset(queryset, request, view=view)
+
+
+class EventPagination(OptionalCursorPagination):
+    ordering = ("date_from", "pk")
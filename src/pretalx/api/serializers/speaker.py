@@ -1,5 +1,6 @@
 from rest_framework.serializers import (
     CharField,
+    Field,
     ImageField,
     ModelSerializer,
     SerializerMethodField,
@@ -7,13 +8,32 @@ from rest_framework.serializers import (
 
 from pretalx.api.serializers.question import AnswerSerializer
 from pretalx.api.serializers.room import AvailabilitySerializer
+from pretalx.common.images import get_thumbnail_urls
 from pretalx.person.models import SpeakerProfile, User
 from pretalx.schedule.models import Availability
 from pretalx.submission.models import Answer
 
 
+class ThumbnailsField(Field):
+    """Serializes the thumbnail URLs of an image by size and format."""
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        urls = get_thumbnail_urls(value)
+        request = self.context.get("request")
+        if urls and request:
+            for formats in urls.values():
+                for extension, url in formats.items():
+                    formats[extension] = request.build_absolute_uri(url)
+        return urls
+
+
 class SubmitterSerializer(ModelSerializer):
     biography = SerializerMethodField()
+    avatar_thumbnails = ThumbnailsField(source="avatar")
 
     def get_biography(self, obj):
         if self.context.get("request") and self.context["request"].event:
@@ -26,13 +46,14 @@ class SubmitterSerializer(ModelSerializer):
 
     class Meta:
         model = User
-        fields = ("code", "name", "biography", "avatar")
+        fields = ("code", "name", "biography", "avatar", "avatar_thumbnails")
 
 
 class SpeakerSerializer(ModelSerializer):
     code = CharField(source="user.code")
     name = CharField(source="user.name")
     avatar = ImageField(source="user.avatar")
+    avatar_thumbnails = ThumbnailsField(source="user.avatar")
     submissions = SerializerMethodField()
 
     @staticmethod
@@ -46,7 +67,14 @@ class SpeakerSerializer(ModelSerializer):
 
     class Meta:
         model = SpeakerProfile
-        fields = ("code", "name", "biography", "submissions", "avatar")
+        fields = (
+            "code",
+            "name",
+            "biography",
+            "submissions",
+            "avatar",
+            "avatar_thumbnails",
+        )
 
 
 class SpeakerOrgaSerializer(SpeakerSerializer):
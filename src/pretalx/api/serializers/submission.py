@@ -7,7 +7,7 @@ from rest_framework.serializers import (
 )
 
 from pretalx.api.serializers.question import AnswerSerializer
-from pretalx.api.serializers.speaker import SubmitterSerializer
+from pretalx.api.serializers.speaker import SubmitterSerializer, ThumbnailsField
 from pretalx.schedule.models import Schedule, TalkSlot
 from pretalx.submission.models import Resource, Submission, SubmissionStates
 
@@ -49,6 +49,7 @@ class SubmissionSerializer(I18nAwareModelSerializer):
     duration = SerializerMethodField()
     speakers = SerializerMethodField()
     resources = ResourceSerializer(Resource.objects.none(), read_only=True, many=True)
+    image_thumbnails = ThumbnailsField(source="image")
 
     @staticmethod
     def get_duration(obj):
@@ -87,6 +88,7 @@ class SubmissionSerializer(I18nAwareModelSerializer):
             "content_locale",
             "slot",
             "image",
+            "image_thumbnails",
             "resources",
         ]
 
@@ -0,0 +1,68 @@
+from django.db.models import signals
+from django.dispatch import receiver
+from django_scopes import scopes_disabled
+
+from pretalx.api.mixins import invalidate_public_api_cache
+from pretalx.event.models import Event
+from pretalx.event.models.event import Event_SettingsStore
+from pretalx.person.models import SpeakerProfile, User
+from pretalx.schedule.models import Room, TalkSlot
+from pretalx.submission.models import Resource, Submission, SubmissionType, Track
+from pretalx.submission.signals import submission_state_change_bulk
+
+
+@receiver(signals.post_save, sender=Event, dispatch_uid="api_cache_event_save")
+@receiver(signals.post_save, sender=Room, dispatch_uid="api_cache_room_save")
+@receiver(signals.post_delete, sender=Room, dispatch_uid="api_cache_room_delete")
+@receiver(
+    signals.post_save, sender=SpeakerProfile, dispatch_uid="api_cache_profile_save"
+)
+@receiver(
+    signals.post_save, sender=Submission, dispatch_uid="api_cache_submission_save"
+)
+@receiver(signals.post_save, sender=SubmissionType, dispatch_uid="api_cache_type_save")
+@receiver(signals.post_save, sender=Track, dispatch_uid="api_cache_track_save")
+@receiver(signals.post_delete, sender=Track, dispatch_uid="api_cache_track_delete")
+def invalidate_api_cache_for_event_object(sender, instance, **kwargs):
+    invalidate_public_api_cache(instance.event)
+
+
+@receiver(signals.post_save, sender=TalkSlot, dispatch_uid="api_cache_slot_save")
+@receiver(signals.post_delete, sender=TalkSlot, dispatch_uid="api_cache_slot_delete")
+def invalidate_api_cache_for_slot(sender, instance, **kwargs):
+    if instance.schedule.version:  # WIP slots are never shown publicly
+        invalidate_public_api_cache(instance.schedule.event)
+
+
+@receiver(signals.post_save, sender=Resource, dispatch_uid="api_cache_resource_save")
+@receiver(
+    signals.post_delete, sender=Resource, dispatch_uid="api_cache_resource_delete"
+)
+def invalidate_api_cache_for_resource(sender, instance, **kwargs):
+    invalidate_public_api_cache(instance.submission.event)
+
+
+@receiver(
+    signals.post_save, sender=Event_SettingsStore, dispatch_uid="api_cache_settings"
+)
+@receiver(
+    signals.post_delete,
+    sender=Event_SettingsStore,
+    dispatch_uid="api_cache_settings_del",
+)
+def invalidate_api_cache_for_settings(sender, instance, **kwargs):
+    invalidate_public_api_cache(instance.object)
+
+
+@receiver(submission_state_change_bulk, dispatch_uid="api_cache_submission_states")
+def invalidate_api_cache_for_submission_states(sender, **kwargs):
+    invalidate_public_api_cache(sender)
+
+
+@receiver(signals.post_save, sender=User, dispatch_uid="api_cache_user_save")
+def invalidate_api_cache_for_user(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= {"last_login", "pw_reset_token"}:
+        return
+    with scopes_disabled():
+        for profile in instance.profiles.all().select_related("event"):
+            invalidate_public_api_cache(profile.event)
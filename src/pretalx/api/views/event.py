@@ -1,6 +1,8 @@
+from django.db import models
 from django.http import Http404
 from rest_framework import viewsets
 
+from pretalx.api.pagination import EventPagination
 from pretalx.api.serializers.event import EventSerializer
 from pretalx.event.models import Event
 
@@ -10,15 +12,28 @@ class EventViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Event.objects.none()
     lookup_field = "slug"
     lookup_url_kwarg = "event"
-    pagination_class = None
+    pagination_class = EventPagination
     permission_required = "cfp.view_event"
 
     def get_queryset(self):
-        return [
-            e
-            for e in Event.objects.all()
-            if self.request.user.has_perm(self.permission_required, e)
-        ]
+        """Mirrors the ``cfp.view_event`` permission in a single query: public
+        events, plus events the user can change submissions in or review."""
+        user = self.request.user
+        if user.is_anonymous:
+            return Event.objects.filter(is_public=True)
+        if user.is_administrator:
+            return Event.objects.all()
+        return Event.objects.filter(
+            models.Q(is_public=True)
+            | models.Q(
+                pk__in=user.get_events_for_permission(
+                    can_change_submissions=True
+                ).values("pk")
+            )
+            | models.Q(
+                pk__in=user.get_events_for_permission(is_reviewer=True).values("pk")
+            )
+        )
 
     def get_object(self):
         if self.request.user.has_perm(self.permission_required, self.request.event):
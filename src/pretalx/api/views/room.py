@@ -1,10 +1,11 @@
 from rest_framework import viewsets
 
+from pretalx.api.mixins import PublicResponseCacheMixin
 from pretalx.api.serializers.room import RoomOrgaSerializer, RoomSerializer
 from pretalx.schedule.models import Room
 
 
-class RoomViewSet(viewsets.ReadOnlyModelViewSet):
+class RoomViewSet(PublicResponseCacheMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Room.objects.none()
 
     def get_queryset(self):
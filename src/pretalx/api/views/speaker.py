@@ -1,10 +1,11 @@
 from rest_framework import viewsets
 
+from pretalx.api.mixins import PublicResponseCacheMixin
 from pretalx.api.serializers.speaker import SpeakerOrgaSerializer, SpeakerSerializer
 from pretalx.person.models import SpeakerProfile
 
 
-class SpeakerViewSet(viewsets.ReadOnlyModelViewSet):
+class SpeakerViewSet(PublicResponseCacheMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = SpeakerSerializer
     queryset = SpeakerProfile.objects.none()
     lookup_field = "user__code__iexact"
@@ -23,7 +24,7 @@ class SpeakerViewSet(viewsets.ReadOnlyModelViewSet):
             )
         if (
             self.request.event.current_schedule
-            and self.request.event.settings.show_schedule
+            and self.request.event.settings_snapshot.show_schedule
         ):
             return SpeakerProfile.objects.filter(
                 user__submissions__slots__in=self.request.event.current_schedule.talks.all()
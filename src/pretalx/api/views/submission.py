@@ -1,5 +1,6 @@
 from rest_framework import viewsets
 
+from pretalx.api.mixins import PublicResponseCacheMixin
 from pretalx.api.serializers.submission import (
     ScheduleListSerializer,
     ScheduleSerializer,
@@ -10,7 +11,7 @@ from pretalx.schedule.models import Schedule
 from pretalx.submission.models import Submission
 
 
-class SubmissionViewSet(viewsets.ReadOnlyModelViewSet):
+class SubmissionViewSet(PublicResponseCacheMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = SubmissionSerializer
     queryset = Submission.objects.none()
     lookup_field = "code__iexact"
@@ -43,7 +44,7 @@ class SubmissionViewSet(viewsets.ReadOnlyModelViewSet):
         return SubmissionSerializer
 
 
-class ScheduleViewSet(viewsets.ReadOnlyModelViewSet):
+class ScheduleViewSet(PublicResponseCacheMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = ScheduleSerializer
     queryset = Schedule.objects.none()
     lookup_field = "version__iexact"
@@ -59,7 +60,7 @@ class ScheduleViewSet(viewsets.ReadOnlyModelViewSet):
         except Exception:
             is_public = (
                 self.request.event.is_public
-                and self.request.event.settings.show_schedule
+                and self.request.event.settings_snapshot.show_schedule
             )
             has_perm = self.request.user.has_perm(
                 "orga.edit_schedule", self.request.event
@@ -78,7 +79,8 @@ class ScheduleViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         qs = self.queryset
         is_public = (
-            self.request.event.is_public and self.request.event.settings.show_schedule
+            self.request.event.is_public
+            and self.request.event.settings_snapshot.show_schedule
         )
         current_schedule = (
             self.request.event.current_schedule.pk
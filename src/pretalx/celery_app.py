@@ -1,6 +1,6 @@
 import os
 
-from celery import Celery
+from celery import Celery, signals
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pretalx.settings")
 
@@ -9,3 +9,31 @@ from django.conf import settings  # noqa
 app = Celery("pretalx")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks(lambda: settings.INSTALLED_APPS)
+
+
+@signals.task_prerun.connect
+def start_task_log_buffer(**kwargs):
+    from pretalx.common.mixins.models import start_log_buffer
+
+    start_log_buffer()
+
+
+@signals.task_postrun.connect
+def flush_task_log_buffer(**kwargs):
+    from pretalx.common.mixins.models import flush_log_buffer
+
+    flush_log_buffer()
+
+
+@signals.task_prerun.connect
+def start_task_metrics(**kwargs):
+    from pretalx.common.metrics import start_collecting
+
+    start_collecting()
+
+
+@signals.task_postrun.connect
+def stop_task_metrics(task=None, **kwargs):
+    from pretalx.common.metrics import stop_collecting
+
+    stop_collecting("task", task.name if task else "unknown")
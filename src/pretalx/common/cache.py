@@ -5,6 +5,8 @@ from typing import Callable, Dict, List
 from django.core.cache import caches
 from django.db.models import Model
 
+from pretalx.common.metrics import record_cache_access
+
 
 class NamespacedCache:
     def __init__(self, prefixkey: str, cache: str = "default"):
@@ -44,7 +46,9 @@ class NamespacedCache:
         return self.cache.set(self._prefix_key(key), value, timeout)
 
     def get(self, key: str) -> str:
-        return self.cache.get(self._prefix_key(key, known_prefix=self._last_prefix))
+        value = self.cache.get(self._prefix_key(key, known_prefix=self._last_prefix))
+        record_cache_access(hit=value is not None)
+        return value
 
     def get_or_set(self, key: str, default: Callable, timeout=300) -> str:
         return self.cache.get_or_set(
@@ -1,5 +1,5 @@
 from io import StringIO
-from typing import Tuple
+from typing import Dict, Iterator, Optional, Tuple
 from urllib.parse import quote
 from xml.etree import ElementTree as ET
 
@@ -8,8 +8,11 @@ import qrcode.image.svg
 from defusedcsv import csv
 from django.utils.functional import cached_property
 from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+from django_scopes import scope
 
-from pretalx.common.urls import EventUrls
+from pretalx.common.urls import EventUrlBuilder, EventUrls
+from pretalx.common.utils import language
 
 
 class BaseExporter:
@@ -44,6 +47,12 @@ class BaseExporter:
     def quoted_identifier(self) -> str:
         return quote(self.identifier)
 
+    @cached_property
+    def url_builder(self) -> EventUrlBuilder:
+        """Use this to build the URLs of many objects, e.g. all talks of the
+        event, instead of calling ``.urls.….full()`` on each of them."""
+        return EventUrlBuilder(self.event)
+
     @property
     def public(self) -> bool:
         """Return True if the exported data should be publicly available once
@@ -86,11 +95,73 @@ class BaseExporter:
 
 
 class CSVExporterMixin:
+    """Renders the field names and rows returned by ``get_data`` as CSV.
+
+    The rows may be any iterable of dicts, including a generator. Views
+    use ``render_stream`` to send the file while the rows are loaded, so
+    exporters should load their rows in a fixed number of queries and use
+    ``.iterator()`` for large querysets.
+    """
+
+    chunk_size = 500
+
+    def iter_csv(self, **kwargs) -> Iterator[str]:
+        """Yields the CSV file in chunks of ``chunk_size`` rows. The data is
+        loaded in the event's scope and in the language that was active
+        when the generator was created, as the response may be consumed
+        after the view has returned."""
+        active_language = get_language()
+
+        def generate():
+            with scope(event=self.event), language(active_language):
+                fieldnames, data = self.get_data(**kwargs)
+                output = StringIO()
+                writer = csv.DictWriter(output, fieldnames=fieldnames)
+                writer.writeheader()
+                for count, row in enumerate(data, start=1):
+                    writer.writerow(row)
+                    if not count % self.chunk_size:
+                        yield output.getvalue()
+                        output.seek(0)
+                        output.truncate()
+                yield output.getvalue()
+
+        return generate()
+
+    def render_stream(self, **kwargs) -> Tuple[str, str, Iterator[str]]:
+        return self.filename, "text/plain", self.iter_csv(**kwargs)
+
     def render(self, **kwargs):
-        fieldnames, data = self.get_data()
-        output = StringIO()
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
-        content = output.getvalue()
-        return self.filename, "text/plain", content
+        return self.filename, "text/plain", "".join(self.iter_csv(**kwargs))
+
+
+_exporter_registry = {}
+
+
+def get_exporters(event) -> Dict[str, type]:
+    """Returns the exporter classes available to an event, by identifier.
+
+    The registry is built from the ``register_data_exporters`` signal once
+    per set of active plugins (and connected receivers), and is shared by
+    all events with the same plugins.
+    """
+    from pretalx.common.signals import register_data_exporters
+
+    key = (
+        event.plugins or "",
+        tuple(lookup_key for lookup_key, __ in register_data_exporters.receivers),
+    )
+    registry = _exporter_registry.get(key)
+    if registry is None:
+        registry = {}
+        for __, exporter in register_data_exporters.send(event):
+            registry.setdefault(exporter(event).identifier, exporter)
+        _exporter_registry[key] = registry
+    return registry
+
+
+def get_exporter(event, identifier) -> Optional[BaseExporter]:
+    """Returns an instance of the exporter with the given identifier, or
+    ``None`` if the event has no such exporter."""
+    exporter = get_exporters(event).get(identifier)
+    return exporter(event) if exporter else None
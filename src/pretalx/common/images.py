@@ -0,0 +1,113 @@
+"""Thumbnails of uploaded images.
+
+Speaker avatars and talk images are uploaded in all sizes, often straight
+from a camera. For every upload, we generate resized and recompressed
+variants in :data:`THUMBNAIL_SIZES`, once as WebP and once in a fallback
+format (JPEG, or PNG for images with transparency).
+
+Thumbnails are stored by the checksum of the original image, so identical
+uploads share their thumbnails, and existing thumbnails never need to be
+regenerated or deleted. The checksum and the fallback format are stored
+on the model in ``<field>_thumbnails`` (see
+:class:`pretalx.common.mixins.models.ThumbnailMixin`). As long as it is not
+set, the original image is used instead.
+"""
+import hashlib
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+THUMBNAIL_SIZES = (64, 160, 480)
+THUMBNAIL_QUALITY = 80
+FALLBACK_FORMATS = {"jpg": "JPEG", "png": "PNG"}
+
+
+def get_thumbnail_name(key, size, webp=False):
+    checksum, extension = key.split(".")
+    extension = "webp" if webp else extension
+    return f"thumbnails/{checksum[:2]}/{checksum}/{size}.{extension}"
+
+
+def get_thumbnail_size(size):
+    """Returns the smallest thumbnail size that is at least as large as the
+    requested size."""
+    for thumbnail_size in THUMBNAIL_SIZES:
+        if thumbnail_size >= int(size):
+            return thumbnail_size
+    return THUMBNAIL_SIZES[-1]
+
+
+def has_transparency(image):
+    return image.mode in ("RGBA", "LA") or (
+        image.mode == "P" and "transparency" in image.info
+    )
+
+
+def create_thumbnails(image_file):
+    """Generates all thumbnails of an image file (e.g. a ``FieldFile``), and
+    returns the key to find them with."""
+    image_file.open("rb")
+    try:
+        content = image_file.read()
+    finally:
+        image_file.close()
+    image = Image.open(BytesIO(content))
+    image = ImageOps.exif_transpose(image)
+    extension = "png" if has_transparency(image) else "jpg"
+    image = image.convert("RGBA" if extension == "png" else "RGB")
+    key = f"{hashlib.sha1(content).hexdigest()}.{extension}"
+
+    for size in THUMBNAIL_SIZES:
+        thumbnail = None
+        for webp, image_format in (
+            (True, "WEBP"),
+            (False, FALLBACK_FORMATS[extension]),
+        ):
+            name = get_thumbnail_name(key, size, webp=webp)
+            if default_storage.exists(name):
+                continue
+            if thumbnail is None:
+                thumbnail = image.copy()
+                thumbnail.thumbnail((size, size), Image.LANCZOS)
+            buffer = BytesIO()
+            thumbnail.save(
+                buffer, format=image_format, quality=THUMBNAIL_QUALITY, optimize=True
+            )
+            default_storage.save(name, ContentFile(buffer.getvalue()))
+    return key
+
+
+def get_thumbnail_key(image_file):
+    return getattr(image_file.instance, f"{image_file.field.name}_thumbnails", None)
+
+
+def get_thumbnail_url(image_file, size, webp=False):
+    """Returns the URL of the thumbnail of an image file that fits the
+    requested size, or the URL of the image itself if there are no
+    thumbnails yet."""
+    key = get_thumbnail_key(image_file)
+    if not key:
+        return image_file.url
+    return default_storage.url(
+        get_thumbnail_name(key, get_thumbnail_size(size), webp=webp)
+    )
+
+
+def get_thumbnail_urls(image_file):
+    """Returns the URLs of all thumbnails of an image file by size and
+    format, or ``None`` if there are no thumbnails (yet)."""
+    key = image_file and get_thumbnail_key(image_file)
+    if not key:
+        return None
+    fallback = key.split(".")[-1]
+    return {
+        str(size): {
+            extension: default_storage.url(
+                get_thumbnail_name(key, size, webp=extension == "webp")
+            )
+            for extension in ("webp", fallback)
+        }
+        for size in THUMBNAIL_SIZES
+    }
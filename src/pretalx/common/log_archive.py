@@ -0,0 +1,116 @@
+"""Moves old activity log entries out of the database.
+
+Log entries are written all the time, but hardly ever read once an event
+is over. Archived entries are stored per event as gzipped JSON lines
+files, one file per batch, and can be read back as (unsaved)
+:class:`~pretalx.common.models.ActivityLog` instances when needed.
+"""
+
+import gzip
+import json
+import shutil
+
+from dateutil.parser import parse
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django_scopes import scopes_disabled
+
+ARCHIVE_SUFFIX = ".jsonl.gz"
+
+
+def get_archive_path(event):
+    return settings.LOG_ARCHIVE_ROOT / event.slug
+
+
+def _serialize_entry(entry, content_types):
+    return {
+        "id": entry.pk,
+        "event_id": entry.event_id,
+        "person_id": entry.person_id,
+        "content_type": content_types[entry.content_type_id],
+        "object_id": entry.object_id,
+        "timestamp": entry.timestamp.isoformat(),
+        "action_type": entry.action_type,
+        "data": entry.data,
+        "is_orga_action": entry.is_orga_action,
+    }
+
+
+def archive_log_entries(event, before, batch_size=1000) -> int:
+    """Moves all log entries of the event older than ``before`` to the log
+    archive and returns the number of archived entries.
+
+    Entries are written and deleted in batches of ``batch_size``, so
+    that a failure leaves every entry either in the archive or in the
+    database.
+    """
+    from pretalx.common.models import ActivityLog
+
+    path = get_archive_path(event)
+    path.mkdir(parents=True, exist_ok=True)
+    content_types = {
+        content_type.pk: f"{content_type.app_label}.{content_type.model}"
+        for content_type in ContentType.objects.all()
+    }
+    count = 0
+    with scopes_disabled():
+        queryset = ActivityLog.objects.filter(
+            event=event, timestamp__lt=before
+        ).order_by("pk")
+        while True:
+            batch = list(queryset[:batch_size])
+            if not batch:
+                break
+            filename = path / f"{batch[0].pk:010d}-{batch[-1].pk:010d}{ARCHIVE_SUFFIX}"
+            with transaction.atomic():
+                with gzip.open(filename, "wt", encoding="utf-8") as archive:
+                    for entry in batch:
+                        archive.write(
+                            json.dumps(_serialize_entry(entry, content_types)) + "\n"
+                        )
+                ActivityLog.objects.filter(
+                    pk__in=[entry.pk for entry in batch]
+                ).delete()
+            count += len(batch)
+    return count
+
+
+def read_archived_log_entries(event, content_object=None, newest_first=False):
+    """Yields the archived log entries of an event as unsaved
+    :class:`~pretalx.common.models.ActivityLog` instances, oldest first, or
+    newest first if ``newest_first`` is set.
+
+    If ``content_object`` is given, only the entries about this object are
+    returned. As the whole archive of the event has to be read in this case,
+    it should only be used for pages that are not requested often."""
+    from pretalx.common.models import ActivityLog
+
+    path = get_archive_path(event)
+    if not path.exists():
+        return
+    wanted = None
+    if content_object is not None:
+        meta = content_object._meta
+        wanted = (f"{meta.app_label}.{meta.model_name}", content_object.pk)
+    content_types = {}
+    for filename in sorted(path.glob(f"*{ARCHIVE_SUFFIX}"), reverse=newest_first):
+        with gzip.open(filename, "rt", encoding="utf-8") as archive:
+            lines = archive.readlines()
+        for line in reversed(lines) if newest_first else lines:
+            row = json.loads(line)
+            if wanted and (row["content_type"], row["object_id"]) != wanted:
+                continue
+            content_type = row.pop("content_type")
+            if content_type not in content_types:
+                app_label, model = content_type.split(".", 1)
+                content_types[content_type] = ContentType.objects.get_by_natural_key(
+                    app_label, model
+                )
+            row["content_type"] = content_types[content_type]
+            row["timestamp"] = parse(row["timestamp"])
+            yield ActivityLog(**row)
+
+
+def delete_log_archive(event):
+    shutil.rmtree(get_archive_path(event), ignore_errors=True)
@@ -0,0 +1,51 @@
+import datetime as dt
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.timezone import now
+from django_scopes import scopes_disabled
+
+from pretalx.common.log_archive import archive_log_entries
+from pretalx.event.models import Event
+
+
+class Command(BaseCommand):
+    help = "Move old activity log entries to the log archive"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="Archive log entries older than this many days. The default is 365.",
+        )
+        parser.add_argument(
+            "--event",
+            type=str,
+            help="Only archive the log entries of the event with this slug.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            dest="batch_size",
+            help="Number of log entries to move at a time. The default is 1000.",
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] < 0 or options["batch_size"] < 1:
+            raise CommandError("Please provide a positive number of days and entries.")
+        before = now() - dt.timedelta(days=options["days"])
+        with scopes_disabled():
+            events = Event.objects.all().order_by("pk")
+            if options["event"]:
+                events = events.filter(slug__iexact=options["event"])
+                if not events:
+                    raise CommandError(f'Could not find event "{options["event"]}".')
+            for event in events:
+                count = archive_log_entries(
+                    event, before=before, batch_size=options["batch_size"]
+                )
+                if count:
+                    self.stdout.write(
+                        f"Archived {count} log entries of the event {event.slug}."
+                    )
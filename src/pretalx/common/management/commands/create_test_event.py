@@ -1,18 +1,30 @@
 import datetime as dt
 import random
 import re
+from collections import defaultdict
+from statistics import mean
 
-from django.core.management.base import BaseCommand
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from django.utils.timezone import now
 from django_scopes import scope, scopes_disabled
 
+from pretalx.common.models import ActivityLog
 from pretalx.common.tasks import regenerate_css
 from pretalx.event.models import Event, Team
 from pretalx.event.utils import create_organiser_with_team
 from pretalx.person.models import SpeakerProfile, User
-from pretalx.schedule.models import Room
-from pretalx.submission.models import Review, Submission, SubmissionType, Track
+from pretalx.schedule.models import Availability, Room, TalkSlot
+from pretalx.submission.models import (
+    Review,
+    Submission,
+    SubmissionStates,
+    SubmissionType,
+    Track,
+)
+
+BATCH_SIZE = 500
 
 
 class Command(BaseCommand):
@@ -31,6 +43,12 @@ class Command(BaseCommand):
             default="",
             help="Seed the random generator with a number for stable results",
         )
+        parser.add_argument(
+            "--scale",
+            type=int,
+            default=1,
+            help="Build a large event with 100 submissions, 50 speakers, 100 reviews per scale step, and a room per two steps, with at least two rooms. Data is inserted in bulk, and the schedule is released three times. The default is 1, a normal sized event.",
+        )
 
     def build_event(self, end_stage):
         administrators = User.objects.filter(is_administrator=True)
@@ -325,6 +343,221 @@ If you have any interest in {self.fake.catch_phrase().lower()}, {self.fake.catch
             current_time += dt.timedelta(hours=16, minutes=30)
         self.event.wip_schedule.freeze("v1.0")
 
+    def bulk_create(self, model, objects):
+        """Inserts the objects in batches and returns them with primary keys,
+        as not all databases return them on bulk inserts."""
+        with scopes_disabled():
+            manager = model._base_manager
+            last_pk = manager.order_by("-pk").values_list("pk", flat=True).first()
+            manager.bulk_create(objects, batch_size=BATCH_SIZE)
+            return list(manager.filter(pk__gt=last_pk or 0).order_by("pk"))
+
+    def generate_codes(self, model, count):
+        with scopes_disabled():
+            codes = set(model._base_manager.values_list("code", flat=True))
+        generator = model()
+        new_codes = []
+        while len(new_codes) < count:
+            code = generator.generate_code()
+            if code not in codes:
+                codes.add(code)
+                new_codes.append(code)
+        return new_codes
+
+    def build_users(self, count, prefix):
+        return self.bulk_create(
+            User,
+            [
+                User(
+                    name=self.fake.name(),
+                    email=f"{prefix}-{index}-{self.fake.user_name()}@example.org",
+                    code=code,
+                    password="!",  # Unusable, and much faster than hashing
+                    locale="en",
+                    timezone="Europe/Berlin",
+                )
+                for index, code in enumerate(self.generate_codes(User, count))
+            ],
+        )
+
+    def build_cfp_stage_at_scale(self):
+        """Builds 100 submissions per scale step, by 50 speakers, and some
+        co-speakers, with bulk inserts."""
+        for _ in range(max(self.scale // 2 - self.event.rooms.count(), 0)):
+            self.build_room()
+        speakers = self.build_users(50 * self.scale, "speaker")
+        profiles = self.bulk_create(
+            SpeakerProfile,
+            [
+                SpeakerProfile(
+                    user=speaker, event=self.event, biography=self.fake.text()
+                )
+                for speaker in speakers
+            ],
+        )
+        self.bulk_create(
+            Availability,
+            [
+                Availability(
+                    event=self.event,
+                    person=profile,
+                    start=self.event.datetime_from
+                    + dt.timedelta(days=random.randint(0, 1), hours=8),
+                    end=self.event.datetime_to - dt.timedelta(hours=4),
+                )
+                for profile in profiles
+            ]
+            + [
+                Availability(
+                    event=self.event,
+                    room=room,
+                    start=self.event.datetime_from,
+                    end=self.event.datetime_to,
+                )
+                for room in self.event.rooms.all()
+            ],
+        )
+
+        talk = self.event.submission_types.get(name__iexact="talk")
+        workshop = self.event.submission_types.get(name__iexact="workshop")
+        tracks = list(self.event.tracks.all())
+        count = 100 * self.scale
+        submissions = self.bulk_create(
+            Submission,
+            [
+                Submission(
+                    event=self.event,
+                    code=code,
+                    title=self.fake.catch_phrase(),
+                    submission_type=talk if random.random() < 0.75 else workshop,
+                    track=random.choice(tracks),
+                    abstract=self.fake.bs().capitalize() + "!",
+                    description=self.fake.text(),
+                    content_locale="en",
+                    do_not_record=random.random() < 0.1,
+                )
+                for code in self.generate_codes(Submission, count)
+            ],
+        )
+        submission_speakers = []
+        for index, submission in enumerate(submissions):
+            speaker_ids = {speakers[index % len(speakers)].pk}
+            if random.random() < 0.1:
+                speaker_ids.add(random.choice(speakers).pk)
+            submission_speakers += [
+                Submission.speakers.through(submission=submission, user_id=speaker_id)
+                for speaker_id in speaker_ids
+            ]
+        Submission.speakers.through.objects.bulk_create(
+            submission_speakers, batch_size=BATCH_SIZE
+        )
+        content_type = ContentType.objects.get_for_model(Submission)
+        ActivityLog.objects.bulk_create(
+            [
+                ActivityLog(
+                    event=self.event,
+                    person_id=speakers[index % len(speakers)].pk,
+                    content_type=content_type,
+                    object_id=submission.pk,
+                    action_type="pretalx.submission.create",
+                )
+                for index, submission in enumerate(submissions)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+    def build_review_stage_at_scale(self):
+        """Builds ten reviews per submission, by a reviewer team of at least
+        ten reviewers, and accepts the best rated 40% of all submissions."""
+        reviewers = self.build_users(max(10, self.scale), "reviewer")
+        team = Team.objects.create(
+            organiser=self.event.organiser, name="DemoCon Reviewers", is_reviewer=True
+        )
+        team.limit_events.add(self.event)
+        team.members.add(*reviewers)
+
+        submission_ids = list(
+            self.event.submissions.order_by("pk").values_list("pk", flat=True)
+        )
+        scores = defaultdict(list)
+        reviews = []
+        for submission_id in submission_ids:
+            for reviewer in random.sample(reviewers, 10):
+                score = random.choice((0, 1, 2))
+                scores[submission_id].append(score)
+                reviews.append(
+                    Review(submission_id=submission_id, user=reviewer, score=score)
+                )
+        Review.objects.bulk_create(reviews, batch_size=BATCH_SIZE)
+
+        submission_ids.sort(key=lambda pk: mean(scores[pk]), reverse=True)
+        accepted_count = int(len(submission_ids) * 0.4)
+        state_changes = (
+            (SubmissionStates.CONFIRMED, submission_ids[:accepted_count]),
+            (SubmissionStates.REJECTED, submission_ids[accepted_count:]),
+        )
+        for state, pks in state_changes:
+            for start in range(0, len(pks), BATCH_SIZE):
+                Submission.objects.filter(
+                    pk__in=pks[start : start + BATCH_SIZE]
+                ).update(state=state)
+        TalkSlot.objects.bulk_create(
+            [
+                TalkSlot(submission_id=pk, schedule=self.event.wip_schedule)
+                for pk in submission_ids[:accepted_count]
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+    def build_schedule_stage_at_scale(self):
+        """Schedules all confirmed submissions from 09:00 to 19:00 in all
+        rooms, as far as they fit, and releases three schedule versions with
+        a few changes each."""
+        rooms = list(self.event.rooms.all())
+        days = (self.event.date_to - self.event.date_from).days + 1
+        day_starts = [
+            self.event.datetime_from + dt.timedelta(days=day, hours=9)
+            for day in range(days)
+        ]
+        times = {room.pk: (0, day_starts[0]) for room in rooms}
+        slots = list(
+            self.event.wip_schedule.talks.select_related("submission__submission_type")
+        )
+        for index, slot in enumerate(slots):
+            room = rooms[index % len(rooms)]
+            day, start = times[room.pk]
+            duration = dt.timedelta(
+                minutes=slot.submission.submission_type.default_duration
+            )
+            if start + duration > day_starts[day] + dt.timedelta(hours=10):
+                if day + 1 >= len(day_starts):
+                    continue  # The room is full, the talk remains unscheduled
+                day += 1
+                start = day_starts[day]
+            slot.room = room
+            slot.start = start
+            slot.end = start + duration
+            times[room.pk] = (day, slot.end)
+        TalkSlot.objects.bulk_update(
+            slots, ["room", "start", "end"], batch_size=BATCH_SIZE
+        )
+        __, schedule = self.event.wip_schedule.freeze("v1.0")
+
+        for version in ("v1.1", "v1.2"):
+            slots = list(schedule.talks.filter(start__isnull=False))
+            changed = random.sample(slots, len(slots) // 20)
+            for first, second in zip(changed[::2], changed[1::2]):
+                first_duration = first.end - first.start
+                second_duration = second.end - second.start
+                first.room, second.room = second.room, first.room
+                first.start, second.start = second.start, first.start
+                first.end = first.start + first_duration
+                second.end = second.start + second_duration
+            TalkSlot.objects.bulk_update(
+                changed, ["room", "start", "end"], batch_size=BATCH_SIZE
+            )
+            __, schedule = schedule.freeze(version, notify_speakers=False)
+
     @transaction.atomic
     def handle(self, *args, **options):
         try:
@@ -351,14 +584,19 @@ If you have any interest in {self.fake.catch_phrase().lower()}, {self.fake.catch
 
         seed = options.get("seed")
         if seed:
-            self.fake.seed(int(seed))
+            self.fake.seed_instance(int(seed))
+            random.seed(int(seed))
+        self.scale = options.get("scale", 1)
+        if self.scale < 1:
+            raise CommandError("The scale needs to be a positive number.")
+        suffix = "_at_scale" if self.scale > 1 else ""
         end_stage = options.get("stage")
         event = self.build_event(end_stage)
         if not event:
             return
         with scope(event=event):
             for stage in ("cfp", "review", "schedule"):
-                getattr(self, f"build_{stage}_stage")()
+                getattr(self, f"build_{stage}_stage{suffix}")()
                 self.stdout.write(
                     self.style.SUCCESS(f'Built data for stage "{stage}".')
                 )
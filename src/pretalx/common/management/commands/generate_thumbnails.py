@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from django_scopes import scopes_disabled
+
+from pretalx.common.tasks import generate_thumbnails
+from pretalx.person.models import User
+from pretalx.submission.models import Submission
+
+
+class Command(BaseCommand):
+    help = "Generate missing thumbnails of avatars and submission images"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Regenerate thumbnails that exist already, too",
+        )
+
+    def handle(self, *args, **options):
+        with scopes_disabled():
+            for model, field in ((User, "avatar"), (Submission, "image")):
+                queryset = model._base_manager.exclude(
+                    **{f"{field}__isnull": True}
+                ).exclude(**{field: ""})
+                if not options.get("all"):
+                    queryset = queryset.filter(**{f"{field}_thumbnails__isnull": True})
+                count = 0
+                for pk in queryset.values_list("pk", flat=True).iterator():
+                    generate_thumbnails.apply_async(args=(model._meta.label, pk, field))
+                    count += 1
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Started thumbnail generation for {count} {model._meta.verbose_name_plural}."
+                    )
+                )
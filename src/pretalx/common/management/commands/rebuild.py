@@ -1,9 +1,11 @@
 from contextlib import suppress
 
+from django.conf import settings
 from django.core.management import call_command
 from django.core.management.base import BaseCommand
 
 from pretalx.common.models.settings import GlobalSettings
+from pretalx.common.tasks import get_widget_js_file
 
 
 class Command(BaseCommand):
@@ -32,6 +34,8 @@ class Command(BaseCommand):
             "collectstatic", verbosity=silent, interactive=False, clear=options["clear"]
         )
         call_command("compress", verbosity=silent)
+        for locale, __ in settings.LANGUAGES:
+            get_widget_js_file(locale)
         with suppress(
             Exception
         ):  # This fails if we don't have db access, which is fine
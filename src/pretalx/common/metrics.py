@@ -0,0 +1,203 @@
+"""Collects timing and query metrics of views and background tasks.
+
+While a request or task is running, a :class:`MetricsCollector` counts its
+database queries and cache hits. Once it is done, the numbers are added to
+per-process totals, which are regularly added to counters in the default
+cache, so that all processes report to the same place. The totals are
+exposed in the Prometheus text format by
+:class:`pretalx.orga.views.admin.MetricsView`.
+"""
+
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+INDEX_KEY = "metrics:index"
+FLUSH_INTERVAL = 10
+FIELDS = {
+    "count": ("{kind}_{count}", "Number of handled {noun}."),
+    "duration": ("{kind}_duration_seconds_total", "Total wall time of all {noun}."),
+    "queries": (
+        "{kind}_db_queries_total",
+        "Total number of database queries of all {noun}.",
+    ),
+    "query_duration": (
+        "{kind}_db_duration_seconds_total",
+        "Total database query time of all {noun}.",
+    ),
+    "cache_hits": (
+        "{kind}_cache_hits_total",
+        "Total number of cache hits of all {noun}.",
+    ),
+    "cache_misses": (
+        "{kind}_cache_misses_total",
+        "Total number of cache misses of all {noun}.",
+    ),
+    "response_bytes": (
+        "{kind}_response_bytes_total",
+        "Total size of the non-streaming responses of all {noun}.",
+    ),
+}
+DURATION_FIELDS = ("duration", "query_duration")
+KINDS = {"view": ("requests_total", "requests"), "task": ("runs_total", "tasks")}
+
+_local = threading.local()
+_lock = threading.Lock()
+_pending = defaultdict(Counter)
+_last_flush = time.monotonic()
+
+
+class MetricsCollector:
+    """Counts the database queries and cache hits of one request or task."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.values = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.values["queries"] += 1
+            self.values["query_duration"] += time.perf_counter() - start
+
+    def finish(self):
+        self.values["count"] = 1
+        self.values["duration"] = time.perf_counter() - self.start
+        return self.values
+
+
+def _get_stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def record_cache_access(hit: bool):
+    for collector, __ in _get_stack():
+        collector.values["cache_hits" if hit else "cache_misses"] += 1
+
+
+def start_collecting():
+    """Starts collecting metrics in the current thread.
+
+    Collection can be nested, e.g. when a task runs eagerly during a
+    request. The outer collector then includes the numbers of the inner
+    one.
+    """
+    if not settings.METRICS_ENABLED:
+        return
+    collector = MetricsCollector()
+    wrappers = [connections[alias].execute_wrapper(collector) for alias in connections]
+    for wrapper in wrappers:
+        wrapper.__enter__()
+    _get_stack().append((collector, wrappers))
+
+
+def stop_collecting(kind: str, name: str, **values):
+    """Stops the innermost collection in the current thread and adds its
+    metrics to the totals of the given view or task name."""
+    stack = _get_stack()
+    if not stack:
+        return
+    collector, wrappers = stack.pop()
+    for wrapper in reversed(wrappers):
+        wrapper.__exit__(None, None, None)
+    result = collector.finish()
+    result.update(values)
+    with _lock:
+        _pending[(kind, name)].update(result)
+    if time.monotonic() - _last_flush > FLUSH_INTERVAL:
+        flush_metrics()
+
+
+@contextmanager
+def collect_metrics(kind: str, name: str):
+    start_collecting()
+    try:
+        yield
+    finally:
+        stop_collecting(kind, name)
+
+
+def _get_key(kind, name, field):
+    return f"metrics:{kind}:{name}:{field}"
+
+
+def flush_metrics():
+    """Adds the metrics collected by this process to the shared counters."""
+    global _last_flush
+
+    with _lock:
+        pending = dict(_pending)
+        _pending.clear()
+        _last_flush = time.monotonic()
+    if not pending:
+        return
+    index = {tuple(name) for name in cache.get(INDEX_KEY) or []}
+    if set(pending) - index:
+        cache.set(INDEX_KEY, sorted(index | set(pending)), None)
+    for (kind, name), values in pending.items():
+        for field, value in values.items():
+            if field in DURATION_FIELDS:  # Stored in microseconds
+                value = int(value * 1_000_000)
+            if not value:
+                continue
+            key = _get_key(kind, name, field)
+            cache.add(key, 0, None)
+            try:
+                cache.incr(key, value)
+            except ValueError:  # The key has been evicted in the meantime
+                cache.set(key, value, None)
+
+
+def get_metrics() -> dict:
+    """Returns the shared totals, as a dictionary mapping ``(kind, name)``
+    tuples to dictionaries of values."""
+    flush_metrics()
+    names = [tuple(name) for name in cache.get(INDEX_KEY) or []]
+    keys = {
+        _get_key(kind, name, field): (kind, name, field)
+        for kind, name in names
+        for field in FIELDS
+    }
+    result = {name: {} for name in names}
+    for key, value in cache.get_many(keys.keys()).items():
+        kind, name, field = keys[key]
+        if field in DURATION_FIELDS:
+            value = value / 1_000_000
+        result[(kind, name)][field] = value
+    return result
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_metrics() -> str:
+    """Returns the shared totals in the Prometheus text exposition format."""
+    metrics = get_metrics()
+    lines = []
+    for kind, (count, noun) in KINDS.items():
+        for field, (metric, help_text) in FIELDS.items():
+            rows = [
+                (name, values[field])
+                for (row_kind, name), values in sorted(metrics.items())
+                if row_kind == kind and field in values
+            ]
+            if not rows:
+                continue
+            metric = "pretalx_" + metric.format(kind=kind, count=count)
+            lines.append(f"# HELP {metric} {help_text.format(noun=noun)}")
+            lines.append(f"# TYPE {metric} counter")
+            lines += [
+                f'{metric}{{{kind}="{_escape_label(name)}"}} {value}'
+                for name, value in rows
+            ]
+    return "\n".join(lines) + "\n"
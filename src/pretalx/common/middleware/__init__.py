@@ -1,9 +1,13 @@
 from .domains import CsrfViewMiddleware, MultiDomainMiddleware, SessionMiddleware
 from .event import EventPermissionMiddleware
+from .log import ActivityLogMiddleware
+from .metrics import MetricsMiddleware
 
 __all__ = [
+    "ActivityLogMiddleware",
     "CsrfViewMiddleware",
     "EventPermissionMiddleware",
+    "MetricsMiddleware",
     "MultiDomainMiddleware",
     "SessionMiddleware",
 ]
@@ -52,8 +52,8 @@ class MultiDomainMiddleware:
         if event_slug:
             event = get_object_or_404(Event, slug__iexact=event_slug)
             request.event = event
-            if event.settings.custom_domain:
-                custom_domain = urlparse(event.settings.custom_domain)
+            if event.settings_snapshot.custom_domain:
+                custom_domain = urlparse(event.settings_snapshot.custom_domain)
                 event_domain, event_port = split_domain_port(custom_domain.netloc)
                 if event_domain == domain and event_port == port:
                     request.uses_custom_domain = True
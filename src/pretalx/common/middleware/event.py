@@ -26,6 +26,7 @@ class EventPermissionMiddleware:
         "event.login",
         "event.auth.reset",
         "event.auth.recover",
+        "admin.metrics",  # Checks its own permissions, to allow token access
     )
 
     def __init__(self, get_response):
@@ -113,12 +114,15 @@ class EventPermissionMiddleware:
                 return redirect(url)
         elif (
             event
-            and request.event.settings.custom_domain
+            and request.event.settings_snapshot.custom_domain
             and not request.uses_custom_domain
             and not is_exempt
         ):
             return redirect(
-                urljoin(request.event.settings.custom_domain, request.get_full_path())
+                urljoin(
+                    request.event.settings_snapshot.custom_domain,
+                    request.get_full_path(),
+                )
             )
         if event:
             with scope(event=event):
@@ -0,0 +1,14 @@
+from pretalx.common.mixins.models import buffered_logging
+
+
+class ActivityLogMiddleware:
+    """Collects the log entries created during a request and writes them in
+    one query at the end of the request. Entries logged inside an atomic
+    block are written with that block instead."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with buffered_logging():
+            return self.get_response(request)
@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from pretalx.common.metrics import start_collecting, stop_collecting
+
+
+class MetricsMiddleware:
+    """Records the duration, database queries, cache hits and response size
+    of every request, grouped by view name.
+
+    Only active if metrics have been enabled in the configuration.
+    """
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start_collecting()
+        response = None
+        try:
+            response = self.get_response(request)
+            return response
+        finally:
+            match = getattr(request, "resolver_match", None)
+            values = {}
+            if response is not None and not response.streaming:
+                values["response_bytes"] = len(response.content)
+            stop_collecting(
+                "view", match.view_name if match else "unresolved", **values
+            )
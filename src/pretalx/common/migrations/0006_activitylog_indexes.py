@@ -0,0 +1,33 @@
+# Generated by Django 2.2.28 on 2026-10-18 22:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0005_auto_20180202_1116"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="activitylog",
+            index=models.Index(
+                fields=["event", "timestamp"], name="common_acti_event_i_7d45b0_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="activitylog",
+            index=models.Index(
+                fields=["event", "action_type", "timestamp"],
+                name="common_acti_event_i_118b2c_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="activitylog",
+            index=models.Index(
+                fields=["content_type", "object_id", "timestamp"],
+                name="common_acti_content_8ab5c7_idx",
+            ),
+        ),
+    ]
@@ -1,6 +1,9 @@
 import json
+import threading
+from contextlib import contextmanager
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.utils.crypto import get_random_string
 from django_scopes import scopes_disabled
 from i18nfield.utils import I18nJSONEncoder
@@ -8,33 +11,121 @@ from i18nfield.utils import I18nJSONEncoder
 SENSITIVE_KEYS = ["password", "secret", "api_key"]
 
 
-class LogMixin:
-    def log_action(self, action, data=None, person=None, orga=False):
-        if not self.pk:
-            return
+_log_buffer = threading.local()
+
+
+def _get_atomic_depth():
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        return 0
+    return len(connection.savepoint_ids) + 1
 
+
+def start_log_buffer():
+    """Starts collecting log entries instead of writing them one by one.
+
+    Buffers can be nested, entries are written when the outermost buffer is
+    flushed. Prefer :func:`buffered_logging` unless you need to start and
+    flush the buffer in different places, as in signal handlers."""
+    if not getattr(_log_buffer, "depth", 0):
+        _log_buffer.entries = []
+        _log_buffer.depth = 0
+        _log_buffer.atomic_depth = _get_atomic_depth()
+    _log_buffer.depth += 1
+
+
+def flush_log_buffer():
+    """Closes the current log buffer. If it is the outermost one, all
+    collected entries are written with a single query."""
+    depth = getattr(_log_buffer, "depth", 0)
+    if not depth:
+        return
+    _log_buffer.depth = depth - 1
+    if _log_buffer.depth:
+        return
+    entries, _log_buffer.entries = _log_buffer.entries, []
+    if entries:
         from pretalx.common.models import ActivityLog
 
-        if data and isinstance(data, dict):
-            for key, value in data.items():
-                if any(sensitive_key in key for sensitive_key in SENSITIVE_KEYS):
-                    value = data[key]
-                    data[key] = "********" if value else value
-            data = json.dumps(data, cls=I18nJSONEncoder)
-        elif data:
-            raise TypeError(
-                f"Logged data should always be a dictionary, not {type(data)}."
-            )
+        ActivityLog.objects.bulk_create(entries)
+
+
+@contextmanager
+def buffered_logging():
+    """Collects all log entries created within this context and writes them
+    with a single query when the context is left.
+
+    Only entries logged in the transaction that was active when the buffer
+    was started (usually none, in autocommit mode) are collected. Entries
+    logged inside an atomic block opened later are written right away, so
+    that they are committed or rolled back together with the changes they
+    describe. Entries keep the time they were logged at as their timestamp.
+
+    All requests and Celery tasks use a log buffer already."""
+    start_log_buffer()
+    try:
+        yield
+    finally:
+        flush_log_buffer()
+
+
+def _save_log_entries(entries):
+    if (
+        getattr(_log_buffer, "depth", 0)
+        and _get_atomic_depth() <= _log_buffer.atomic_depth
+    ):
+        _log_buffer.entries += entries
+        return
+    from pretalx.common.models import ActivityLog
+
+    ActivityLog.objects.bulk_create(entries)
+
+
+def _serialize_log_data(data):
+    if data and isinstance(data, dict):
+        for key, value in data.items():
+            if any(sensitive_key in key for sensitive_key in SENSITIVE_KEYS):
+                value = data[key]
+                data[key] = "********" if value else value
+        return json.dumps(data, cls=I18nJSONEncoder)
+    if data:
+        raise TypeError(f"Logged data should always be a dictionary, not {type(data)}.")
+    return data
+
 
-        ActivityLog.objects.create(
+class LogMixin:
+    def _build_log_entry(self, action, data=None, person=None, orga=False):
+        from pretalx.common.models import ActivityLog
+
+        return ActivityLog(
             event=getattr(self, "event", None),
             person=person,
-            content_object=self,
+            content_type=ContentType.objects.get_for_model(type(self)),
+            object_id=self.pk,
             action_type=action,
             data=data,
             is_orga_action=orga,
         )
 
+    def log_action(self, action, data=None, person=None, orga=False):
+        if not self.pk:
+            return
+        data = _serialize_log_data(data)
+        _save_log_entries([self._build_log_entry(action, data, person, orga)])
+
+    @classmethod
+    def log_actions(cls, objects, action, data=None, person=None, orga=False):
+        """Logs the same action for many objects at once, with a single
+        query (or none, if a log buffer is active)."""
+        data = _serialize_log_data(data)
+        entries = [
+            obj._build_log_entry(action, data, person, orga)
+            for obj in objects
+            if obj.pk
+        ]
+        if entries:
+            _save_log_entries(entries)
+
     def logged_actions(self):
         from pretalx.common.models import ActivityLog
 
@@ -43,6 +134,19 @@ class LogMixin:
             object_id=self.pk,
         ).select_related("event", "person")
 
+    def logged_actions_with_archive(self):
+        """Returns all log entries about this object, newest first, including
+        the entries that have been moved to the log archive of its event."""
+        from pretalx.common.log_archive import read_archived_log_entries
+
+        entries = list(self.logged_actions())
+        event = getattr(self, "event", None)
+        if event:
+            entries += read_archived_log_entries(
+                event, content_object=self, newest_first=True
+            )
+        return entries
+
 
 class GenerateCode:
     """Generates a random code on first save.
@@ -70,7 +174,69 @@ class GenerateCode:
                     setattr(self, self._code_property, code)
                     return
 
+    @classmethod
+    def assign_codes(cls, objects, length=None):
+        """Assigns codes to all given objects that do not have one yet, for
+        bulk inserts.
+
+        Checks all new codes with one query instead of one per object.
+        """
+        prop = cls._code_property
+        missing = [obj for obj in objects if not getattr(obj, prop, None)]
+        while missing:
+            codes = {obj.generate_code(length=length): obj for obj in missing}
+            with scopes_disabled():
+                taken = set(
+                    cls._base_manager.filter(**{f"{prop}__in": codes}).values_list(
+                        prop, flat=True
+                    )
+                )
+            for code, obj in codes.items():
+                if code not in taken:
+                    setattr(obj, prop, code)
+            missing = [obj for obj in missing if not getattr(obj, prop, None)]
+
     def save(self, *args, **kwargs):
         if not getattr(self, self._code_property, None):
             self.assign_code()
         return super().save(*args, **kwargs)
+
+
+class ThumbnailMixin:
+    """Generates thumbnails for the image fields named in
+    ``_thumbnail_fields`` whenever a new image is saved.
+
+    Every image field needs an accompanying ``<field>_thumbnails`` field to
+    store the thumbnail key in, see :mod:`pretalx.common.images`. Thumbnails
+    are generated in a background task once the transaction is committed.
+    """
+
+    _thumbnail_fields = ()
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        new_images = []
+        for field in self._thumbnail_fields:
+            if update_fields is not None and field not in update_fields:
+                continue
+            image = getattr(self, field)
+            if image and image._committed:
+                continue
+            setattr(self, f"{field}_thumbnails", None)
+            if update_fields is not None:
+                kwargs["update_fields"] = list(kwargs["update_fields"]) + [
+                    f"{field}_thumbnails"
+                ]
+            if image:
+                new_images.append(field)
+        result = super().save(*args, **kwargs)
+        if new_images:
+            from pretalx.common.tasks import generate_thumbnails
+
+            for field in new_images:
+                transaction.on_commit(
+                    lambda field=field: generate_thumbnails.apply_async(
+                        args=(self._meta.label, self.pk, field)
+                    )
+                )
+        return result
@@ -1,6 +1,7 @@
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 from django_scopes import ScopedManager
 
@@ -119,7 +120,7 @@ class ActivityLog(models.Model):
     content_type = models.ForeignKey(to=ContentType, on_delete=models.CASCADE)
     object_id = models.PositiveIntegerField(db_index=True)
     content_object = GenericForeignKey("content_type", "object_id")
-    timestamp = models.DateTimeField(auto_now_add=True, db_index=True)
+    timestamp = models.DateTimeField(default=now, editable=False, db_index=True)
     action_type = models.CharField(max_length=200)
     data = models.TextField(null=True, blank=True)
     is_orga_action = models.BooleanField(default=False)
@@ -128,6 +129,11 @@ class ActivityLog(models.Model):
 
     class Meta:
         ordering = ("-timestamp",)
+        indexes = [
+            models.Index(fields=["event", "timestamp"]),
+            models.Index(fields=["event", "action_type", "timestamp"]),
+            models.Index(fields=["content_type", "object_id", "timestamp"]),
+        ]
 
     def __str__(self):
         """Custom __str__ to help with debugging."""
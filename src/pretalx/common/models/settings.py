@@ -2,10 +2,15 @@ import datetime as dt
 import json
 import uuid
 
+from django.core.cache import cache
+from django.core.files import File
+from django.db import transaction
 from django.utils.translation import gettext_noop
 from hierarkey.models import GlobalSettingsBase, Hierarkey
 from i18nfield.strings import LazyI18nString
 
+from pretalx.common.cache import NamespacedCache
+
 hierarkey = Hierarkey(attribute_name="settings")
 
 
@@ -203,3 +208,98 @@ email to support@pretalx.com!
     ),
     LazyI18nString,
 )
+
+
+GLOBAL_SETTINGS_VERSION_KEY = "settings:global"
+
+
+class SettingsSnapshot:
+    """An immutable copy of all settings of an object, with all values
+    already deserialised.
+
+    Use it instead of ``obj.settings`` where settings are only read, and
+    read often. File settings are not part of the snapshot, so that they
+    are not opened needlessly – they are read from ``obj.settings``
+    instead.
+    """
+
+    def __init__(self, proxy, values: dict):
+        object.__setattr__(self, "_proxy", proxy)
+        object.__setattr__(self, "_values", values)
+
+    def get(self, key: str, default=None):
+        if key in self._values:
+            return self._values[key]
+        return self._proxy.get(key, default=default)
+
+    def __getattr__(self, key: str):
+        if key.startswith("_"):
+            raise AttributeError(key)
+        return self.get(key)
+
+    def __getitem__(self, key: str):
+        return self.get(key)
+
+    def __setattr__(self, key: str, value):
+        raise AttributeError("Settings snapshots are read-only.")
+
+    def __delattr__(self, key: str):
+        raise AttributeError("Settings snapshots are read-only.")
+
+
+def _get_snapshot_cache(obj) -> NamespacedCache:
+    return NamespacedCache(prefixkey=f"settings:{obj._meta.label_lower}:{obj.pk}")
+
+
+def _get_snapshot_values(proxy) -> dict:
+    raw_values = {}
+    if proxy._parent:
+        raw_values.update(getattr(proxy._parent, hierarkey.attribute_name)._cache())
+    raw_values.update(proxy._cache())
+    values = {}
+    for key in set(hierarkey.defaults) | set(raw_values):
+        default = hierarkey.defaults.get(key)
+        raw_value = raw_values.get(key, default.value if default else None)
+        if (default and default.type == File) or (
+            isinstance(raw_value, str) and raw_value.startswith("file://")
+        ):
+            continue
+        values[key] = proxy.get(key)
+    return values
+
+
+def get_settings_snapshot(obj) -> SettingsSnapshot:
+    """Returns a :class:`SettingsSnapshot` of the object's settings.
+
+    Snapshots are shared across processes via the cache. Their cache key
+    includes a version that is bumped whenever a setting of the object (or
+    a global setting) is changed, see :func:`clear_settings_snapshot`.
+    """
+    proxy = getattr(obj, hierarkey.attribute_name)
+    snapshot_cache = _get_snapshot_cache(obj)
+    key = f"snapshot:{cache.get(GLOBAL_SETTINGS_VERSION_KEY, 0)}"
+    values = snapshot_cache.get(key)
+    if values is None:
+        values = _get_snapshot_values(proxy)
+        snapshot_cache.set(key, values, 3600)
+    return SettingsSnapshot(proxy, values)
+
+
+def clear_settings_snapshot(obj=None):
+    """Invalidates the settings snapshots of the given object, or of all
+    objects if no object is given (as global settings apply to all of them).
+
+    The shared snapshot is invalidated once the current transaction has
+    been committed, the snapshot attached to the object immediately."""
+    if obj is None:
+
+        def bump_global_version():
+            try:
+                cache.incr(GLOBAL_SETTINGS_VERSION_KEY)
+            except ValueError:
+                cache.set(GLOBAL_SETTINGS_VERSION_KEY, 1, None)
+
+        transaction.on_commit(bump_global_version)
+        return
+    obj.__dict__.pop("settings_snapshot", None)
+    transaction.on_commit(lambda: _get_snapshot_cache(obj).clear())
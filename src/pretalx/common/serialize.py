@@ -1,4 +1,30 @@
+"""Serialization of exported data.
+
+Exporters build their data from plain Python types: i18n strings are
+localized and datetimes are formatted while the data is built. Such data
+can be encoded by :func:`dumps` without any Python callbacks. If the
+optional ``orjson`` package is installed (``pretalx[orjson]``), it is used
+for encoding, otherwise the standard library ``json`` module is used. Both
+produce compact output, but only orjson leaves non-ASCII characters
+unescaped.
+
+Values that are not plain types are still converted by
+:func:`json_default`, which matches ``I18nJSONEncoder``.
+"""
 import datetime as dt
+import decimal
+import json
+import uuid
+
+from django.db.models import Model, QuerySet
+from django.utils.duration import duration_iso_string
+from django.utils.functional import Promise
+from i18nfield.strings import LazyI18nString
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 
 def serialize_duration(minutes):
@@ -14,3 +40,45 @@ def serialize_duration(minutes):
     else:
         fmt = f"00:{fmt}"
     return fmt
+
+
+def serialize_datetime(value):
+    """Formats a datetime, date or time like Django's JSON encoder does."""
+    result = value.isoformat()
+    if isinstance(value, dt.datetime):
+        if value.microsecond:
+            result = result[:23] + result[26:]
+        if result.endswith("+00:00"):
+            result = result[:-6] + "Z"
+    elif isinstance(value, dt.time) and value.microsecond:
+        result = result[:12]
+    return result
+
+
+def json_default(obj):
+    if isinstance(obj, LazyI18nString):
+        return obj.data
+    if isinstance(obj, (dt.datetime, dt.date, dt.time)):
+        if isinstance(obj, dt.time) and obj.utcoffset() is not None:
+            raise ValueError("JSON can't represent timezone-aware times.")
+        return serialize_datetime(obj)
+    if isinstance(obj, dt.timedelta):
+        return duration_iso_string(obj)
+    if isinstance(obj, (decimal.Decimal, uuid.UUID, Promise)):
+        return str(obj)
+    if isinstance(obj, QuerySet):
+        return list(obj)
+    if isinstance(obj, Model):
+        return {"type": obj.__class__.__name__, "id": obj.id}
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+def dumps(data) -> bytes:
+    """Encodes data as compact JSON."""
+    if orjson:
+        return orjson.dumps(
+            data,
+            default=json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return json.dumps(data, default=json_default, separators=(",", ":")).encode()
@@ -11,6 +11,10 @@ CONFIG = {
         "logs": {"default": None, "env": os.getenv("PRETALX_FILESYSTEM_LOGS"),},
         "media": {"default": None, "env": os.getenv("PRETALX_FILESYSTEM_MEDIA"),},
         "static": {"default": None, "env": os.getenv("PRETALX_FILESYSTEM_STATIC"),},
+        "logarchive": {
+            "default": None,
+            "env": os.getenv("PRETALX_FILESYSTEM_LOGARCHIVE"),
+        },
     },
     "site": {
         "debug": {
@@ -54,6 +58,10 @@ CONFIG = {
             "env": os.getenv("PRETALX_LOGGING_EMAIL_LEVEL"),
         },
     },
+    "metrics": {
+        "enabled": {"default": "False", "env": os.getenv("PRETALX_METRICS_ENABLED"),},
+        "token": {"default": "", "env": os.getenv("PRETALX_METRICS_TOKEN"),},
+    },
     "locale": {
         "language_code": {"default": "en", "env": os.getenv("PRETALX_LANGUAGE_CODE"),},
         "time_zone": {"default": "UTC", "env": os.getenv("PRETALX_TIME_ZONE"),},
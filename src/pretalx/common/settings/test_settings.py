@@ -18,8 +18,16 @@ LOG_DIR = DATA_DIR / "logs"
 MEDIA_ROOT = DATA_DIR / "media"
 STATIC_ROOT = DATA_DIR / "static"
 HTMLEXPORT_ROOT = DATA_DIR / "htmlexport"
-
-for directory in (BASE_DIR, DATA_DIR, LOG_DIR, MEDIA_ROOT, HTMLEXPORT_ROOT):
+LOG_ARCHIVE_ROOT = DATA_DIR / "logarchive"
+
+for directory in (
+    BASE_DIR,
+    DATA_DIR,
+    LOG_DIR,
+    MEDIA_ROOT,
+    HTMLEXPORT_ROOT,
+    LOG_ARCHIVE_ROOT,
+):
     directory.mkdir(parents=True, exist_ok=True)
 
 INSTALLED_APPS.append("tests.dummy_app.PluginApp")  # noqa
@@ -1,9 +1,10 @@
+import weakref
 from typing import Any, Callable, List, Tuple
 
 import django.dispatch
 from django.apps import apps
 from django.conf import settings
-from django.dispatch.dispatcher import NO_RECEIVERS
+from django.dispatch.dispatcher import NO_RECEIVERS, NONE_ID
 
 from pretalx.event.models import Event
 
@@ -21,8 +22,27 @@ class EventPluginSignal(django.dispatch.Signal):
 
     It sends out it's events only to receivers which belong to plugins
     that are enabled for the given Event.
+
+    The active receivers are memoised per set of active plugins, so that
+    sending a signal does not need to look up the plugin of every receiver.
+    Enabling or disabling a plugin changes the event's plugin list, and
+    with it the cache entry in use. Connecting or disconnecting a receiver
+    clears the cache.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._active_receivers_cache = {}
+
+    def connect(self, *args, **kwargs):
+        super().connect(*args, **kwargs)
+        self._active_receivers_cache.clear()
+
+    def disconnect(self, *args, **kwargs):
+        result = super().disconnect(*args, **kwargs)
+        self._active_receivers_cache.clear()
+        return result
+
     @staticmethod
     def _is_active(sender, receiver):
         # Find the Django application this belongs to
@@ -44,6 +64,47 @@ class EventPluginSignal(django.dispatch.Signal):
             return app and app.name in sender.plugin_list
         return False
 
+    def _active_receivers(self, sender: Event) -> List[Callable]:
+        """Returns the live receivers that belong to core modules or to
+        plugins that are enabled for the given Event."""
+        if not app_cache:
+            _populate_app_cache()
+        if self._dead_receivers:
+            with self.lock:
+                self._clear_dead_receivers()
+            self._active_receivers_cache.clear()
+
+        if any(sender_key != NONE_ID for (__, sender_key), __ in self.receivers):
+            # Receivers for specific senders cannot be shared between events
+            return [
+                receiver
+                for receiver in self._live_receivers(sender)
+                if self._is_active(sender, receiver)
+            ]
+
+        key = (sender.plugins or "") if sender else None
+        references = self._active_receivers_cache.get(key)
+        if references is None:
+            references = []
+            for __, reference in self.receivers:
+                receiver = (
+                    reference()
+                    if isinstance(reference, weakref.ReferenceType)
+                    else reference
+                )
+                if receiver is not None and self._is_active(sender, receiver):
+                    references.append(reference)
+            self._active_receivers_cache[key] = references
+
+        receivers = []
+        for reference in references:
+            if isinstance(reference, weakref.ReferenceType):
+                reference = reference()
+                if reference is None:
+                    continue
+            receivers.append(reference)
+        return receivers
+
     def send(self, sender: Event, **named) -> List[Tuple[Callable, Any]]:
         """Send signal from sender to all connected receivers that belong to
         plugins enabled for the given Event.
@@ -61,13 +122,9 @@ class EventPluginSignal(django.dispatch.Signal):
         ):
             return responses
 
-        if not app_cache:
-            _populate_app_cache()
-
-        for receiver in self._live_receivers(sender):
-            if self._is_active(sender, receiver):
-                response = receiver(signal=self, sender=sender, **named)
-                responses.append((receiver, response))
+        for receiver in self._active_receivers(sender):
+            response = receiver(signal=self, sender=sender, **named)
+            responses.append((receiver, response))
         return sorted(
             responses,
             key=lambda response: (response[0].__module__, response[0].__name__),
@@ -91,17 +148,13 @@ class EventPluginSignal(django.dispatch.Signal):
         ):
             return []
 
-        if not app_cache:
-            _populate_app_cache()
-
-        for receiver in self._live_receivers(sender):
-            if self._is_active(sender, receiver):
-                try:
-                    response = receiver(signal=self, sender=sender, **named)
-                except Exception as err:
-                    responses.append((receiver, err))
-                else:
-                    responses.append((receiver, response))
+        for receiver in self._active_receivers(sender):
+            try:
+                response = receiver(signal=self, sender=sender, **named)
+            except Exception as err:
+                responses.append((receiver, err))
+            else:
+                responses.append((receiver, response))
         return sorted(
             responses,
             key=lambda response: (response[0].__module__, response[0].__name__),
@@ -128,13 +181,9 @@ class EventPluginSignal(django.dispatch.Signal):
         ):
             return response
 
-        if not app_cache:
-            _populate_app_cache()
-
-        for receiver in self._live_receivers(sender):
-            if self._is_active(sender, receiver):
-                named[chain_kwarg_name] = response
-                response = receiver(signal=self, sender=sender, **named)
+        for receiver in self._active_receivers(sender):
+            named[chain_kwarg_name] = response
+            response = receiver(signal=self, sender=sender, **named)
         return response
 
 
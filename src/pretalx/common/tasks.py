@@ -1,70 +1,139 @@
+import gzip
 import hashlib
 import logging
+from functools import lru_cache
+from pathlib import Path
 
 import django_libsass
 import sass
+from django.apps import apps
 from django.conf import settings
 from django.contrib.staticfiles import finders
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.templatetags.static import static
+from django_scopes import scopes_disabled
 
+from pretalx import __version__ as pretalx_version
 from pretalx.celery_app import app
+from pretalx.common.images import create_thumbnails
 from pretalx.event.models import Event
 
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
 logger = logging.getLogger(__name__)
+_widget_js_files = {}
 
 
-def generate_widget_css(event, save=True):
-    agenda_path = finders.find("agenda/scss/_agenda.scss")
-    variables_path = finders.find("common/scss/_variables.scss")
+@lru_cache(maxsize=None)
+def get_scss_checksum(static_root):
+    """Returns a checksum of all SCSS files in a static file directory.
+
+    Static files only change on deployment, which restarts all processes,
+    so the checksum is computed only once per process and directory."""
+    static_root = Path(static_root)
+    checksum = hashlib.sha1()
+    for path in sorted(static_root.rglob("*.scss")):
+        checksum.update(str(path.relative_to(static_root)).encode())
+        checksum.update(path.read_bytes())
+    return checksum.hexdigest()
+
+
+def compile_scss(imports, primary_color=None):
     custom_functions = dict(django_libsass.CUSTOM_FUNCTIONS)
     custom_functions["static"] = static
     sassrules = []
-    if event.primary_color:
-        sassrules.append("$brand-primary: {};".format(event.primary_color))
+    if primary_color:
+        sassrules.append("$brand-primary: {};".format(primary_color))
         sassrules.append("$link-color: $brand-primary;")
-    sassrules.append(f'@import "{variables_path}";')
-    sassrules.append(f'@import "{agenda_path}";')
-    css = sass.compile(
+    for path in imports:
+        sassrules.append(f'@import "{path}";')
+    return sass.compile(
         string="\n".join(sassrules),
         output_style="compressed",
         custom_functions=custom_functions,
     ).encode("utf-8")
-    if save:
-        checksum = hashlib.sha1(css).hexdigest()
-        if event.settings.widget_css_checksum != checksum:
-            file_name = default_storage.save(
-                "widget/widget.{}.css".format(checksum), ContentFile(css)
-            )
-            event.settings.set("widget_css", "file://" + file_name)
-            event.settings.set("widget_css_checksum", checksum)
-    return css
-
-
-def generate_widget_js(event, locale, save=True):
-    code = f"""
-const lang = "{locale}";
-let dataSource = "{event.urls.widget_data_source}";
-"""
-    files = [
+
+
+def get_compiled_css(name, imports, primary_color=None, source_checksum=None):
+    """Compiles SCSS files to CSS and saves the result, unless it has been
+    compiled before. Returns the file name and a checksum.
+
+    Compiled files depend only on the SCSS sources and the primary colour,
+    so events with the same colour share the same files."""
+    source_checksum = source_checksum or get_scss_checksum(settings.STATIC_ROOT)
+    checksum = hashlib.sha1(
+        f"{source_checksum}:{pretalx_version}:{name}:{primary_color or ''}".encode()
+    ).hexdigest()
+    file_name = f"css/{name}.{checksum[:16]}.css"
+    if not default_storage.exists(file_name):
+        css = compile_scss(imports, primary_color)
+        file_name = default_storage.save(file_name, ContentFile(css))
+    return file_name, checksum
+
+
+def generate_widget_css(event, save=True):
+    agenda_path = finders.find("agenda/scss/_agenda.scss")
+    variables_path = finders.find("common/scss/_variables.scss")
+    imports = [variables_path, agenda_path]
+    if not save:
+        return compile_scss(imports, event.primary_color)
+    file_name, checksum = get_compiled_css(
+        "widget",
+        imports,
+        event.primary_color,
+        source_checksum=get_scss_checksum(Path(variables_path).parents[2]),
+    )
+    if event.settings.widget_css_checksum != checksum:
+        event.settings.set("widget_css", "file://" + file_name)
+        event.settings.set("widget_css_checksum", checksum)
+    with default_storage.open(file_name) as css:
+        return css.read()
+
+
+def get_widget_js_sources():
+    return [
         "vendored/vue.js" if settings.DEBUG else "vendored/vue.min.js",
         "vendored/moment-with-locales.js",
         "agenda/js/widget.js",
     ]
-    for fname in files:
-        f = finders.find(fname)
-        with open(f, "r", encoding="utf-8") as fp:
+
+
+def generate_widget_js(locale):
+    code = f'const lang = "{locale}";\n'
+    for fname in get_widget_js_sources():
+        with open(finders.find(fname), "r", encoding="utf-8") as fp:
             code += fp.read()
-    data = code.encode()
-    if save:
-        checksum = hashlib.sha1(data).hexdigest()
-        file_name = default_storage.save(
-            "widget/widget.{}.{}.js".format(locale, checksum), ContentFile(data)
-        )
-        event.settings.set("widget_file_{}".format(locale), "file://" + file_name)
-        event.settings.set("widget_checksum_{}".format(locale), checksum)
-    return data
+    return code.encode()
+
+
+def get_widget_js_file(locale):
+    """Returns the storage file name of the widget script for a locale.
+
+    The script does not depend on the event, so it is built once per locale
+    and content, and stored under a content-hashed name next to gzip (and,
+    if the brotli module is installed, brotli) compressed copies, for web
+    servers to serve directly."""
+    file_name = _widget_js_files.get(locale)
+    if file_name and default_storage.exists(file_name):
+        return file_name
+    data = generate_widget_js(locale)
+    checksum = hashlib.sha1(data).hexdigest()
+    file_name = f"widget/widget.{locale}.{checksum[:16]}.js"
+    # The plain file is written last, as it marks the variants as complete
+    if not default_storage.exists(file_name):
+        compressors = {f"{file_name}.gz": lambda: gzip.compress(data, mtime=0)}
+        if brotli:
+            compressors[f"{file_name}.br"] = lambda: brotli.compress(data)
+        for name, compress in compressors.items():
+            if not default_storage.exists(name):
+                default_storage.save(name, ContentFile(compress()))
+        default_storage.save(file_name, ContentFile(data))
+    _widget_js_files[locale] = file_name
+    return file_name
 
 
 @app.task()
@@ -77,9 +146,6 @@ def regenerate_css(event_id: int):
 
     if event.settings.widget_css_checksum:
         generate_widget_css(event)
-    for locale in event.locales:
-        if event.settings.get(f"widget_checksum_{locale}"):
-            generate_widget_js(event, locale)
 
     if not event.primary_color:
         for local_app in local_apps:
@@ -87,24 +153,47 @@ def regenerate_css(event_id: int):
             event.settings.delete(f"{local_app}_css_checksum")
         return
 
+    source_checksum = get_scss_checksum(settings.STATIC_ROOT)
     for local_app in local_apps:
-        path = settings.STATIC_ROOT / local_app / "scss/main.scss"
-        sassrules = []
-        sassrules.append("$brand-primary: {};".format(event.primary_color))
-        sassrules.append("$link-color: $brand-primary;")
-        sassrules.append(f'@import "{path}";')
-
-        custom_functions = dict(django_libsass.CUSTOM_FUNCTIONS)
-        custom_functions["static"] = static
-        css = sass.compile(
-            string="\n".join(sassrules),
-            output_style="compressed",
-            custom_functions=custom_functions,
-        ).encode("utf-8")
-        checksum = hashlib.sha1(css).hexdigest()
-        fname = f"{event.slug}/{local_app}.{checksum[:16]}.css"
-
+        file_name, checksum = get_compiled_css(
+            local_app,
+            [settings.STATIC_ROOT / local_app / "scss/main.scss"],
+            event.primary_color,
+            source_checksum=source_checksum,
+        )
         if event.settings.get(f"{local_app}_css_checksum", "") != checksum:
-            newname = default_storage.save(fname, ContentFile(css))
-            event.settings.set(f"{local_app}_css_file", f"/media/{newname}")
+            event.settings.set(f"{local_app}_css_file", f"/media/{file_name}")
             event.settings.set(f"{local_app}_css_checksum", checksum)
+
+
+@app.task()
+def generate_thumbnails(model_name: str, pk: int, field: str):
+    from pretalx.api.mixins import invalidate_public_api_cache
+
+    model = apps.get_model(model_name)
+    with scopes_disabled():
+        instance = model._base_manager.filter(pk=pk).first()
+        if not instance:
+            logger.error(f"In generate_thumbnails: {model_name} {pk} not found.")
+            return
+        image = getattr(instance, field)
+        if not image:
+            return
+        key = create_thumbnails(image)
+        # Only store the key if the image has not been replaced in the meantime
+        updated = model._base_manager.filter(pk=pk, **{field: image.name}).update(
+            **{f"{field}_thumbnails": key}
+        )
+        if not updated:
+            return
+        # The update does not send post_save, so cached API responses of all
+        # events showing the image are dropped here.
+        if hasattr(instance, "profiles"):
+            events = [
+                profile.event
+                for profile in instance.profiles.all().select_related("event")
+            ]
+        else:
+            events = [instance.event]
+        for event in events:
+            invalidate_public_api_cache(event)
@@ -0,0 +1,35 @@
+from django import template
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+
+from pretalx.common.images import get_thumbnail_key, get_thumbnail_url
+
+register = template.Library()
+
+
+@register.simple_tag
+def thumbnail(image, size, **attrs):
+    """Renders an image file as the thumbnail that fits the given size, as a
+    ``<picture>`` with a WebP source, e.g. ``{% thumbnail user.avatar 160
+    alt="…" %}``. Falls back to the original image if there are no
+    thumbnails (yet)."""
+    if not image:
+        return ""
+    attrs = flatatt(attrs)
+    if not get_thumbnail_key(image):
+        return format_html('<img src="{}"{}>', image.url, attrs)
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}"><img src="{}"{}></picture>',
+        get_thumbnail_url(image, size, webp=True),
+        get_thumbnail_url(image, size),
+        attrs,
+    )
+
+
+@register.filter
+def thumbnail_url(image, size):
+    """Returns the URL of the thumbnail that fits the given size, e.g. ``{{
+    user.avatar|thumbnail_url:64 }}``."""
+    if not image:
+        return ""
+    return get_thumbnail_url(image, size)
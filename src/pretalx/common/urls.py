@@ -1,4 +1,5 @@
 from contextlib import suppress
+from types import SimpleNamespace
 from urllib.parse import urljoin, urlparse
 
 from django.conf import settings
@@ -10,13 +11,13 @@ def get_base_url(event=None, url=None):
     if url and url.startswith("/orga"):
         return settings.SITE_URL
     if event:
-        if event.settings.html_export_url and url:
+        if event.settings_snapshot.html_export_url and url:
             with suppress(Exception):
                 resolved = resolve(url)
                 if "agenda" in resolved.namespaces:
-                    return event.settings.html_export_url
-        if event.settings.custom_domain:
-            return event.settings.custom_domain
+                    return event.settings_snapshot.html_export_url
+        if event.settings_snapshot.custom_domain:
+            return event.settings_snapshot.custom_domain
     return settings.SITE_URL
 
 
@@ -33,3 +34,74 @@ class EventUrls(Urls):
     def get_scheme(self, url):
         url = get_base_url(self.instance.event, url)
         return urlparse(url).scheme
+
+
+class EventUrlBuilder:
+    """Builds the URLs of many objects of the same event, e.g. in exports.
+
+    Every access to an object's ``urls`` formats the event's URLs again,
+    and every ``.full()`` call resolves the event's base URL, scheme and
+    host anew. The builder does this once per URL pattern, using a
+    placeholder object, and then only substitutes the object's identifier
+    into the cached result. URLs are defined in the models' ``urls`` classes
+    as usual, so they can't get out of sync.
+    """
+
+    placeholder = "PRETALXURLPLACEHOLDER"
+
+    def __init__(self, event):
+        self.event = event
+        self._templates = {}
+
+    def _get_url(self, key, get_url, value, full):
+        template = self._templates.get((key, full))
+        if template is None:
+            url = get_url()
+            template = url.full() if full else str(url)
+            self._templates[(key, full)] = template
+        if value is None:
+            return template
+        return template.replace(self.placeholder, str(value))
+
+    def _get_object_url(self, model, urls, name, instance, value, full):
+        def get_url():
+            url_object = type(getattr(model, urls))(model, instance)
+            instance.urls = url_object
+            return getattr(url_object, name)
+
+        return self._get_url((model, urls, name), get_url, value, full)
+
+    def event_url(self, name: str, full: bool = False) -> str:
+        return self._get_url(
+            ("event", name), lambda: getattr(self.event.urls, name), None, full
+        )
+
+    def submission_url(self, code: str, name: str = "public", full: bool = False):
+        from pretalx.submission.models import Submission
+
+        instance = SimpleNamespace(event=self.event, code=self.placeholder)
+        return self._get_object_url(Submission, "urls", name, instance, code, full)
+
+    def submission_orga_url(self, code: str, name: str = "base", full: bool = False):
+        from pretalx.submission.models import Submission
+
+        instance = SimpleNamespace(event=self.event, code=self.placeholder)
+        return self._get_object_url(Submission, "orga_urls", name, instance, code, full)
+
+    def speaker_url(self, code: str, name: str = "public", full: bool = False):
+        """Returns the URLs of a speaker's
+        :class:`~pretalx.person.models.profile.SpeakerProfile`, by the user's
+        code."""
+        from pretalx.person.models import SpeakerProfile
+
+        instance = SimpleNamespace(
+            event=self.event, user=SimpleNamespace(code=self.placeholder)
+        )
+        return self._get_object_url(SpeakerProfile, "urls", name, instance, code, full)
+
+    def schedule_url(self, version: str, name: str = "public", full: bool = False):
+        """Returns the URLs of a released schedule, by its URL version."""
+        from pretalx.schedule.models import Schedule
+
+        instance = SimpleNamespace(event=self.event, url_version=self.placeholder)
+        return self._get_object_url(Schedule, "urls", name, instance, version, full)
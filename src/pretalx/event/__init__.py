@@ -6,6 +6,7 @@ class EventConfig(AppConfig):
 
     def ready(self):
         from . import services  # noqa
+        from . import signals  # noqa
 
 
 default_app_config = "pretalx.event.EventConfig"
@@ -16,7 +16,7 @@ from i18nfield.fields import I18nCharField, I18nTextField
 
 from pretalx.common.cache import ObjectRelatedCache
 from pretalx.common.mixins import LogMixin
-from pretalx.common.models.settings import hierarkey
+from pretalx.common.models.settings import get_settings_snapshot, hierarkey
 from pretalx.common.phrases import phrases
 from pretalx.common.urls import EventUrls
 from pretalx.common.utils import daterange, path_with_hash
@@ -259,7 +259,6 @@ class Event(LogMixin, models.Model):
         frab_json = "{export}schedule.json"
         frab_xcal = "{export}schedule.xcal"
         ical = "{export}schedule.ics"
-        widget_data_source = "{schedule}widget/v1.json"
 
     class orga_urls(EventUrls):
         create = "/orga/event/new"
@@ -349,6 +348,17 @@ class Event(LogMixin, models.Model):
         """
         return ObjectRelatedCache(self, field="slug")
 
+    @cached_property
+    def settings_snapshot(self):
+        """Returns a read-only
+        :py:class:`~pretalx.common.models.settings.SettingsSnapshot` of
+        this event's settings.
+
+        Use this instead of ``event.settings`` when reading settings on hot
+        code paths, as all values are loaded and deserialised only once.
+        """
+        return get_settings_snapshot(self)
+
     def save(self, *args, **kwargs):
         was_created = not bool(self.pk)
         super().save(*args, **kwargs)
@@ -792,6 +802,7 @@ class Event(LogMixin, models.Model):
     @transaction.atomic
     def shred(self):
         """Irrevocably deletes an event and all related data."""
+        from pretalx.common.log_archive import delete_log_archive
         from pretalx.common.models import ActivityLog
         from pretalx.person.models import SpeakerProfile
         from pretalx.schedule.models import TalkSlot
@@ -810,7 +821,6 @@ class Event(LogMixin, models.Model):
             self.cfp,
             self.mail_templates.all(),
             self.information.all(),
-            TalkSlot.objects.filter(schedule__event=self),
             Feedback.objects.filter(talk__event=self),
             Resource.objects.filter(submission__event=self),
             Answer.objects.filter(question__event=self),
@@ -827,7 +837,11 @@ class Event(LogMixin, models.Model):
         ]
 
         self._delete_mail_templates()
+        # Slots are deleted without signals, so that no tombstones are recorded
+        slots = TalkSlot.objects.filter(schedule__event=self)
+        slots._raw_delete(slots.db)
         for entry in deletion_order:
             entry.delete()
+        transaction.on_commit(lambda: delete_log_archive(self))
 
     shred.alters_data = True
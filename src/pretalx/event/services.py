@@ -1,5 +1,6 @@
 import datetime as dt
 
+from django.db.models import Q
 from django.dispatch import receiver
 from django.utils.timezone import now
 from django_scopes import scope, scopes_disabled
@@ -7,8 +8,12 @@ from django_scopes import scope, scopes_disabled
 from pretalx.agenda.management.commands.export_schedule_html import get_export_zip_path
 from pretalx.agenda.tasks import export_schedule_html
 from pretalx.celery_app import app
+from pretalx.common.models.log import ActivityLog
 from pretalx.common.signals import periodic_task
 from pretalx.event.models import Event
+from pretalx.event.models.event import Event_SettingsStore
+from pretalx.schedule.models import Schedule
+from pretalx.submission.models import ReviewPhase
 
 
 @app.task()
@@ -16,7 +21,7 @@ def task_periodic_event_services(event_slug):
     with scopes_disabled():
         event = (
             Event.objects.filter(slug=event_slug)
-            .prefetch_related("_settings_objects", "submissions__slots")
+            .prefetch_related("_settings_objects")
             .first()
         )
     if not event:
@@ -26,10 +31,10 @@ def task_periodic_event_services(event_slug):
     with scope(event=event):
         event.build_initial_data()  # Make sure the required mail templates are there
         if not event.settings.sent_mail_event_created:
-            if (
-                dt.timedelta(0)
-                <= (_now - event.log_entries.last().timestamp)
-                <= dt.timedelta(days=1)
+            last_entry = event.log_entries.last()
+            # Without log entries, e.g. after archiving, nothing happened lately
+            if last_entry and (
+                dt.timedelta(0) <= (_now - last_entry.timestamp) <= dt.timedelta(days=1)
             ):
                 event.send_orga_mail(event.settings.mail_text_event_created)
                 event.settings.sent_mail_event_created = True
@@ -60,7 +65,7 @@ def task_periodic_schedule_export(event_slug):
     with scopes_disabled():
         event = (
             Event.objects.filter(slug=event_slug)
-            .prefetch_related("_settings_objects", "submissions__slots")
+            .prefetch_related("_settings_objects")
             .first()
         )
     with scope(event=event):
@@ -81,11 +86,63 @@ def task_periodic_schedule_export(event_slug):
             export_schedule_html.apply_async(kwargs={"event_id": event.id})
 
 
+def get_events_for_services(_now):
+    """Returns the events that :func:`task_periodic_event_services` may have
+    work to do for: events with logged activity or a CfP deadline in the last
+    day, and events that have not been over for more than three days."""
+    return Event.objects.filter(
+        Q(date_to__gte=_now.date() - dt.timedelta(days=3))
+        | Q(cfp__deadline__gte=_now - dt.timedelta(days=1), cfp__deadline__lte=_now)
+        | Q(
+            pk__in=ActivityLog.objects.filter(
+                timestamp__gte=_now - dt.timedelta(days=1)
+            ).values("event_id")
+        )
+    )
+
+
+def get_events_for_schedule_export():
+    """Returns the events with a released schedule which want their HTML
+    export to be rebuilt automatically."""
+    return Event.objects.filter(
+        pk__in=Schedule.objects.filter(published__isnull=False).values("event_id")
+    ).filter(
+        pk__in=Event_SettingsStore.objects.filter(
+            key="export_html_on_schedule_release", value="True"
+        ).values("object_id")
+    )
+
+
+def get_events_for_review_phase_update(_now):
+    """Returns the events whose active review phase has ended, or which have
+    an inactive review phase that may have to be activated, or which have
+    no review phases at all (to create the default phases)."""
+    phases = ReviewPhase.objects.filter(
+        Q(is_active=True, end__lte=_now)
+        | (
+            Q(is_active=False)
+            & (Q(start__isnull=True) | Q(start__lte=_now))
+            & (Q(end__isnull=True) | Q(end__gt=_now))
+        )
+    )
+    return Event.objects.filter(
+        Q(pk__in=phases.values("event_id"))
+        | ~Q(pk__in=ReviewPhase.objects.all().values("event_id"))
+    )
+
+
 @receiver(periodic_task)
 def periodic_event_services(sender, **kwargs):
-    for event in Event.objects.all():
+    _now = now()
+    with scopes_disabled():
+        services = list(get_events_for_services(_now).values_list("slug", flat=True))
+        exports = list(get_events_for_schedule_export().values_list("slug", flat=True))
+        review_phases = list(get_events_for_review_phase_update(_now))
+
+    for slug in services:
+        task_periodic_event_services.apply_async(args=(slug,))
+    for slug in exports:
+        task_periodic_schedule_export.apply_async(args=(slug,))
+    for event in review_phases:
         with scope(event=event):
-            task_periodic_event_services.apply_async(args=(event.slug,))
-            if event.current_schedule:
-                task_periodic_schedule_export.apply_async(args=(event.slug,))
             event.update_review_phase()
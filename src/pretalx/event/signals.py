@@ -0,0 +1,36 @@
+from django.db import models
+from django.dispatch import receiver
+
+from pretalx.common.models.settings import (
+    GlobalSettings_SettingsStore,
+    clear_settings_snapshot,
+)
+from pretalx.event.models.event import Event_SettingsStore
+
+
+@receiver(
+    models.signals.post_save,
+    sender=Event_SettingsStore,
+    dispatch_uid="event_settings_snapshot_save",
+)
+@receiver(
+    models.signals.post_delete,
+    sender=Event_SettingsStore,
+    dispatch_uid="event_settings_snapshot_delete",
+)
+def clear_event_settings_snapshot(sender, instance, **kwargs):
+    clear_settings_snapshot(instance.object)
+
+
+@receiver(
+    models.signals.post_save,
+    sender=GlobalSettings_SettingsStore,
+    dispatch_uid="global_settings_snapshot_save",
+)
+@receiver(
+    models.signals.post_delete,
+    sender=GlobalSettings_SettingsStore,
+    dispatch_uid="global_settings_snapshot_delete",
+)
+def clear_global_settings_snapshot(sender, instance, **kwargs):
+    clear_settings_snapshot()
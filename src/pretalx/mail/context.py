@@ -33,23 +33,41 @@ def get_context_explanation():
     ]
 
 
-def template_context_from_event(event):
+def template_context_from_event(event, url_builder=None):
     return {
-        "all_submissions_url": event.urls.user_submissions.full(),
+        "all_submissions_url": url_builder.event_url("user_submissions", full=True)
+        if url_builder
+        else event.urls.user_submissions.full(),
         "event_name": event.name,
     }
 
 
-def template_context_from_submission(submission):
-    context = template_context_from_event(submission.event)
+def template_context_from_submission(submission, url_builder=None):
+    """Returns the mail context of a submission.
+
+    Pass an :class:`~pretalx.common.urls.EventUrlBuilder` when building
+    the context for many submissions of the same event.
+    """
+    context = template_context_from_event(submission.event, url_builder=url_builder)
+    if url_builder:
+        code = submission.code
+        urls = {
+            "confirmation_link": url_builder.submission_url(code, "confirm", full=True),
+            "submission_url": url_builder.submission_url(code, "user_base", full=True),
+            "orga_url": url_builder.submission_orga_url(code, full=True),
+        }
+    else:
+        urls = {
+            "confirmation_link": submission.urls.confirm.full(),
+            "submission_url": submission.urls.user_base.full(),
+            "orga_url": submission.orga_urls.base.full(),
+        }
     context.update(
         {
-            "confirmation_link": submission.urls.confirm.full(),
             "submission_title": submission.title,
-            "submission_url": submission.urls.user_base.full(),
             "speakers": submission.display_speaker_names,
-            "orga_url": submission.orga_urls.base.full(),
             "track_name": str(submission.track.name) if submission.track else None,
+            **urls,
         }
     )
     return context
@@ -0,0 +1,19 @@
+# Generated by Django 2.2.28 on 2026-10-19 01:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("mail", "0007_auto_20190327_2241"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="queuedmail",
+            index=models.Index(
+                fields=["event", "sent"], name="mail_queued_event_i_48c5f9_idx"
+            ),
+        ),
+    ]
@@ -195,6 +195,11 @@ class QueuedMail(LogMixin, models.Model):
 
     objects = ScopedManager(event="event")
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["event", "sent"]),
+        ]
+
     class urls(EventUrls):
         base = edit = "{self.event.orga_urls.mail}{self.pk}/"
         delete = "{base}delete"
@@ -1,5 +1,4 @@
 import datetime as dt
-import xml.etree.ElementTree as ET
 
 from django.core.management.base import BaseCommand
 from django.db import transaction
@@ -15,20 +14,17 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument("path", type=str)
 
-    @transaction.atomic
     def handle(self, *args, **options):
+        from pretalx.schedule.importers import read_frab_header
         from pretalx.schedule.utils import process_frab
 
         path = options.get("path")
-        tree = ET.parse(path)
-        root = tree.getroot()
-
-        event_data = root.find("conference")
+        __, event_data = read_frab_header(path)
         event = Event.objects.filter(
             slug__iexact=event_data.find("acronym").text
         ).first()
 
-        with scopes_disabled():
+        with scopes_disabled(), transaction.atomic():
             if not event:
                 event = self.create_event(event_data)
             team = event.organiser.teams.filter(
@@ -53,7 +49,7 @@ class Command(BaseCommand):
                 team.members.add(user)
             team.save()
 
-        self.stdout.write(self.style.SUCCESS(process_frab(root, event)))
+        self.stdout.write(self.style.SUCCESS(process_frab(path, event)))
 
     def create_event(self, event_data):
         name = event_data.find("title").text
@@ -29,6 +29,7 @@ urlpatterns = [
     url("^$", RedirectView.as_view(url="event", permanent=False)),
     url("^admin/$", admin.AdminDashboard.as_view(), name="admin.dashboard"),
     url("^admin/update/$", admin.UpdateCheckView.as_view(), name="admin.update"),
+    url("^admin/metrics/$", admin.MetricsView.as_view(), name="admin.metrics"),
     url("^me$", event.UserSettings.as_view(), name="user.view"),
     url("^me/subuser$", person.SubuserView.as_view(), name="user.subuser"),
     url(
@@ -2,13 +2,16 @@ import sys
 
 from django.conf import settings
 from django.contrib import messages
+from django.http import Http404, HttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse
+from django.utils.crypto import constant_time_compare
 from django.utils.translation import ugettext_lazy as _
-from django.views.generic import FormView, TemplateView
+from django.views.generic import FormView, TemplateView, View
 from django_context_decorator import context
 
 from pretalx.celery_app import app
+from pretalx.common.metrics import render_metrics
 from pretalx.common.mixins.views import PermissionRequired
 from pretalx.common.models.settings import GlobalSettings
 from pretalx.common.update_check import check_result_table, update_check
@@ -34,6 +37,29 @@ class AdminDashboard(PermissionRequired, TemplateView):
         return sys.executable
 
 
+class MetricsView(View):
+    """Exposes the view and task metrics in the Prometheus text format, to
+    administrators and to clients presenting the metrics token."""
+
+    def has_access(self, request):
+        if request.user.is_authenticated and request.user.is_administrator:
+            return True
+        token = settings.METRICS_TOKEN
+        header = request.META.get("HTTP_AUTHORIZATION", "")
+        return bool(token) and constant_time_compare(header, f"Bearer {token}")
+
+    def get(self, request, *args, **kwargs):
+        if not settings.METRICS_ENABLED:
+            raise Http404()
+        if not self.has_access(request):
+            response = HttpResponse(status=401)
+            response["WWW-Authenticate"] = "Bearer"
+            return response
+        return HttpResponse(
+            render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8"
+        )
+
+
 class UpdateCheckView(PermissionRequired, FormView):
     template_name = "orga/update.html"
     permission_required = "person.is_administrator"
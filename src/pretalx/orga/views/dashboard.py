@@ -1,3 +1,5 @@
+from itertools import islice
+
 from django.template.defaultfilters import timeuntil
 from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
@@ -5,6 +7,7 @@ from django.utils.translation import ngettext_lazy
 from django.views.generic import TemplateView
 from django_context_decorator import context
 
+from pretalx.common.log_archive import read_archived_log_entries
 from pretalx.common.mixins.views import EventPermissionRequired, PermissionRequired
 from pretalx.common.models.log import ActivityLog
 from pretalx.event.models import Organiser
@@ -88,7 +91,13 @@ class EventDashboardView(EventPermissionRequired, TemplateView):
 
     @context
     def history(self):
-        return ActivityLog.objects.filter(event=self.request.event)[:20]
+        history = list(ActivityLog.objects.filter(event=self.request.event)[:20])
+        if len(history) < 20:
+            history += islice(
+                read_archived_log_entries(self.request.event, newest_first=True),
+                20 - len(history),
+            )
+        return history
 
     def get_context_data(self, **kwargs):
         result = super().get_context_data(**kwargs)
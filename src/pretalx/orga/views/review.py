@@ -16,7 +16,8 @@ from pretalx.common.phrases import phrases
 from pretalx.common.views import CreateOrUpdateView
 from pretalx.orga.forms import ReviewForm
 from pretalx.submission.forms import QuestionsForm, SubmissionFilterForm
-from pretalx.submission.models import Review, Submission, SubmissionStates
+from pretalx.submission.models import Review, SubmissionStates
+from pretalx.submission.services import change_submission_states
 
 
 class ReviewDashboard(EventPermissionRequired, Filterable, ListView):
@@ -152,24 +153,44 @@ class ReviewDashboard(EventPermissionRequired, Filterable, ListView):
     @transaction.atomic
     def post(self, request, *args, **kwargs):
         total = {"accept": 0, "reject": 0, "error": 0}
+        actions = {
+            "accept": SubmissionStates.ACCEPTED,
+            "reject": SubmissionStates.REJECTED,
+        }
+        requested = {"accept": [], "reject": []}
         for key, value in request.POST.items():
-            if not key.startswith("s-") or value not in ["accept", "reject"]:
+            if not key.startswith("s-") or value not in actions:
                 continue
             pk = key.strip("s-")
-            try:
-                submission = request.event.submissions.filter(
-                    state=SubmissionStates.SUBMITTED
-                ).get(pk=pk)
-            except (Submission.DoesNotExist, ValueError):
+            if not pk.isdigit():
                 total["error"] += 1
                 continue
-            if not request.user.has_perm(
-                "submission." + value + "_submission", submission
-            ):
-                total["error"] += 1
+            requested[value].append(int(pk))
+        submissions = {
+            submission.pk: submission
+            for submission in request.event.submissions.filter(
+                state=SubmissionStates.SUBMITTED,
+                pk__in=requested["accept"] + requested["reject"],
+            )
+            .select_related("track")
+            .prefetch_related("speakers")
+        }
+        # The permission only depends on the event, not on the submission
+        if submissions and not request.user.has_perm(
+            "submission.accept_or_reject_submissions", next(iter(submissions.values()))
+        ):
+            submissions = {}
+        for value, pks in requested.items():
+            if not pks:
                 continue
-            getattr(submission, value)(person=request.user)
-            total[value] += 1
+            changed, failed = change_submission_states(
+                request.event,
+                [submissions[pk] for pk in pks if pk in submissions],
+                actions[value],
+                person=request.user,
+            )
+            total[value] += len(changed)
+            total["error"] += len(pks) - len(changed)
         if not total["accept"] and not total["reject"] and not total["error"]:
             messages.success(request, _("There was nothing to do."))
         elif total["accept"] or total["reject"]:
@@ -6,8 +6,10 @@ import dateutil.parser
 from csp.decorators import csp_update
 from django.conf import settings
 from django.contrib import messages
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
 from django.db.models.deletion import ProtectedError
-from django.http import FileResponse, Http404, JsonResponse
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse
 from django.shortcuts import redirect
 from django.utils.decorators import method_decorator
 from django.utils.functional import cached_property
@@ -15,17 +17,18 @@ from django.utils.translation import gettext_lazy as _
 from django.views.generic import FormView, TemplateView, UpdateView, View
 from django_context_decorator import context
 from i18nfield.strings import LazyI18nString
-from i18nfield.utils import I18nJSONEncoder
 
 from pretalx.agenda.management.commands.export_schedule_html import get_export_zip_path
 from pretalx.agenda.tasks import export_schedule_html
 from pretalx.api.serializers.room import AvailabilitySerializer
+from pretalx.common.exporter import get_exporters
 from pretalx.common.mixins.views import (
     ActionFromUrl,
     EventPermissionRequired,
     PermissionRequired,
 )
-from pretalx.common.signals import register_data_exporters
+from pretalx.common.serialize import dumps
+from pretalx.common.urls import EventUrlBuilder
 from pretalx.common.utils import safe_filename
 from pretalx.common.views import CreateOrUpdateView
 from pretalx.orga.forms.schedule import ScheduleReleaseForm
@@ -57,10 +60,10 @@ class ScheduleExportView(EventPermissionRequired, TemplateView):
 
     @context
     def exporters(self):
-        return list(
+        return [
             exporter(self.request.event)
-            for _, exporter in register_data_exporters.send(self.request.event)
-        )
+            for exporter in get_exporters(self.request.event).values()
+        ]
 
 class SchedulePreviewView(EventPermissionRequired, TemplateView):
     template_name = "orga/schedule/preview.html"
@@ -229,7 +232,7 @@ def serialize_break(slot):
     }
 
 
-def serialize_slot(slot):
+def serialize_slot(slot, url_builder=None):
     base_data = serialize_break(slot)
     if slot.submission:
         submission_data = {
@@ -256,45 +259,114 @@ def serialize_slot(slot):
             "room": slot.room.pk if slot.room else None,
             "start": slot.start.isoformat() if slot.start else None,
             "end": slot.end.isoformat() if slot.end else None,
-            "url": slot.submission.orga_urls.base,
+            "url": url_builder.submission_orga_url(slot.submission.code)
+            if url_builder
+            else slot.submission.orga_urls.base,
             "warnings": slot.warnings,
         }
         return {**base_data, **submission_data}
     return base_data
 
 
+def update_slot(talk, data, event, change_counter):
+    """Moves a slot according to the data sent by the schedule editor, or
+    unschedules it if no start is given, and records the change with the
+    given value of the schedule's change counter."""
+    talk.change_counter = change_counter
+    if data.get("start"):
+        duration = talk.duration
+        talk.start = dateutil.parser.parse(data.get("start"))
+        if data.get("end"):
+            talk.end = dateutil.parser.parse(data["end"])
+        elif data.get("duration"):
+            talk.end = talk.start + dt.timedelta(minutes=int(data["duration"]))
+        elif not talk.submission:
+            talk.end = talk.start + dt.timedelta(minutes=duration or 30)
+        else:
+            talk.end = talk.start + dt.timedelta(
+                minutes=talk.submission.get_duration()
+            )
+        if "room" in data:
+            room = data["room"]
+            talk.room = event.rooms.get(pk=room) if room else None
+        if not talk.submission:
+            talk.description = LazyI18nString(data.get("description", ""))
+        talk.save(
+            update_fields=["start", "end", "room", "description", "change_counter"]
+        )
+    else:
+        talk.start = None
+        talk.end = None
+        talk.room = None
+        talk.save(update_fields=["start", "end", "room", "change_counter"])
+
+
+def mark_related_slots_changed(schedule, talks, change_counter):
+    """Marks the other slots of the speakers of the given slots as changed,
+    as their warnings may have changed, too."""
+    talk_ids = [talk.pk for talk in talks]
+    submission_ids = [talk.submission_id for talk in talks if talk.submission_id]
+    if not submission_ids:
+        return
+    related = (
+        schedule.talks.filter(submission__speakers__submissions__in=submission_ids)
+        .exclude(pk__in=talk_ids)
+        .values_list("pk", flat=True)
+        .distinct()
+    )
+    related = list(related)
+    if related:
+        schedule.talks.filter(pk__in=related).update(change_counter=change_counter)
+
+
 class TalkList(EventPermissionRequired, View):
     permission_required = "orga.edit_schedule"
 
+    def get_schedule(self):
+        version = self.request.GET.get("version")
+        if version:
+            return self.request.event.schedules.filter(version=version).first()
+        return self.request.event.wip_schedule
+
     def get(self, request, event):
+        """Returns all slots of the schedule, or, if a valid ``since`` token is
+        given, only the slots changed since then, and the IDs of the slots
+        deleted since then."""
+        schedule = self.get_schedule()
+        since = schedule.parse_change_token(request.GET.get("since"))
         result = {
             "start": request.event.datetime_from.isoformat(),
             "end": request.event.datetime_to.isoformat(),
             "timezone": request.event.timezone,
             "locales": request.event.locales,
+            "change_token": schedule.change_token,
+            "full": since is None,
             "results": [],
+            "deleted": [],
         }
-        version = self.request.GET.get("version")
-        if version:
-            schedule = request.event.schedules.filter(version=version).first()
-        else:
-            schedule = request.event.wip_schedule
+        talks = schedule.talks.all()
+        if since is not None:
+            talks = talks.filter(change_counter__gt=since)
+            result["deleted"] = list(
+                schedule.tombstones.filter(change_counter__gt=since).values_list(
+                    "slot_id", flat=True
+                )
+            )
 
+        url_builder = EventUrlBuilder(request.event)
         result["results"] = [
-            serialize_slot(slot)
+            serialize_slot(slot, url_builder=url_builder)
             for slot in (
-                schedule.talks.all()
-                .select_related(
+                talks.select_related(
                     "submission",
                     "submission__event",
                     "room",
                     "submission__submission_type",
                     "submission__track",
-                )
-                .prefetch_related("submission__speakers")
+                ).prefetch_related("submission__speakers")
             )
         ]
-        return JsonResponse(result, encoder=I18nJSONEncoder)
+        return HttpResponse(dumps(result), content_type="application/json")
 
     def post(self, request, event):
         data = json.loads(request.body.decode())
@@ -310,8 +382,10 @@ class TalkList(EventPermissionRequired, View):
         )
         room = data.get("room")
         room = room.get("id") if isinstance(room, dict) else room
+        schedule = request.event.wip_schedule
         slot = TalkSlot.objects.create(
-            schedule=request.event.wip_schedule,
+            schedule=schedule,
+            change_counter=schedule.bump_change_counter(),
             room=request.event.rooms.get(pk=room)
             if room
             else request.event.rooms.first(),
@@ -321,6 +395,39 @@ class TalkList(EventPermissionRequired, View):
         )
         return JsonResponse(serialize_break(slot))
 
+    def patch(self, request, event):
+        """Moves many slots at once: expects a list of objects with an ``id``
+        and the same fields that ``TalkUpdate.patch`` accepts."""
+        if not request.user.has_perm("orga.schedule_talk", request.event):
+            raise PermissionDenied()
+        try:
+            data = {int(entry["id"]): entry for entry in json.loads(request.body)}
+        except (KeyError, TypeError, ValueError):
+            return JsonResponse({"error": "Invalid data"}, status=400)
+        schedule = request.event.wip_schedule
+        talks = schedule.talks.filter(pk__in=data.keys()).select_related(
+            "submission", "submission__submission_type", "schedule"
+        )
+        if len(talks) != len(data):
+            return JsonResponse({"error": "Talk not found"}, status=404)
+        with transaction.atomic():
+            change_counter = schedule.bump_change_counter()
+            for talk in talks:
+                update_slot(talk, data[talk.pk], request.event, change_counter)
+            mark_related_slots_changed(schedule, talks, change_counter)
+        url_builder = EventUrlBuilder(request.event)
+        return HttpResponse(
+            dumps(
+                {
+                    "change_token": schedule.change_token,
+                    "results": [
+                        serialize_slot(talk, url_builder=url_builder) for talk in talks
+                    ],
+                }
+            ),
+            content_type="application/json",
+        )
+
 
 class TalkUpdate(PermissionRequired, View):
     permission_required = "orga.schedule_talk"
@@ -338,31 +445,11 @@ class TalkUpdate(PermissionRequired, View):
         if not talk:
             return JsonResponse({"error": "Talk not found"})
         data = json.loads(request.body.decode())
-        if data.get("start"):
-            duration = talk.duration
-            talk.start = dateutil.parser.parse(data.get("start"))
-            if data.get("end"):
-                talk.end = dateutil.parser.parse(data["end"])
-            elif data.get("duration"):
-                talk.end = talk.start + dt.timedelta(minutes=int(data["duration"]))
-            elif not talk.submission:
-                talk.end = talk.start + dt.timedelta(minutes=duration or 30)
-            else:
-                talk.end = talk.start + dt.timedelta(
-                    minutes=talk.submission.get_duration()
-                )
-            if "room" in data:
-                room = data["room"]
-                talk.room = request.event.rooms.get(pk=room) if room else None
-            if not talk.submission:
-                talk.description = LazyI18nString(data.get("description", ""))
-            talk.save(update_fields=["start", "end", "room", "description"])
-        else:
-            talk.start = None
-            talk.end = None
-            talk.room = None
-            talk.save(update_fields=["start", "end", "room"])
-
+        schedule = request.event.wip_schedule
+        with transaction.atomic():
+            change_counter = schedule.bump_change_counter()
+            update_slot(talk, data, request.event, change_counter)
+            mark_related_slots_changed(schedule, [talk], change_counter)
         return JsonResponse(serialize_slot(talk))
 
     def delete(self, request, event, pk):
@@ -391,6 +478,8 @@ class QuickScheduleView(PermissionRequired, UpdateView):
         ).first()
 
     def form_valid(self, form):
+        schedule = self.request.event.wip_schedule
+        form.instance.change_counter = schedule.bump_change_counter()
         form.save()
         messages.success(self.request, _("The talk has been scheduled."))
         return super().form_valid(form)
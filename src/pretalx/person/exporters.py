@@ -1,6 +1,8 @@
+from django.db.models import Exists, OuterRef
 from django.utils.translation import gettext_lazy as _
 
 from pretalx.common.exporter import BaseExporter, CSVExporterMixin
+from pretalx.person.models import User
 from pretalx.submission.models import SubmissionStates
 
 
@@ -20,21 +22,27 @@ class CSVSpeakerExporter(CSVExporterMixin, BaseExporter):
 
     def get_data(self, **kwargs):
         fieldnames = ["name", "email", "confirmed"]
-        data = []
-        for speaker in self.event.submitters:
-            accepted_talks = speaker.submissions.filter(
-                event=self.event, state=SubmissionStates.ACCEPTED
-            ).exists()
-            confirmed_talks = speaker.submissions.filter(
-                event=self.event, state=SubmissionStates.CONFIRMED
-            ).exists()
-            if not accepted_talks and not confirmed_talks:
-                continue
-            data.append(
-                {
-                    "name": speaker.get_display_name(),
-                    "email": speaker.email,
-                    "confirmed": str(bool(confirmed_talks)),
-                }
+        submissions = self.event.submissions.filter(
+            state__in=[SubmissionStates.ACCEPTED, SubmissionStates.CONFIRMED]
+        )
+        speakers = (
+            User.objects.filter(submissions__in=submissions)
+            .annotate(
+                has_confirmed=Exists(
+                    submissions.filter(
+                        state=SubmissionStates.CONFIRMED, speakers=OuterRef("pk")
+                    )
+                )
             )
+            .order_by("id")
+            .distinct()
+        )
+        data = (
+            {
+                "name": speaker.get_display_name(),
+                "email": speaker.email,
+                "confirmed": str(speaker.has_confirmed),
+            }
+            for speaker in speakers.iterator()
+        )
         return fieldnames, data
@@ -0,0 +1,18 @@
+# Generated by Django 2.2.28 on 2026-10-19 00:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("person", "0022_auto_20200624_0157"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="avatar_thumbnails",
+            field=models.CharField(blank=True, max_length=50, null=True),
+        ),
+    ]
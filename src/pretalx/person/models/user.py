@@ -21,7 +21,7 @@ from django.utils.translation import override
 from django_scopes import scopes_disabled
 from rest_framework.authtoken.models import Token
 
-from pretalx.common.mixins.models import GenerateCode
+from pretalx.common.mixins.models import GenerateCode, ThumbnailMixin
 from pretalx.common.urls import build_absolute_uri
 
 
@@ -43,7 +43,7 @@ class UserManager(BaseUserManager):
         return user
 
 
-class User(PermissionsMixin, GenerateCode, AbstractBaseUser):
+class User(PermissionsMixin, GenerateCode, ThumbnailMixin, AbstractBaseUser):
     """The pretalx user model.
 
     Users describe all kinds of persons who interact with pretalx: Organisers, reviewers, submitters, speakers.
@@ -57,12 +57,15 @@ class User(PermissionsMixin, GenerateCode, AbstractBaseUser):
         the ``set_password`` and ``check_password`` methods to interact with it.
     :param nick: The nickname field has been deprecated and is scheduled to be
         deleted. Use the email field instead.
+    :param avatar_thumbnails: Set automatically once the thumbnails of the
+        avatar have been generated, see :mod:`pretalx.common.images`.
     :param groups: Django internals, not used in pretalx.
     :param user_permissions: Django internals, not used in pretalx.
     """
 
     EMAIL_FIELD = "email"
     USERNAME_FIELD = "email"
+    _thumbnail_fields = ("avatar",)
 
     objects = UserManager()
 
@@ -111,6 +114,7 @@ class User(PermissionsMixin, GenerateCode, AbstractBaseUser):
         verbose_name=_("Profile picture"),
         help_text=_("If possible, upload an image that is least 120 pixels wide."),
     )
+    avatar_thumbnails = models.CharField(max_length=50, null=True, blank=True)
     twitter = models.CharField(
         verbose_name=_("Twitter Handle"),
         null=True,
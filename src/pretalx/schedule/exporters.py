@@ -1,16 +1,17 @@
 import datetime as dt
-import json
 from urllib.parse import urlparse
 
 import pytz
-import vobject
-from django.template.loader import get_template
+from django.utils import timezone
 from django.utils.functional import cached_property
-from i18nfield.utils import I18nJSONEncoder
+from django.utils.html import conditional_escape as escape
 
 from pretalx import __version__
 from pretalx.common.exporter import BaseExporter
+from pretalx.common.serialize import dumps
+from pretalx.common.templatetags.xmlescape import xmlescape
 from pretalx.common.urls import get_base_url
+from pretalx.schedule.ical import get_netloc, render_ical
 
 
 class ScheduleData(BaseExporter):
@@ -105,36 +106,200 @@ class ScheduleData(BaseExporter):
         return data.values()
 
 
+def localtime(value):
+    """Converts aware datetimes to the current time zone, as the template
+    engine does before formatting them."""
+    if value and timezone.is_aware(value):
+        return timezone.localtime(value)
+    return value
+
+
+def isoformat(value):
+    return value.isoformat() if value else ""
+
+
+def pentabarf_datetime(value):
+    if not value:
+        return ""
+    value = localtime(value)
+    return (
+        f"{value.year}{value.month:02}{value.day:02}"
+        f"T{value.hour:02}{value.minute:02}{value.second:02}"
+    )
+
+
 class FrabXmlExporter(ScheduleData):
+    """Writes the frab XML schedule directly, with the same output as the
+    ``agenda/schedule.xml`` template, which is kept as reference."""
+
     identifier = "schedule.xml"
     verbose_name = "XML (frab compatible)"
     public = True
     show_qrcode = True
     icon = "fa-code"
 
+    def iter_xml(self):
+        event = self.event
+        version = escape(__version__)
+        base_url = escape(get_base_url(event))
+        schedule_version = xmlescape(getattr(self.schedule, "version", ""))
+        metadata_url = escape(self.metadata["base_url"]) if self.schedule else ""
+        yield (
+            "<?xml version='1.0' encoding='utf-8' ?>\n"
+            f"<!-- Made with love by pretalx v{version}. -->\n"
+            "<schedule>\n"
+            f'    <generator name="pretalx" version="{version}" />\n'
+            f"    <version>{schedule_version}</version>\n"
+            "    <conference>\n"
+            f"        <acronym>{escape(event.slug)}</acronym>\n"
+            f"        <title>{xmlescape(event.name)}</title>\n"
+            f"        <start>{isoformat(event.date_from)}</start>\n"
+            f"        <end>{isoformat(event.date_to)}</end>\n"
+            f"        <days>{event.duration}</days>\n"
+            "        <timeslot_duration>00:05</timeslot_duration>\n"
+            f"        <base_url>{metadata_url}</base_url>\n"
+            "    </conference>\n"
+            "    "
+        )
+        for day in self.data:
+            yield (
+                f"<day index='{day['index']}' date='{isoformat(day['start'].date())}' "
+                f"start='{isoformat(localtime(day['start']))}' "
+                f"end='{isoformat(localtime(day['end']))}'>\n"
+                "        "
+            )
+            for room in day["rooms"]:
+                room_name = xmlescape(room["name"])
+                yield f"<room name='{room_name}'>\n            "
+                for talk in room["talks"]:
+                    submission = talk.submission
+                    start = localtime(talk.start)
+                    track = escape(submission.track.name) if submission.track else ""
+                    persons = "".join(
+                        f"<person id='{person.id}'>"
+                        f"{xmlescape(person.get_display_name())}</person>"
+                        for person in submission.speakers.all()
+                    )
+                    yield (
+                        f"<event guid='{escape(submission.uuid)}' id='{submission.id}'>\n"
+                        f"                <date>{isoformat(start)}</date>\n"
+                        f"                <start>{start:%H:%M}</start>\n"
+                        f"                <duration>{escape(talk.export_duration)}</duration>\n"
+                        f"                <room>{room_name}</room>\n"
+                        f"                <slug>{escape(submission.frab_slug)}</slug>\n"
+                        f"                <url>{base_url}{escape(submission.urls.public)}</url>\n"
+                        "                <recording>\n"
+                        "                    <license></license>\n"
+                        "                    <optout>"
+                        f"{'true' if submission.do_not_record else 'false'}</optout>\n"
+                        "                </recording>\n"
+                        f"                <title>{xmlescape(submission.title)}</title>\n"
+                        "                <subtitle></subtitle>\n"
+                        f"                <track>{track}</track>\n"
+                        "                <type>"
+                        f"{xmlescape(submission.submission_type.name)}</type>\n"
+                        "                <language>"
+                        f"{escape(submission.content_locale)}</language>\n"
+                        "                <abstract>"
+                        f"{xmlescape(submission.abstract)}</abstract>\n"
+                        "                <description>"
+                        f"{xmlescape(submission.description)}</description>\n"
+                        f"                <logo>{escape(submission.urls.image)}</logo>\n"
+                        "                <persons>\n"
+                        f"                    {persons}\n"
+                        "                </persons>\n"
+                        "                <links></links>\n"
+                        "                <attachments></attachments>\n"
+                        "            </event>\n"
+                        "            "
+                    )
+                yield "\n        </room>\n        "
+            yield "\n    </day>\n    "
+        yield "\n</schedule>\n"
+
     def render(self, **kwargs):
-        context = {
-            "data": self.data,
-            "metadata": self.metadata,
-            "schedule": self.schedule,
-            "event": self.event,
-            "version": __version__,
-            "base_url": get_base_url(self.event),
-        }
-        content = get_template("agenda/schedule.xml").render(context=context)
+        content = "".join(self.iter_xml())
         return f"{self.event.slug}-schedule.xml", "text/xml", content
 
 
 class FrabXCalExporter(ScheduleData):
+    """Writes the frab XCal schedule directly, with the same output as the
+    ``agenda/schedule.xcal`` template, which is kept as reference."""
+
     identifier = "schedule.xcal"
     verbose_name = "XCal (frab compatible)"
     public = True
     icon = "fa-calendar"
 
+    def iter_xcal(self):
+        event = self.event
+        url = get_base_url(event)
+        domain = escape(urlparse(url).netloc)
+        url = escape(url)
+        # UIDs and slugs never contained the event slug, as the template used
+        # to refer to request.event without a request. They have to stay
+        # stable, or calendar clients show every talk twice.
+        yield (
+            "<?xml version='1.0' encoding='utf-8' ?>\n"
+            "<iCalendar xmlns:pentabarf='http://pentabarf.org' "
+            "xmlns:xCal='urn:ietf:params:xml:ns:xcal'>\n"
+            "    <vcalendar>\n"
+            "        <version>2.0</version>\n"
+            "        <prodid>-//Pentabarf//Schedule//EN</prodid>\n"
+            f"        <x-wr-caldesc>{escape(event.name)}</x-wr-caldesc>\n"
+            f"        <x-wr-calname>{escape(event.name)}</x-wr-calname>\n"
+            "        "
+        )
+        for day in self.data:
+            for room in day["rooms"]:
+                room_name = escape(room["name"])
+                for talk in room["talks"]:
+                    submission = talk.submission
+                    code = escape(submission.code)
+                    title = escape(submission.title)
+                    locale = escape(submission.content_locale)
+                    description = submission.description
+                    attendees = "".join(
+                        "\n            <attendee>"
+                        f"{escape(person.get_display_name())}</attendee>\n            "
+                        for person in submission.speakers.all()
+                    )
+                    yield (
+                        "\n        <vevent>\n"
+                        "            <method>PUBLISH</method>\n"
+                        f"            <uid>{code}@@{domain}</uid>\n"
+                        "            <pentabarf:event-id>"
+                        f"{submission.integer_uuid}</pentabarf:event-id>\n"
+                        "            <pentabarf:event-slug>"
+                        f"-{code}</pentabarf:event-slug>\n"
+                        f"            <pentabarf:title>{title}</pentabarf:title>\n"
+                        "            <pentabarf:subtitle></pentabarf:subtitle>\n"
+                        "            <pentabarf:language>"
+                        f"{locale}</pentabarf:language>\n"
+                        "            <pentabarf:language-code>"
+                        f"{locale}</pentabarf:language-code>\n"
+                        f"            <dtstart>{pentabarf_datetime(talk.start)}</dtstart>\n"
+                        f"            <dtend>{pentabarf_datetime(talk.end)}</dtend>\n"
+                        "            <duration>"
+                        f"{escape(talk.pentabarf_export_duration)}</duration>\n"
+                        f"            <summary>{title}</summary>\n"
+                        "            <description>"
+                        f"{escape(description if description is not None else '')}"
+                        "</description>\n"
+                        "            <class>PUBLIC</class>\n"
+                        "            <status>CONFIRMED</status>\n"
+                        "            <category>"
+                        f"{escape(submission.submission_type.name)}</category>\n"
+                        f"            <url>{url}{escape(submission.urls.public)}</url>\n"
+                        f"            <location>{room_name}</location>\n"
+                        f"            {attendees}\n"
+                        "        </vevent>\n"
+                        "        "
+                    )
+        yield "\n    </vcalendar>\n</iCalendar>\n"
+
     def render(self, **kwargs):
-        url = get_base_url(self.event)
-        context = {"data": self.data, "url": url, "domain": urlparse(url).netloc}
-        content = get_template("agenda/schedule.xcal").render(context=context)
+        content = "".join(self.iter_xcal())
         return f"{self.event.slug}.xcal", "text/xml", content
 
 
@@ -167,7 +332,7 @@ class FrabJsonExporter(ScheduleData):
                             str(room["name"]): [
                                 {
                                     "id": talk.submission.id,
-                                    "guid": talk.submission.uuid,
+                                    "guid": str(talk.submission.uuid),
                                     "logo": talk.submission.urls.image,
                                     "date": talk.start.astimezone(tz).isoformat(),
                                     "start": talk.start.astimezone(tz).strftime(
@@ -176,7 +341,9 @@ class FrabJsonExporter(ScheduleData):
                                     "duration": talk.export_duration,
                                     "room": str(room["name"]),
                                     "slug": talk.submission.code,
-                                    "url": talk.submission.urls.public.full(),
+                                    "url": self.url_builder.submission_url(
+                                        talk.submission.code, full=True
+                                    ),
                                     "title": talk.submission.title,
                                     "subtitle": "",
                                     "track": str(talk.submission.track.name)
@@ -205,7 +372,7 @@ class FrabJsonExporter(ScheduleData):
                                                     "question": answer.question.id,
                                                     "answer": answer.answer,
                                                     "options": [
-                                                        option.answer
+                                                        option.answer.data
                                                         for option in answer.options.all()
                                                     ],
                                                 }
@@ -223,7 +390,7 @@ class FrabJsonExporter(ScheduleData):
                                             "question": answer.question.id,
                                             "answer": answer.answer,
                                             "options": [
-                                                option.answer
+                                                option.answer.data
                                                 for option in answer.options.all()
                                             ],
                                         }
@@ -247,7 +414,7 @@ class FrabJsonExporter(ScheduleData):
         return (
             f"{self.event.slug}.json".format(self.event.slug),
             "application/json",
-            json.dumps({"schedule": content}, cls=I18nJSONEncoder),
+            dumps({"schedule": content}).decode(),
         )
 
 
@@ -263,18 +430,12 @@ class ICalExporter(BaseExporter):
         self.schedule = schedule
 
     def render(self, **kwargs):
-        netloc = urlparse(get_base_url(self.event)).netloc
-        cal = vobject.iCalendar()
-        cal.add("prodid").value = "-//pretalx//{}//".format(netloc)
-        creation_time = dt.datetime.now(pytz.utc)
-
-        talks = (
-            self.schedule.talks.filter(is_visible=True)
-            .prefetch_related("submission__speakers")
-            .select_related("submission", "room", "submission__event")
-            .order_by("start")
+        netloc = get_netloc(self.event)
+        content = render_ical(
+            self.event,
+            self.schedule.talks.filter(is_visible=True),
+            prodid=f"-//pretalx//{netloc}//",
+            netloc=netloc,
+            url_builder=self.url_builder,
         )
-        for talk in talks:
-            talk.build_ical(cal, creation_time=creation_time, netloc=netloc)
-
-        return f"{self.event.slug}.ics", "text/calendar", cal.serialize()
+        return f"{self.event.slug}.ics", "text/calendar", content
@@ -0,0 +1,149 @@
+"""A small iCalendar (RFC 5545) writer for schedule feeds.
+
+Building a full object tree per event (as general purpose iCal libraries
+do) is slow for large schedules, so we write the few properties our
+feeds need straight from the database rows, line by line.
+"""
+
+import datetime as dt
+from collections import defaultdict
+from urllib.parse import urlparse
+
+import pytz
+from django.utils.translation import get_language
+
+from pretalx.common.urls import EventUrlBuilder, get_base_url
+
+CRLF = "\r\n"
+MAX_LINE_OCTETS = 75
+
+
+def escape_text(value) -> str:
+    """Escapes a value for use in a TEXT property."""
+    return (
+        str(value or "")
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+        .replace("\r", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """Returns a content line terminated with CRLF, folded after at most 75
+    octets without splitting UTF-8 sequences."""
+    if len(line.encode()) <= MAX_LINE_OCTETS:
+        return line + CRLF
+    parts = []
+    current = []
+    current_length = 0
+    limit = MAX_LINE_OCTETS
+    for char in line:
+        char_length = len(char.encode())
+        if current_length + char_length > limit:
+            parts.append("".join(current))
+            current = []
+            current_length = 0
+            limit = MAX_LINE_OCTETS - 1  # Continuation lines start with a space
+        current.append(char)
+        current_length += char_length
+    parts.append("".join(current))
+    return (CRLF + " ").join(parts) + CRLF
+
+
+def format_datetime(value) -> str:
+    return value.astimezone(pytz.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def get_netloc(event) -> str:
+    return urlparse(get_base_url(event)).netloc
+
+
+def get_speaker_names(submission_ids) -> dict:
+    """Maps submission IDs to their comma separated speaker names, with one
+    query for all submissions."""
+    from pretalx.submission.models import Submission
+
+    names = defaultdict(list)
+    speakers = (
+        Submission.speakers.through.objects.filter(submission_id__in=submission_ids)
+        .order_by("pk")
+        .values_list("submission_id", "user__name")
+    )
+    for submission_id, name in speakers:
+        names[submission_id].append(name or "Unnamed user")
+    return {key: ", ".join(value) for key, value in names.items()}
+
+
+def write_ical(event, slots, prodid, netloc=None, creation_time=None, url_builder=None):
+    """Yields the lines of an iCalendar file containing one VEVENT per slot.
+
+    :param slots: A :class:`~pretalx.schedule.models.slot.TalkSlot`
+        queryset. Slots without room, start or end are skipped.
+    :param prodid: The calendar's product identifier.
+    :param netloc: The host name used in the event UIDs, defaults to the
+        event's domain.
+    :param url_builder: An :class:`~pretalx.common.urls.EventUrlBuilder` to
+        reuse, if the caller has one already.
+    """
+    netloc = netloc or get_netloc(event)
+    creation_time = format_datetime(creation_time or dt.datetime.now(pytz.utc))
+    url_builder = url_builder or EventUrlBuilder(event)
+    uid_prefix = f"pretalx-{event.slug}-"
+    rows = list(
+        slots.filter(room__isnull=False, start__isnull=False, end__isnull=False)
+        .order_by("start", "pk")
+        .values_list(
+            "submission_id",
+            "submission__code",
+            "submission__title",
+            "submission__abstract",
+            "room__name",
+            "start",
+            "end",
+        )
+    )
+    speaker_names = get_speaker_names({row[0] for row in rows})
+
+    yield "BEGIN:VCALENDAR" + CRLF
+    yield "VERSION:2.0" + CRLF
+    yield fold_line(f"PRODID:{escape_text(prodid)}")
+    for submission_id, code, title, abstract, room, start, end in rows:
+        yield "BEGIN:VEVENT" + CRLF
+        yield fold_line(f"UID:{uid_prefix}{code}@{netloc}")
+        yield f"DTSTAMP:{creation_time}" + CRLF
+        yield f"DTSTART:{format_datetime(start)}" + CRLF
+        yield f"DTEND:{format_datetime(end)}" + CRLF
+        yield fold_line(
+            "SUMMARY:"
+            + escape_text(f"{title} - {speaker_names.get(submission_id, '')}")
+        )
+        yield fold_line("LOCATION:" + escape_text(room))
+        yield fold_line("DESCRIPTION:" + escape_text(abstract))
+        yield fold_line("URL:" + url_builder.submission_url(code, full=True))
+        yield "END:VEVENT" + CRLF
+    yield "END:VCALENDAR" + CRLF
+
+
+def render_ical(*args, **kwargs) -> str:
+    return "".join(write_ical(*args, **kwargs))
+
+
+def get_cached_ical(event, name, slots, prodid, timeout=3600) -> str:
+    """Returns the rendered calendar for the event's current schedule,
+    cached per schedule version and language.
+
+    The cache is shared with the public API responses, so it is cleared
+    whenever the public data of the event changes.
+    """
+    from pretalx.api.mixins import get_public_api_cache
+
+    cache = get_public_api_cache(event)
+    key = f"ical:{name}:{event.current_schedule.pk}:{get_language()}"
+    content = cache.get(key)
+    if content is None:
+        content = render_ical(event, slots, prodid=prodid)
+        cache.set(key, content, timeout)
+    return content
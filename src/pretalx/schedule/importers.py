@@ -0,0 +1,357 @@
+"""Imports schedules from frab XML files.
+
+The file is read as a stream, so that large files never have to be held
+in memory at once. Talks are collected in batches, and every batch is
+written with a fixed number of queries, in its own transaction. Rooms,
+submission types, tracks and speakers are cached for the whole import.
+
+If an import fails, the talks imported so far stay in the WIP schedule.
+As talks are matched by their codes, the import can simply be repeated.
+"""
+
+import datetime as dt
+import xml.etree.ElementTree as ET
+from contextlib import suppress
+
+from dateutil.parser import parse
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Upper
+from django_scopes import scope, scopes_disabled
+
+from pretalx.person.models import SpeakerProfile, User
+from pretalx.schedule.models import Room, TalkSlot
+from pretalx.submission.models import (
+    Submission,
+    SubmissionStates,
+    SubmissionType,
+    Track,
+)
+
+BATCH_SIZE = 200
+SUBMISSION_FIELDS = (
+    "submission_type",
+    "track",
+    "title",
+    "description",
+    "abstract",
+    "content_locale",
+    "do_not_record",
+    "state",
+)
+
+
+def read_frab_header(source):
+    """Returns the schedule version and the ``conference`` element of a frab
+    XML file, without reading the talks."""
+    version = conference = None
+    for __, element in ET.iterparse(source):
+        if element.tag == "version" and version is None:
+            version = element.text
+        elif element.tag == "conference":
+            conference = element
+        elif element.tag == "day":
+            break
+        if version is not None and conference is not None:
+            break
+    return version, conference
+
+
+def parse_frab_talk(element, room):
+    """Reads the data of one talk from a frab ``event`` element."""
+    date = element.find("date").text
+    start = parse(date + " " + element.find("start").text)
+    hours, minutes = element.find("duration").text.split(":")
+    duration = dt.timedelta(hours=int(hours), minutes=int(minutes))
+    try:
+        end = parse(date + " " + element.find("end").text)
+    except AttributeError:
+        end = start + duration
+    optout = False
+    with suppress(AttributeError):
+        optout = element.find("recording").find("optout").text == "true"
+    description = element.find("description").text
+    if element.find("subtitle").text:
+        description = element.find("subtitle").text + "\n" + (description or "")
+    return {
+        "id": element.attrib["id"],
+        "guid": element.attrib.get("guid", ""),
+        "room": room,
+        "start": start,
+        "end": end,
+        "duration": int(duration.total_seconds() // 60),
+        "type": element.find("type").text or "default",
+        "track": element.find("track").text or "default",
+        "title": element.find("title").text,
+        "description": description,
+        "abstract": element.find("abstract").text,
+        "content_locale": element.find("language").text or "en",
+        "do_not_record": optout,
+        "persons": [
+            person.text for person in element.find("persons").findall("person")
+        ],
+    }
+
+
+class FrabImporter:
+    """Imports the talks of a frab XML file into an event's WIP schedule,
+    and releases it as a new schedule version."""
+
+    def __init__(self, event, batch_size=BATCH_SIZE):
+        self.event = event
+        self.batch_size = batch_size
+        self.version = None
+        self.rooms = {str(room.name): room for room in event.rooms.all()}
+        self.submission_types = {
+            (str(submission_type.name), submission_type.default_duration): (
+                submission_type
+            )
+            for submission_type in event.submission_types.all()
+        }
+        self.tracks = {str(track.name): track for track in event.tracks.all()}
+        self.users = {}
+
+    def import_file(self, source):
+        """Reads the file and imports its talks. Returns the new schedule
+        version name."""
+        batch = []
+        path = []
+        room = None
+        root = None
+        for action, element in ET.iterparse(source, events=("start", "end")):
+            if action == "start":
+                if root is None:
+                    root = element
+                path.append(element.tag)
+                if path == ["schedule", "day"]:
+                    self.check_version()
+                elif path == ["schedule", "day", "room"]:
+                    room = self.get_room(element.attrib["name"])
+                continue
+            if path == ["schedule", "version"]:
+                self.version = element.text
+            elif path == ["schedule", "day", "room", "event"]:
+                batch.append(parse_frab_talk(element, room))
+                if len(batch) >= self.batch_size:
+                    self.import_talks(batch)
+                    batch = []
+            elif path == ["schedule", "day"]:
+                root.clear()  # Drop the talks we have already read
+            path.pop()
+        self.check_version()
+        if batch:
+            self.import_talks(batch)
+        return self.version
+
+    def check_version(self):
+        if not self.version:
+            raise Exception(
+                f'Could not import "{self.event.name}" schedule: The file has no schedule version.'
+            )
+        if self.event.schedules.filter(version=self.version).exists():
+            raise Exception(
+                f'Could not import "{self.event.name}" schedule version "{self.version}": This version exists already.'
+            )
+
+    def get_room(self, name):
+        if name not in self.rooms:
+            self.rooms[name] = Room.objects.create(event=self.event, name=name)
+        return self.rooms[name]
+
+    def get_submission_type(self, name, duration):
+        key = (name, duration)
+        if key not in self.submission_types:
+            self.submission_types[key] = SubmissionType.objects.create(
+                event=self.event, name=name, default_duration=duration
+            )
+        return self.submission_types[key]
+
+    def get_track(self, name):
+        if name not in self.tracks:
+            self.tracks[name] = Track.objects.create(event=self.event, name=name)
+        return self.tracks[name]
+
+    @transaction.atomic
+    def import_talks(self, talks):
+        submissions = self.import_submissions(talks)
+        self.import_speakers(talks, submissions)
+        self.import_slots(talks, submissions)
+
+    def import_submissions(self, talks):
+        """Updates or creates the submissions of the talks, and returns them
+        in the same order.
+
+        Talks keep their frab ID as submission code, or their GUID if the
+        ID is already used in another event.
+        """
+        candidates = {
+            code.upper()
+            for talk in talks
+            for code in (talk["id"], talk["guid"][:16])
+            if code
+        }
+        existing = {}
+        taken = set()
+        with scopes_disabled():
+            for submission in Submission.all_objects.annotate(
+                upper_code=Upper("code")
+            ).filter(upper_code__in=candidates):
+                if submission.event_id == self.event.pk:
+                    existing[submission.upper_code] = submission
+                else:
+                    taken.add(submission.upper_code)
+
+        submissions = []
+        for talk in talks:
+            submission = None
+            for code in (talk["id"], talk["guid"][:16]):
+                if not code or code.upper() in taken:
+                    continue
+                if code.upper() not in existing:
+                    existing[code.upper()] = Submission(event=self.event, code=code)
+                submission = existing[code.upper()]
+                break
+            if not submission:
+                submission = Submission(event=self.event)
+            submission.submission_type = self.get_submission_type(
+                talk["type"], talk["duration"]
+            )
+            submission.track = self.get_track(talk["track"])
+            for field in ("title", "description", "abstract", "content_locale"):
+                setattr(submission, field, talk[field])
+            submission.do_not_record = talk["do_not_record"]
+            submission.state = SubmissionStates.CONFIRMED
+            submissions.append(submission)
+
+        updated = list({s.pk: s for s in submissions if s.pk}.values())
+        Submission.all_objects.bulk_update(updated, SUBMISSION_FIELDS)
+        new_submissions = list({id(s): s for s in submissions if not s.pk}.values())
+        Submission.assign_codes(new_submissions)
+        Submission.all_objects.bulk_create(new_submissions)
+        new_pks = dict(
+            Submission.all_objects.filter(
+                event=self.event, code__in=[s.code for s in new_submissions]
+            ).values_list("code", "pk")
+        )
+        for submission in new_submissions:
+            submission.pk = new_pks[submission.code]
+            submission._state.adding = False
+        return submissions
+
+    def import_speakers(self, talks, submissions):
+        """Finds or creates users for all speakers by name, and adds them to
+        their submissions."""
+        names = {name for talk in talks for name in talk["persons"]} - set(self.users)
+        if names:
+            emails = {name: f"{name}@localhost".lower().strip() for name in names}
+            by_name = {}
+            by_email = {}
+            for user in User.objects.filter(
+                Q(name__in=names) | Q(email__in=emails.values())
+            ).order_by("pk"):
+                by_name.setdefault(user.name, user.pk)
+                by_email[user.email] = user.pk
+            new_users = {}
+            for name in names:
+                if name not in by_name and emails[name] not in by_email:
+                    new_users.setdefault(
+                        emails[name], User(name=name, email=emails[name])
+                    )
+            new_users = list(new_users.values())
+            User.assign_codes(new_users)
+            User.objects.bulk_create(new_users)
+            by_email.update(
+                User.objects.filter(
+                    email__in=[user.email for user in new_users]
+                ).values_list("email", "pk")
+            )
+            for name in names:
+                self.users[name] = by_name.get(name) or by_email[emails[name]]
+
+        user_ids = {self.users[name] for talk in talks for name in talk["persons"]}
+        profiles = set(
+            SpeakerProfile.objects.filter(
+                event=self.event, user_id__in=user_ids
+            ).values_list("user_id", flat=True)
+        )
+        SpeakerProfile.objects.bulk_create(
+            [
+                SpeakerProfile(event=self.event, user_id=user_id)
+                for user_id in user_ids - profiles
+            ]
+        )
+
+        through = Submission.speakers.through
+        pairs = set(
+            through.objects.filter(
+                submission_id__in=[s.pk for s in submissions]
+            ).values_list("submission_id", "user_id")
+        )
+        new_pairs = {
+            (submission.pk, self.users[name])
+            for talk, submission in zip(talks, submissions)
+            for name in talk["persons"]
+        } - pairs
+        through.objects.bulk_create(
+            [
+                through(submission_id=submission_id, user_id=user_id)
+                for submission_id, user_id in new_pairs
+            ]
+        )
+
+    def import_slots(self, talks, submissions):
+        """Places every submission in the WIP schedule, re-using its visible
+        talk slot if it has one."""
+        schedule = self.event.wip_schedule
+        slots = {}
+        for slot in TalkSlot.objects.filter(
+            schedule=schedule,
+            submission_id__in=[s.pk for s in submissions],
+            is_visible=True,
+        ).order_by("-pk"):
+            slots[slot.submission_id] = slot
+        change_counter = schedule.bump_change_counter()
+        new_slots = {}
+        for talk, submission in zip(talks, submissions):
+            slot = slots.get(submission.pk)
+            if not slot:
+                slot = new_slots.setdefault(
+                    submission.pk,
+                    TalkSlot(submission=submission, schedule=schedule, is_visible=True),
+                )
+            slot.room = talk["room"]
+            slot.start = talk["start"]
+            slot.end = talk["end"]
+            slot.change_counter = change_counter
+        TalkSlot.objects.bulk_update(
+            slots.values(), ["room", "start", "end", "change_counter"]
+        )
+        TalkSlot.objects.bulk_create(new_slots.values())
+
+    @transaction.atomic
+    def release_schedule(self):
+        try:
+            self.event.wip_schedule.freeze(self.version, notify_speakers=False)
+            schedule = self.event.schedules.get(version=self.version)
+        except Exception as e:
+            raise Exception(
+                f'Could not import "{self.event.name}" schedule version "{self.version}": {e}'
+            )
+
+        schedule.talks.update(is_visible=True)
+        start = schedule.talks.order_by("start").first().start
+        end = schedule.talks.order_by("-end").first().end
+        self.event.date_from = start.date()
+        self.event.date_to = end.date()
+        self.event.save()
+
+
+def import_frab_schedule(source, event, batch_size=BATCH_SIZE):
+    """Imports a frab XML file (given as path or file object) into the
+    event, and releases a schedule with its data. Returns the version name
+    of the new schedule."""
+    with scope(event=event):
+        importer = FrabImporter(event, batch_size=batch_size)
+        importer.import_file(source)
+        importer.release_schedule()
+    return importer.version
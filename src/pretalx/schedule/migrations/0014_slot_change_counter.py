@@ -0,0 +1,33 @@
+# Generated by Django 2.2.28 on 2026-10-18 22:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0013_auto_20191107_1748'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='schedule',
+            name='change_counter',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='talkslot',
+            name='change_counter',
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+        migrations.CreateModel(
+            name='TalkSlotTombstone',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False)),
+                ('slot_id', models.PositiveIntegerField()),
+                ('change_counter', models.PositiveIntegerField(db_index=True)),
+                ('schedule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tombstones', to='schedule.Schedule')),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.2.28 on 2026-10-19 00:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schedule", "0014_slot_change_counter"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="schedule",
+            name="changelog",
+            field=models.TextField(blank=True, null=True),
+        ),
+    ]
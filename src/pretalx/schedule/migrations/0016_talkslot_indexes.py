@@ -0,0 +1,25 @@
+# Generated by Django 2.2.28 on 2026-10-19 01:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schedule", "0015_schedule_changelog"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="talkslot",
+            index=models.Index(
+                fields=["schedule", "is_visible"], name="schedule_ta_schedul_1f917e_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="talkslot",
+            index=models.Index(
+                fields=["schedule", "start"], name="schedule_ta_schedul_750941_idx"
+            ),
+        ),
+    ]
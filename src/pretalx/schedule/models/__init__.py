@@ -1,6 +1,6 @@
 from .availability import Availability
 from .room import Room
 from .schedule import Schedule
-from .slot import TalkSlot
+from .slot import TalkSlot, TalkSlotTombstone
 
-__all__ = ["Availability", "Room", "Schedule", "TalkSlot"]
+__all__ = ["Availability", "Room", "Schedule", "TalkSlot", "TalkSlotTombstone"]
@@ -1,3 +1,4 @@
+import json
 from collections import defaultdict
 from contextlib import suppress
 from urllib.parse import quote
@@ -11,9 +12,11 @@ from django.utils.timezone import now
 from django.utils.timezone import override as tzoverride
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import override
-from django_scopes import ScopedManager
+from django_scopes import ScopedManager, scopes_disabled
 
 from pretalx.agenda.tasks import export_schedule_html
+from pretalx.agenda.widget import update_widget_data
+from pretalx.api.mixins import invalidate_public_api_cache
 from pretalx.common.mixins import LogMixin
 from pretalx.common.urls import EventUrls
 from pretalx.mail.context import template_context_from_event
@@ -28,6 +31,9 @@ class Schedule(LogMixin, models.Model):
     for a schedule release for an :class:`~pretalx.event.models.event.Event`.
 
     :param published: ``None`` if the schedule has not been published yet.
+    :param change_counter: Incremented with every change to one of the
+        schedule's slots. Used to provide incremental updates to the schedule
+        editor.
     """
 
     event = models.ForeignKey(
@@ -37,6 +43,8 @@ class Schedule(LogMixin, models.Model):
         max_length=190, null=True, blank=True, verbose_name=_("version")
     )
     published = models.DateTimeField(null=True, blank=True)
+    change_counter = models.PositiveIntegerField(default=0)
+    changelog = models.TextField(null=True, blank=True)
 
     objects = ScopedManager(event="event")
 
@@ -74,6 +82,8 @@ class Schedule(LogMixin, models.Model):
         self.published = now()
         self.save(update_fields=["published", "version"])
         self.log_action("pretalx.schedule.release", person=user, orga=True)
+        # Deleted slots are only tracked for the schedule editor
+        self.tombstones.all().delete()
 
         wip_schedule = Schedule.objects.create(event=self.event)
 
@@ -85,6 +95,7 @@ class Schedule(LogMixin, models.Model):
             | models.Q(submission__isnull=True),
             start__isnull=False,
         ).update(is_visible=True)
+        self.store_changes()
 
         talks = []
         for talk in self.talks.select_related("submission", "room").all():
@@ -104,6 +115,8 @@ class Schedule(LogMixin, models.Model):
                 export_schedule_html.apply_async(kwargs={"event_id": self.event.id})
             else:
                 self.event.cache.set("rebuild_schedule_export", True, None)
+        invalidate_public_api_cache(self.event)
+        update_widget_data(self.event)
         return self, wip_schedule
 
     freeze.alters_data = True
@@ -128,7 +141,9 @@ class Schedule(LogMixin, models.Model):
             new_talks.append(talk.copy_to_schedule(wip_schedule, save=False))
         TalkSlot.objects.bulk_create(new_talks)
 
-        self.event.wip_schedule.talks.all().delete()
+        # The schedule is deleted right away, so no tombstones are needed
+        old_talks = self.event.wip_schedule.talks.all()
+        old_talks._raw_delete(old_talks.db)
         self.event.wip_schedule.delete()
 
         with suppress(AttributeError):
@@ -138,6 +153,76 @@ class Schedule(LogMixin, models.Model):
 
     unfreeze.alters_data = True
 
+    def bump_change_counter(self) -> int:
+        """Increments the change counter and returns the new value. Slots
+        changed by the caller should be saved with this value as their
+        ``change_counter``. Call this once per batch of changes.
+
+        Call this in the same transaction as the slot changes it records:
+        the row lock taken here makes sure that counters become visible in
+        the order they were handed out. Released schedules are not edited
+        anymore, so their counter is not changed.
+        """
+        if self.version:
+            return self.change_counter
+        with scopes_disabled():
+            Schedule.objects.filter(pk=self.pk).update(
+                change_counter=models.F("change_counter") + 1
+            )
+            self.change_counter = (
+                Schedule.objects.filter(pk=self.pk)
+                .values_list("change_counter", flat=True)
+                .get()
+            )
+        return self.change_counter
+
+    bump_change_counter.alters_data = True
+
+    def delete_talks(self, talks):
+        """Deletes the given slots of this schedule and records their
+        deletion for the schedule editor with a fixed number of queries,
+        instead of once per slot.
+
+        :param talks: A queryset of :class:`~pretalx.schedule.models.slot.TalkSlot`
+            objects of this schedule.
+        """
+        from pretalx.schedule.models import TalkSlot, TalkSlotTombstone
+
+        talk_ids = list(talks.values_list("pk", flat=True))
+        if not talk_ids:
+            return
+        if not self.version:
+            change_counter = self.bump_change_counter()
+            TalkSlotTombstone.objects.bulk_create(
+                [
+                    TalkSlotTombstone(
+                        schedule=self, slot_id=talk_id, change_counter=change_counter
+                    )
+                    for talk_id in talk_ids
+                ]
+            )
+        # Skips the post_delete receiver, which records single deletions
+        talks = TalkSlot.objects.filter(pk__in=talk_ids)
+        talks._raw_delete(talks.db)
+
+    delete_talks.alters_data = True
+
+    @property
+    def change_token(self) -> str:
+        """An opaque token describing the current state of this schedule, to
+        be passed back as the ``since`` parameter of the schedule editor
+        API."""
+        return f"{self.pk}.{self.change_counter}"
+
+    def parse_change_token(self, token):
+        """Returns the change counter encoded in the given token, or ``None``
+        if the token is invalid or belongs to another schedule."""
+        schedule, _, counter = (token or "").partition(".")
+        if schedule != str(self.pk) or not counter.isdigit():
+            return None
+        counter = int(counter)
+        return counter if counter <= self.change_counter else None
+
     @cached_property
     def scheduled_talks(self):
         """Returns all :class:`~pretalx.schedule.models.slot.TalkSlot` objects
@@ -179,60 +264,40 @@ class Schedule(LogMixin, models.Model):
             queryset = queryset.filter(published__lt=self.published)
         return queryset.order_by("-published").first()
 
-    def _handle_submission_move(self, submission_pk, old_slots, new_slots):
-        new = []
-        canceled = []
-        moved = []
-        all_old_slots = list(old_slots.filter(submission__pk=submission_pk))
-        all_new_slots = list(new_slots.filter(submission__pk=submission_pk))
-        old_slots = [
+    @staticmethod
+    def _get_submission_changes(old_slots, new_slots):
+        """Compares the old and new slots of one submission and returns the
+        new and canceled slots, and the moved slots as ``(old, new)``
+        tuples."""
+        unmatched_old = [
             slot
-            for slot in all_old_slots
-            if not any(slot.is_same_slot(other_slot) for other_slot in all_new_slots)
+            for slot in old_slots
+            if not any(slot.is_same_slot(other_slot) for other_slot in new_slots)
         ]
-        new_slots = [
+        unmatched_new = [
             slot
-            for slot in all_new_slots
-            if not any(slot.is_same_slot(other_slot) for other_slot in all_old_slots)
+            for slot in new_slots
+            if not any(slot.is_same_slot(other_slot) for other_slot in old_slots)
         ]
-        diff = len(old_slots) - len(new_slots)
+        new = []
+        canceled = []
+        diff = len(unmatched_old) - len(unmatched_new)
         if diff > 0:
-            canceled = old_slots[:diff]
-            old_slots = old_slots[diff:]
+            canceled = unmatched_old[:diff]
+            unmatched_old = unmatched_old[diff:]
         elif diff < 0:
-            diff = -diff
-            new = new_slots[:diff]
-            new_slots = new_slots[diff:]
-        for move in zip(old_slots, new_slots):
-            old_slot = move[0]
-            new_slot = move[1]
-            moved.append(
-                {
-                    "submission": new_slot.submission,
-                    "old_start": old_slot.start.astimezone(self.tz),
-                    "new_start": new_slot.start.astimezone(self.tz),
-                    "old_room": old_slot.room.name,
-                    "new_room": new_slot.room.name,
-                    "new_info": new_slot.room.speaker_info,
-                }
-            )
-        return new, canceled, moved
+            new = unmatched_new[:-diff]
+            unmatched_new = unmatched_new[-diff:]
+        return new, canceled, list(zip(unmatched_old, unmatched_new))
 
-    @cached_property
-    def tz(self):
-        return pytz.timezone(self.event.timezone)
-
-    @cached_property
-    def changes(self) -> dict:
-        """Returns a dictionary of changes when compared to the previous
+    def _get_changed_slots(self) -> dict:
+        """Compares the scheduled talks with those of the previous schedule
         version.
 
-        The ``action`` field is either ``create`` or ``update``. If it's
-        an update, the ``count`` integer, and the ``new_talks``,
-        ``canceled_talks`` and ``moved_talks`` lists are also present.
+        Returns the new and canceled talk slots, and the moved slots as
+        ``(old, new)`` tuples.
         """
         result = {
-            "count": 0,
             "action": "update",
             "new_talks": [],
             "canceled_talks": [],
@@ -242,52 +307,49 @@ class Schedule(LogMixin, models.Model):
             result["action"] = "create"
             return result
 
-        old_slots = self.previous_schedule.scheduled_talks
-        new_slots = self.scheduled_talks
-        old_slot_set = set(
-            old_slots.values_list("submission", "room", "start", named=True)
-        )
-        new_slot_set = set(
-            new_slots.values_list("submission", "room", "start", named=True)
-        )
-        old_submissions = set(old_slots.values_list("submission__id", flat=True))
-        new_submissions = set(new_slots.values_list("submission__id", flat=True))
-        handled_submissions = set()
-
-        moved_or_missing = old_slot_set - new_slot_set - {None}
-        moved_or_new = new_slot_set - old_slot_set - {None}
-
-        for entry in moved_or_missing:
-            if entry.submission in handled_submissions or not entry.submission:
+        old_slots = defaultdict(list)
+        new_slots = defaultdict(list)
+        for slot in self.previous_schedule.scheduled_talks.order_by("start", "pk"):
+            old_slots[slot.submission_id].append(slot)
+        for slot in self.scheduled_talks.order_by("start", "pk"):
+            new_slots[slot.submission_id].append(slot)
+
+        for submission_id in sorted(set(old_slots) | set(new_slots)):
+            old = old_slots.get(submission_id, [])
+            new = new_slots.get(submission_id, [])
+            if {(s.room_id, s.start) for s in old} == {
+                (s.room_id, s.start) for s in new
+            }:
                 continue
-            if entry.submission not in new_submissions:
-                result["canceled_talks"] += list(
-                    old_slots.filter(submission__pk=entry.submission)
-                )
-            else:
-                new, canceled, moved = self._handle_submission_move(
-                    entry.submission, old_slots, new_slots
-                )
+            if not new:
+                result["canceled_talks"] += old
+            elif not old:
                 result["new_talks"] += new
-                result["canceled_talks"] += canceled
-                result["moved_talks"] += moved
-            handled_submissions.add(entry.submission)
-        for entry in moved_or_new:
-            if entry.submission in handled_submissions:
-                continue
-            if entry.submission not in old_submissions:
-                result["new_talks"] += list(
-                    new_slots.filter(submission__pk=entry.submission)
-                )
             else:
-                new, canceled, moved = self._handle_submission_move(
-                    entry.submission, old_slots, new_slots
-                )
+                new, canceled, moved = self._get_submission_changes(old, new)
                 result["new_talks"] += new
                 result["canceled_talks"] += canceled
                 result["moved_talks"] += moved
-            handled_submissions.add(entry.submission)
+        return result
 
+    def _build_changes(self, changed_slots) -> dict:
+        result = {
+            "count": 0,
+            "action": changed_slots["action"],
+            "new_talks": changed_slots["new_talks"],
+            "canceled_talks": changed_slots["canceled_talks"],
+            "moved_talks": [
+                {
+                    "submission": new_slot.submission,
+                    "old_start": old_slot.start.astimezone(self.tz),
+                    "new_start": new_slot.start.astimezone(self.tz),
+                    "old_room": old_slot.room.name,
+                    "new_room": new_slot.room.name,
+                    "new_info": new_slot.room.speaker_info,
+                }
+                for old_slot, new_slot in changed_slots["moved_talks"]
+            ],
+        }
         result["count"] = (
             len(result["new_talks"])
             + len(result["canceled_talks"])
@@ -295,6 +357,85 @@ class Schedule(LogMixin, models.Model):
         )
         return result
 
+    def store_changes(self):
+        """Computes the changes to the previous schedule version and stores
+        them with this schedule.
+
+        Called on release, as released schedules never change.
+        """
+        changed_slots = self._get_changed_slots()
+        self.changelog = json.dumps(
+            {
+                "action": changed_slots["action"],
+                "new_talks": [slot.pk for slot in changed_slots["new_talks"]],
+                "canceled_talks": [slot.pk for slot in changed_slots["canceled_talks"]],
+                "moved_talks": [
+                    [old_slot.pk, new_slot.pk]
+                    for old_slot, new_slot in changed_slots["moved_talks"]
+                ],
+            }
+        )
+        self.save(update_fields=["changelog"])
+        self.changes = self._build_changes(changed_slots)
+
+    store_changes.alters_data = True
+
+    def _load_changes(self) -> dict:
+        from pretalx.schedule.models import TalkSlot
+
+        data = json.loads(self.changelog)
+        slot_ids = (
+            data["new_talks"]
+            + data["canceled_talks"]
+            + [pk for move in data["moved_talks"] for pk in move]
+        )
+        slots = (
+            TalkSlot.objects.filter(pk__in=slot_ids)
+            .select_related("submission", "submission__event", "room")
+            .prefetch_related("submission__speakers")
+            .in_bulk()
+            if slot_ids
+            else {}
+        )
+        return self._build_changes(
+            {
+                "action": data["action"],
+                "new_talks": [slots[pk] for pk in data["new_talks"] if pk in slots],
+                "canceled_talks": [
+                    slots[pk] for pk in data["canceled_talks"] if pk in slots
+                ],
+                "moved_talks": [
+                    (slots[old], slots[new])
+                    for old, new in data["moved_talks"]
+                    if old in slots and new in slots
+                ],
+            }
+        )
+
+    @cached_property
+    def tz(self):
+        return pytz.timezone(self.event.timezone)
+
+    @cached_property
+    def changes(self) -> dict:
+        """Returns a dictionary of changes when compared to the previous
+        version.
+
+        The ``action`` field is either ``create`` or ``update``. If it's
+        an update, the ``count`` integer, and the ``new_talks``,
+        ``canceled_talks`` and ``moved_talks`` lists are also present.
+
+        Released schedules read their changes from the changelog stored
+        on release. Schedules released before changelogs were stored
+        compute and store theirs on first access.
+        """
+        if not self.version:
+            return self._build_changes(self._get_changed_slots())
+        if self.changelog is None:
+            self.store_changes()
+            return self.changes
+        return self._load_changes()
+
     @cached_property
     def warnings(self) -> dict:
         """A dictionary of warnings to be acknowledged pre-release.
@@ -311,6 +452,7 @@ class Schedule(LogMixin, models.Model):
             "unconfirmed": [],
             "no_track": [],
         }
+        use_tracks = self.event.settings_snapshot.use_tracks
         for talk in self.talks.filter(submission__isnull=False):
             if not talk.start:
                 warnings["unscheduled"].append(talk)
@@ -318,7 +460,7 @@ class Schedule(LogMixin, models.Model):
                 warnings["talk_warnings"].append(talk)
             if talk.submission.state != SubmissionStates.CONFIRMED:
                 warnings["unconfirmed"].append(talk)
-            if talk.submission.event.settings.use_tracks and not talk.submission.track:
+            if use_tracks and not talk.submission.track:
                 warnings["no_track"].append(talk)
         return warnings
 
@@ -1,7 +1,5 @@
 import datetime as dt
-from urllib.parse import urlparse
 
-import pytz
 from django.db import models
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -9,7 +7,6 @@ from django_scopes import ScopedManager
 from i18nfield.fields import I18nCharField
 
 from pretalx.common.mixins import LogMixin
-from pretalx.common.urls import get_base_url
 
 
 class TalkSlot(LogMixin, models.Model):
@@ -20,6 +17,8 @@ class TalkSlot(LogMixin, models.Model):
     TalkSlots always belong to one submission and one :class:`~pretalx.schedule.models.schedule.Schedule`.
 
     :param is_visible: This parameter is set on schedule release. Only confirmed talks will be visible.
+    :param change_counter: The value of the schedule's ``change_counter`` when
+        this slot was last changed.
     """
 
     submission = models.ForeignKey(
@@ -43,9 +42,16 @@ class TalkSlot(LogMixin, models.Model):
     start = models.DateTimeField(null=True)
     end = models.DateTimeField(null=True)
     description = I18nCharField(null=True)
+    change_counter = models.PositiveIntegerField(default=0, db_index=True)
 
     objects = ScopedManager(event="schedule__event")
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["schedule", "is_visible"]),
+            models.Index(fields=["schedule", "start"]),
+        ]
+
     def __str__(self):
         """Help when debugging."""
         return f'TalkSlot(event={self.schedule.event.slug}, submission={getattr(self.submission, "title", None)}, schedule={self.schedule.version})'
@@ -176,7 +182,11 @@ class TalkSlot(LogMixin, models.Model):
         """
         new_slot = TalkSlot(schedule=new_schedule)
 
-        for field in [f for f in self._meta.fields if f.name not in ("id", "schedule")]:
+        for field in [
+            f
+            for f in self._meta.fields
+            if f.name not in ("id", "schedule", "change_counter")
+        ]:
             setattr(new_slot, field.name, getattr(self, field.name))
 
         if save:
@@ -189,24 +199,20 @@ class TalkSlot(LogMixin, models.Model):
         """Checks if both slots have the same room and start time."""
         return self.room == other_slot.room and self.start == other_slot.start
 
-    def build_ical(self, calendar, creation_time=None, netloc=None):
-        if not self.start or not self.end or not self.room:
-            return
-        creation_time = creation_time or dt.datetime.now(pytz.utc)
-        netloc = netloc or urlparse(get_base_url(self.event)).netloc
-        tz = pytz.timezone(self.submission.event.timezone)
-
-        vevent = calendar.add("vevent")
-        vevent.add(
-            "summary"
-        ).value = f"{self.submission.title} - {self.submission.display_speaker_names}"
-        vevent.add("dtstamp").value = creation_time
-        vevent.add("location").value = str(self.room.name)
-        vevent.add("uid").value = "pretalx-{}-{}@{}".format(
-            self.submission.event.slug, self.submission.code, netloc
-        )
 
-        vevent.add("dtstart").value = self.start.astimezone(tz)
-        vevent.add("dtend").value = self.end.astimezone(tz)
-        vevent.add("description").value = self.submission.abstract or ""
-        vevent.add("url").value = self.submission.urls.public.full()
+class TalkSlotTombstone(models.Model):
+    """Records the deletion of a :class:`TalkSlot`, so that clients fetching
+    schedule changes incrementally learn about it.
+
+    :param slot_id: The primary key the deleted slot used to have.
+    :param change_counter: The value of the schedule's ``change_counter``
+        when the slot was deleted.
+    """
+
+    schedule = models.ForeignKey(
+        to="schedule.Schedule", on_delete=models.CASCADE, related_name="tombstones"
+    )
+    slot_id = models.PositiveIntegerField()
+    change_counter = models.PositiveIntegerField(db_index=True)
+
+    objects = ScopedManager(event="schedule__event")
@@ -1,6 +1,8 @@
+from django.db import models
 from django.dispatch import receiver
 
 from pretalx.common.signals import register_data_exporters
+from pretalx.schedule.models import TalkSlot, TalkSlotTombstone
 
 
 @receiver(register_data_exporters, dispatch_uid="exporter_builtin_ical")
@@ -29,3 +31,17 @@ def register_json_exporter(sender, **kwargs):
     from .exporters import FrabJsonExporter
 
     return FrabJsonExporter
+
+
+@receiver(
+    models.signals.post_delete, sender=TalkSlot, dispatch_uid="schedule_slot_tombstone"
+)
+def record_slot_deletion(sender, instance, **kwargs):
+    schedule = instance.schedule
+    if schedule.version:  # Released schedules are not edited anymore
+        return
+    TalkSlotTombstone(
+        schedule=schedule,
+        slot_id=instance.pk,
+        change_counter=schedule.bump_change_counter(),
+    ).save()
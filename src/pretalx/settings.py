@@ -44,8 +44,18 @@ STATIC_ROOT = Path(
 HTMLEXPORT_ROOT = Path(
     config.get("filesystem", "htmlexport", fallback=DATA_DIR / "htmlexport",)
 )
+LOG_ARCHIVE_ROOT = Path(
+    config.get("filesystem", "logarchive", fallback=DATA_DIR / "logarchive",)
+)
 
-for directory in (BASE_DIR, DATA_DIR, LOG_DIR, MEDIA_ROOT, HTMLEXPORT_ROOT):
+for directory in (
+    BASE_DIR,
+    DATA_DIR,
+    LOG_DIR,
+    MEDIA_ROOT,
+    HTMLEXPORT_ROOT,
+    LOG_ARCHIVE_ROOT,
+):
     directory.mkdir(parents=True, exist_ok=True)
 
 
@@ -242,6 +252,9 @@ if ADMINS:
         "class": "django.utils.log.AdminEmailHandler",
     }
 
+METRICS_ENABLED = config.getboolean("metrics", "enabled", fallback=False)
+METRICS_TOKEN = config.get("metrics", "token", fallback="")
+
 
 ## EMAIL SETTINGS
 MAIL_FROM = SERVER_EMAIL = DEFAULT_FROM_EMAIL = "hopetest@mccarthyinternet.net"
@@ -339,6 +352,7 @@ AUTH_PASSWORD_VALIDATORS = [
 
 ## MIDDLEWARE SETTINGS
 MIDDLEWARE = [
+    "pretalx.common.middleware.MetricsMiddleware",  # Measures everything below, if enabled
     "django.middleware.security.SecurityMiddleware",  # Security first
     "whitenoise.middleware.WhiteNoiseMiddleware",  # Next up: static files
     "django.middleware.common.CommonMiddleware",  # Set some sensible defaults, now, before responses are modified
@@ -348,6 +362,7 @@ MIDDLEWARE = [
     "pretalx.common.middleware.MultiDomainMiddleware",  # Check which host is used and if it is valid
     "pretalx.common.middleware.EventPermissionMiddleware",  # Sets locales, request.event, available events, etc.
     "pretalx.common.middleware.CsrfViewMiddleware",  # Protect against CSRF attacks before forms/data are processed
+    "pretalx.common.middleware.ActivityLogMiddleware",  # Writes all log entries of a request at once
     "django.contrib.messages.middleware.MessageMiddleware",  # Uses sessions
     "django.middleware.clickjacking.XFrameOptionsMiddleware",  # Protects against clickjacking
     "csp.middleware.CSPMiddleware",  # Modifies/sets CSP headers
@@ -28,14 +28,18 @@ var api = {
         return Promise.reject(error)
       })
   },
-  fetchTalks() {
+  fetchTalks(since) {
+    var search = window.location.search
+    if (since) {
+      search += (search ? "&" : "?") + "since=" + encodeURIComponent(since)
+    }
     var url = [
       window.location.protocol,
       "//",
       window.location.host,
       window.location.pathname,
       "api/talks/",
-      window.location.search,
+      search,
     ].join("")
     return api.http("GET", url, null)
   },
@@ -469,6 +473,7 @@ var app = new Vue({
   data() {
     return {
       talks: null,
+      changeToken: null,
       rooms: null,
       start: null,
       end: null,
@@ -488,6 +493,7 @@ var app = new Vue({
       .fetchTalks()
       .then(result => {
         this.talks = result.results
+        this.changeToken = result.change_token
         this.timezone = result.timezone
         this.start = moment.tz(result.start, this.timezone)
         this.end = moment.tz(result.end, this.timezone)
@@ -498,6 +504,7 @@ var app = new Vue({
         $(function() {
           $('[data-toggle="tooltip"]').tooltip()
         })
+        window.setInterval(this.fetchChanges, 30000)
       })
   },
   computed: {
@@ -520,6 +527,25 @@ var app = new Vue({
     },
   },
   methods: {
+    fetchChanges () {
+      // Only loads the slots changed since the last fetch, including changes by other users
+      return api.fetchTalks(this.changeToken).then(result => {
+        if (result.full) {
+          this.talks = result.results
+        } else {
+          this.talks = this.talks.filter(talk => !result.deleted.includes(talk.id))
+          result.results.forEach(response => {
+            const talk = this.talks.find((talk) => talk.id == response.id)
+            if (talk) {
+              if (talk !== dragController.draggedTalk) Object.assign(talk, response)
+            } else {
+              this.talks.push(response)
+            }
+          })
+        }
+        this.changeToken = result.change_token
+      })
+    },
     deleteTalk (event) {
       // only removes talk from display
       const index = this.talks.indexOf(event);
@@ -531,6 +557,7 @@ var app = new Vue({
     saveTalk (response) {
       const talk = this.talks.find((talk) => talk.id == response.id)
       Object.assign(talk, response)
+      this.fetchChanges()
     },
     onMouseMove(event) {
       if (dragController.draggedTalk) {
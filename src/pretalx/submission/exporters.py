@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
 
@@ -6,6 +8,27 @@ from pretalx.common.signals import register_data_exporters
 from pretalx.submission.models import Answer
 
 
+def get_answer_options(answers):
+    """Returns the chosen options of all given answers by answer ID, with a
+    single query."""
+    result = defaultdict(list)
+    for answer_id, option in (
+        Answer.options.through.objects.filter(answer__in=answers)
+        .order_by("answeroption_id")
+        .values_list("answer_id", "answeroption__answer")
+    ):
+        result[answer_id].append(str(option))
+    return result
+
+
+def get_answer_string(answer, options):
+    """Returns ``answer.answer_string``, using the options loaded by
+    :func:`get_answer_options` instead of querying them."""
+    if answer.question.variant in ("choices", "multiple_choice"):
+        return ", ".join(options.get(answer.pk, []))
+    return answer.answer_string
+
+
 class SpeakerQuestionData(CSVExporterMixin, BaseExporter):
     identifier = "speaker-questions.csv"
     public = False
@@ -21,22 +44,24 @@ class SpeakerQuestionData(CSVExporterMixin, BaseExporter):
 
     def get_data(self, **kwargs):
         field_names = ["code", "name", "email", "question", "answer"]
-        data = []
-        qs = Answer.objects.filter(
+        answers = Answer.objects.filter(
             question__target="speaker",
             question__event=self.event,
             question__active=True,
-        ).order_by("person__name")
-        for answer in qs:
-            data.append(
-                {
-                    "code": answer.person.code,
-                    "name": answer.person.name,
-                    "email": answer.person.email,
-                    "question": answer.question.question,
-                    "answer": answer.answer_string,
-                }
-            )
+        )
+        options = get_answer_options(answers)
+        data = (
+            {
+                "code": answer.person.code,
+                "name": answer.person.name,
+                "email": answer.person.email,
+                "question": answer.question.question,
+                "answer": get_answer_string(answer, options),
+            }
+            for answer in answers.select_related("person", "question")
+            .order_by("person__name")
+            .iterator()
+        )
         return field_names, data
 
 
@@ -60,21 +85,23 @@ class SubmissionQuestionData(CSVExporterMixin, BaseExporter):
 
     def get_data(self, **kwargs):
         field_names = ["code", "title", "question", "answer"]
-        data = []
-        qs = Answer.objects.filter(
+        answers = Answer.objects.filter(
             question__target="submission",
             question__event=self.event,
             question__active=True,
-        ).order_by("submission__title")
-        for answer in qs:
-            data.append(
-                {
-                    "code": answer.submission.code,
-                    "title": answer.submission.title,
-                    "question": answer.question.question,
-                    "answer": answer.answer_string,
-                }
-            )
+        )
+        options = get_answer_options(answers)
+        data = (
+            {
+                "code": answer.submission.code,
+                "title": answer.submission.title,
+                "question": answer.question.question,
+                "answer": get_answer_string(answer, options),
+            }
+            for answer in answers.select_related("submission", "question")
+            .order_by("submission__title")
+            .iterator()
+        )
         return field_names, data
 
 
@@ -0,0 +1,18 @@
+# Generated by Django 2.2.28 on 2026-10-19 00:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submission", "0047_auto_20200614_1627"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="submission",
+            name="image_thumbnails",
+            field=models.CharField(blank=True, max_length=50, null=True),
+        ),
+    ]
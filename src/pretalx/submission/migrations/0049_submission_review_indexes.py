@@ -0,0 +1,25 @@
+# Generated by Django 2.2.28 on 2026-10-19 01:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submission", "0048_submission_image_thumbnails"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["submission", "user"], name="submission__submiss_8456ef_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(
+                fields=["event", "state"], name="submission__event_i_135666_idx"
+            ),
+        ),
+    ]
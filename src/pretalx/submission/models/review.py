@@ -35,6 +35,11 @@ class Review(models.Model):
 
     objects = ScopedManager(event="submission__event")
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["submission", "user"]),
+        ]
+
     def __str__(self):
         return f"Review(event={self.submission.event.slug}, submission={self.submission.title}, user={self.user.get_display_name}, score={self.score})"
 
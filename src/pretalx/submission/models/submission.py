@@ -18,7 +18,7 @@ from django_scopes import ScopedManager
 
 from pretalx.common.choices import Choices
 from pretalx.common.mixins import LogMixin
-from pretalx.common.mixins.models import GenerateCode
+from pretalx.common.mixins.models import GenerateCode, ThumbnailMixin
 from pretalx.common.phrases import phrases
 from pretalx.common.urls import EventUrls
 from pretalx.common.utils import path_with_hash
@@ -99,7 +99,7 @@ class AllSubmissionManager(models.Manager):
     pass
 
 
-class Submission(LogMixin, GenerateCode, models.Model):
+class Submission(LogMixin, GenerateCode, ThumbnailMixin, models.Model):
     """Submissions are, next to :class:`~pretalx.event.models.event.Event`, the
     central model in pretalx.
 
@@ -116,6 +116,8 @@ class Submission(LogMixin, GenerateCode, models.Model):
         the corresponding methods, like ``accept()``. The ``SubmissionStates``
         class comes with a ``method_names`` dictionary for method lookup.
     :param image: An image illustrating the talk or topic.
+    :param image_thumbnails: Set automatically once the thumbnails of the
+        image have been generated, see :mod:`pretalx.common.images`.
     :param review_code: A token used in secret URLs giving read-access to the
         submission.
     """
@@ -218,6 +220,7 @@ class Submission(LogMixin, GenerateCode, models.Model):
         verbose_name=_("Talk image"),
         help_text=_("Use this if you want an illustration to go with your submission."),
     )
+    image_thumbnails = models.CharField(max_length=50, null=True, blank=True)
     invitation_token = models.CharField(max_length=32, default=generate_invite_code)
     access_code = models.ForeignKey(
         to="submission.SubmitterAccessCode",
@@ -235,6 +238,12 @@ class Submission(LogMixin, GenerateCode, models.Model):
         event="event", _manager_class=DeletedSubmissionManager
     )
     all_objects = ScopedManager(event="event", _manager_class=AllSubmissionManager)
+    _thumbnail_fields = ("image",)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["event", "state"]),
+        ]
 
     class urls(EventUrls):
         user_base = "{self.event.urls.user_submissions}{self.code}/"
@@ -299,11 +308,15 @@ class Submission(LogMixin, GenerateCode, models.Model):
 
         Should be called whenever the duration changes.
         """
-        for slot in self.event.wip_schedule.talks.filter(
-            submission=self, start__isnull=False
-        ):
+        schedule = self.event.wip_schedule
+        slots = list(schedule.talks.filter(submission=self, start__isnull=False))
+        if not slots:
+            return
+        change_counter = schedule.bump_change_counter()
+        for slot in slots:
             slot.end = slot.start + dt.timedelta(minutes=self.get_duration())
-            slot.save()
+            slot.change_counter = change_counter
+            slot.save(update_fields=["end", "change_counter"])
 
     update_duration.alters_data = True
 
@@ -363,9 +376,11 @@ class Submission(LogMixin, GenerateCode, models.Model):
         from pretalx.schedule.models import TalkSlot
 
         if self.state not in [SubmissionStates.ACCEPTED, SubmissionStates.CONFIRMED]:
-            TalkSlot.objects.filter(
-                submission=self, schedule=self.event.wip_schedule
-            ).delete()
+            self.event.wip_schedule.delete_talks(
+                TalkSlot.objects.filter(
+                    submission=self, schedule=self.event.wip_schedule
+                )
+            )
             return
 
         slot_count_current = TalkSlot.objects.filter(
@@ -383,11 +398,16 @@ class Submission(LogMixin, GenerateCode, models.Model):
                 .order_by("start", "room", "is_visible")[:diff]
                 .values_list("id", flat=True)
             )
-            TalkSlot.objects.filter(pk__in=list(talks_to_delete)).delete()
+            self.event.wip_schedule.delete_talks(
+                TalkSlot.objects.filter(pk__in=list(talks_to_delete))
+            )
         elif diff < 0:
+            change_counter = self.event.wip_schedule.bump_change_counter()
             for __ in repeat(None, abs(diff)):
                 TalkSlot.objects.create(
-                    submission=self, schedule=self.event.wip_schedule,
+                    submission=self,
+                    schedule=self.event.wip_schedule,
+                    change_counter=change_counter,
                 )
 
     update_talk_slots.alters_data = True
@@ -639,7 +659,7 @@ class Submission(LogMixin, GenerateCode, models.Model):
                 field_content = _("Yes") if field_content else _("No")
             elif isinstance(field_content, FieldFile):
                 field_content = (
-                    self.event.settings.custom_domain or settings.SITE_URL
+                    self.event.settings_snapshot.custom_domain or settings.SITE_URL
                 ) + field_content.url
             result += f"**{field_name}**: {field_content}\n\n"
         return result
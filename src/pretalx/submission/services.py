@@ -0,0 +1,153 @@
+from collections import Counter
+
+from django.db import transaction
+
+from pretalx.common.urls import EventUrlBuilder
+from pretalx.mail.context import template_context_from_submission
+from pretalx.submission.models import Submission, SubmissionStates
+from pretalx.submission.signals import (
+    submission_state_change,
+    submission_state_change_bulk,
+)
+
+BULK_ACTIONS = {
+    SubmissionStates.ACCEPTED: "pretalx.submission.accept",
+    SubmissionStates.REJECTED: "pretalx.submission.reject",
+}
+
+
+def _update_talk_slots(event, submissions):
+    """Creates or deletes the WIP schedule's talk slots of all submissions
+    at once, like :meth:`Submission.update_talk_slots` does per
+    submission."""
+    from pretalx.schedule.models import TalkSlot
+
+    schedule = event.wip_schedule
+    scheduled_states = (SubmissionStates.ACCEPTED, SubmissionStates.CONFIRMED)
+    unscheduled = [
+        submission.pk
+        for submission in submissions
+        if submission.state not in scheduled_states
+    ]
+    if unscheduled:
+        schedule.delete_talks(
+            TalkSlot.objects.filter(submission_id__in=unscheduled, schedule=schedule)
+        )
+
+    scheduled = [
+        submission for submission in submissions if submission.state in scheduled_states
+    ]
+    if not scheduled:
+        return
+    slot_counts = Counter(
+        TalkSlot.objects.filter(
+            submission__in=scheduled, schedule=schedule
+        ).values_list("submission_id", flat=True)
+    )
+    new_slots = []
+    for submission in scheduled:
+        diff = slot_counts[submission.pk] - submission.slot_count
+        if diff > 0:
+            submission.update_talk_slots()
+        elif diff < 0:
+            new_slots += [
+                TalkSlot(submission=submission, schedule=schedule)
+                for __ in range(abs(diff))
+            ]
+    if new_slots:
+        change_counter = schedule.bump_change_counter()
+        for slot in new_slots:
+            slot.change_counter = change_counter
+        TalkSlot.objects.bulk_create(new_slots)
+
+
+def _send_state_mails(event, submissions):
+    """Queues the acceptance or rejection mails of all submissions, like
+    :meth:`Submission.send_state_mail` does per submission."""
+    from pretalx.mail.models import QueuedMail
+
+    templates = {
+        SubmissionStates.ACCEPTED: event.accept_template,
+        SubmissionStates.REJECTED: event.reject_template,
+    }
+    url_builder = EventUrlBuilder(event)
+    recipients = []
+    for submission in submissions:
+        template = templates.get(submission.state)
+        if not template:
+            continue
+        context = template_context_from_submission(submission, url_builder=url_builder)
+        for speaker in submission.speakers.all():
+            mail = template.to_mail(
+                user=speaker,
+                event=event,
+                context=context,
+                locale=submission.content_locale,
+                commit=False,
+            )
+            mail.to = None
+            mail.save()
+            recipients.append(
+                QueuedMail.to_users.through(queuedmail_id=mail.pk, user_id=speaker.pk)
+            )
+    QueuedMail.to_users.through.objects.bulk_create(recipients)
+
+
+@transaction.atomic
+def change_submission_states(event, submissions, new_state, person=None):
+    """Accepts or rejects many submissions of an event at once.
+
+    This does what :meth:`Submission.accept` and :meth:`Submission.reject`
+    do, but with a fixed number of queries for most steps: states are
+    updated in one query, talk slots, log entries and mail recipients are
+    created in bulk, and the ``submission_state_change_bulk`` signal is sent
+    once.
+
+    :param submissions: The submissions to change. Their speakers and
+        tracks should be prefetched.
+    :param new_state: Either ``SubmissionStates.ACCEPTED`` or
+        ``SubmissionStates.REJECTED``.
+    :returns: A tuple of the changed submissions and of those that could
+        not be changed, as their current state does not permit the change.
+    """
+    if new_state not in BULK_ACTIONS:
+        raise ValueError(f"Cannot change submission states to {new_state} in bulk.")
+    changed = []
+    failed = []
+    for submission in submissions:
+        if new_state in SubmissionStates.valid_next_states.get(submission.state, []):
+            changed.append(submission)
+        else:
+            failed.append(submission)
+    if not changed:
+        return changed, failed
+
+    old_states = {submission.pk: submission.state for submission in changed}
+    Submission.objects.filter(pk__in=old_states.keys()).update(state=new_state)
+    for submission in changed:
+        submission.state = new_state
+
+    _update_talk_slots(event, changed)
+    Submission.log_actions(changed, BULK_ACTIONS[new_state], person=person, orga=True)
+    _send_state_mails(
+        event,
+        [
+            submission
+            for submission in changed
+            if new_state != SubmissionStates.ACCEPTED
+            or old_states[submission.pk] != SubmissionStates.CONFIRMED
+        ],
+    )
+
+    submission_state_change_bulk.send_robust(
+        event, submissions=changed, old_states=old_states, user=person
+    )
+    if submission_state_change.has_listeners(event):
+        for submission in changed:
+            submission_state_change.send_robust(
+                event,
+                submission=submission,
+                old_state=old_states[submission.pk],
+                user=person,
+            )
+    return changed, failed
@@ -11,3 +11,20 @@ Any exceptions raised will be ignored.
 
 As with all plugin signals, the ``sender`` keyword argument will contain the event.
 """
+
+submission_state_change_bulk = EventPluginSignal(
+    providing_args=["submissions", "old_states", "user"]
+)
+"""
+This signal is sent once when many submissions change their state at the same
+time, for example when organisers accept or reject submissions in bulk on the
+review dashboard. You will receive the list of submissions after they have been
+saved, a dictionary mapping submission IDs to their previous states, and the
+user triggering the change if available. For compatibility,
+``submission_state_change`` is sent for each submission, too, if it has any
+receivers – if you handle both signals, you can skip the changes reported here
+in your ``submission_state_change`` receiver.
+Any exceptions raised will be ignored.
+
+As with all plugin signals, the ``sender`` keyword argument will contain the event.
+"""
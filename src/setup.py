@@ -113,6 +113,7 @@ setup(
         "inlinestyler==0.2.*",  # https://github.com/dlanger/inlinestyler/blob/master/CHANGELOG
         "libsass==0.19.*",  # https://sass.github.io/libsass-python/changes.html
         "Markdown==3.1.*",  # https://python-markdown.github.io/change_log/
+        "Pillow==7.*",  # https://pillow.readthedocs.io/en/stable/releasenotes/
         "publicsuffixlist==0.6.*",
         "python-dateutil==2.8.*",  # https://dateutil.readthedocs.io/en/stable/changelog.html
         "pytz",
@@ -121,11 +122,12 @@ setup(
         "requests==2.22.*",  # https://2.python-requests.org/en/master/community/updates/#release-and-version-history
         "rules==2.1.*",  # https://github.com/dfunckt/django-rules/blob/master/CHANGELOG.md
         "urlman==1.3.*",  # https://github.com/andrewgodwin/urlman/blob/master/CHANGELOG
-        "vobject==0.9.*",  # 2017-06, http://eventable.github.io/vobject/ look for "release"
         "whitenoise==5.0.*",  # http://whitenoise.evans.io/en/stable/changelog.html
         "zxcvbn==4.4.*",  # Nothing? https://github.com/dwolfhub/zxcvbn-python/issues/38
     ],
     extras_require={
+        "brotli": ["Brotli"],
+        "orjson": ["orjson"],
         "dev": [
             "black",
             "docformatter",
@@ -135,6 +137,7 @@ setup(
             "isort",
             "lxml",
             "pytest",
+            "pytest-benchmark",
             "pytest-cov",
             "pytest-django",
             "pytest-mock",
@@ -6,7 +6,9 @@ import pytest
 import urllib3
 from django.conf import settings
 from django.core.management.base import CommandError
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django_scopes import scope
 from lxml import etree
@@ -14,6 +16,9 @@ from lxml import etree
 from pretalx.agenda.tasks import export_schedule_html
 from pretalx.common.tasks import regenerate_css
 from pretalx.event.models import Event
+from pretalx.person.exporters import CSVSpeakerExporter
+from pretalx.submission.exporters import SpeakerQuestionData
+from pretalx.submission.models import Answer
 
 
 @pytest.mark.skipif(
@@ -226,7 +231,7 @@ def test_schedule_speaker_ical_export(
 
 @pytest.mark.django_db
 def test_feed_view(slot, client, django_assert_num_queries, schedule):
-    with django_assert_num_queries(20):
+    with django_assert_num_queries(19):
         response = client.get(slot.submission.event.urls.feed)
     assert response.status_code == 200
     assert schedule.version in response.content.decode()
@@ -439,7 +444,7 @@ def test_html_export_full(event, other_event, slot, confirmed_resource, canceled
 
     paths = [
         "static/common/img/logo.svg",
-        f'media/test/{event.settings.agenda_css_file.split("/")[-1]}',
+        event.settings.agenda_css_file.lstrip("/"),
         "test/schedule/index.html",
         "test/schedule/export/schedule.json",
         "test/schedule/export/schedule.xcal",
@@ -534,8 +539,9 @@ def test_speaker_csv_export(slot, orga_client, django_assert_max_num_queries):
             ),
             follow=True,
         )
-    assert response.status_code == 200, str(response.content.decode())
-    assert slot.submission.speakers.first().name in response.content.decode()
+        assert response.status_code == 200
+        content = b"".join(response.streaming_content).decode()
+    assert slot.submission.speakers.first().name in content
 
 
 @pytest.mark.django_db
@@ -557,8 +563,9 @@ def test_submission_question_csv_export(
         ),
         follow=True,
     )
-    assert response.status_code == 200, str(response.content.decode())
-    assert slot.submission.title in response.content.decode()
+    assert response.status_code == 200
+    content = b"".join(response.streaming_content).decode()
+    assert slot.submission.title in content
 
 
 @pytest.mark.django_db
@@ -580,5 +587,41 @@ def test_speaker_question_csv_export(
         ),
         follow=True,
     )
-    assert response.status_code == 200, str(response.content.decode())
-    assert slot.submission.speakers.first().name in response.content.decode()
+    assert response.status_code == 200
+    content = b"".join(response.streaming_content).decode()
+    assert slot.submission.speakers.first().name in content
+    assert f"{answered_choice_question.question},very" in content
+
+
+@pytest.mark.django_db
+def test_speaker_question_csv_export_queries(event, choice_question, speaker):
+    def count_queries():
+        exporter = SpeakerQuestionData(event)
+        with CaptureQueriesContext(connection) as context:
+            exporter.render()
+        return len(context.captured_queries)
+
+    def add_answers(count):
+        with scope(event=event):
+            for __ in range(count):
+                answer = Answer.objects.create(question=choice_question, person=speaker)
+                answer.options.set(choice_question.options.all()[:2])
+
+    add_answers(2)
+    queries = count_queries()
+    add_answers(10)
+    assert count_queries() == queries
+    __, __, content = SpeakerQuestionData(event).render()
+    assert content.count("very, incredibly") == 12
+
+
+@pytest.mark.django_db
+def test_csv_exporter_streams_chunks(slot):
+    exporter = CSVSpeakerExporter(slot.submission.event)
+    exporter.chunk_size = 1
+    __, file_type, chunks = exporter.render_stream()
+    chunks = list(chunks)
+    assert file_type == "text/plain"
+    assert chunks[0].startswith("name,email,confirmed\r\n")
+    assert chunks[0].count("\r\n") == 2
+    assert "".join(chunks) == exporter.render()[2]
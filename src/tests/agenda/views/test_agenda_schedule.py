@@ -1,9 +1,14 @@
+import datetime as dt
 import textwrap
 from urllib.parse import quote
 
 import pytest
+from django.test import override_settings
 from django.urls import reverse
-from django_scopes import scope
+from django_scopes import scope, scopes_disabled
+
+from pretalx.agenda.views.schedule import ScheduleView
+from pretalx.submission.models import Submission
 
 
 @pytest.mark.django_db
@@ -173,6 +178,42 @@ def test_schedule_page_text_list(
     assert slot.submission.title in response.content.decode()
 
 
+@pytest.mark.parametrize("output_format", ("table", "list"))
+@pytest.mark.django_db
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+def test_schedule_page_text_is_cached(
+    client, django_assert_max_num_queries, event, slot, schedule, output_format
+):
+    url = event.urls.schedule
+    title_line = textwrap.wrap(slot.submission.title, width=16)[0]
+    response = client.get(url, {"format": output_format}, follow=True)
+    assert title_line in response.content.decode()
+
+    with scopes_disabled():
+        Submission.all_objects.filter(pk=slot.submission.pk).update(title="Changed")
+    with django_assert_max_num_queries(12):
+        response = client.get(url, {"format": output_format}, follow=True)
+    assert title_line in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_schedule_room_timeline(slot, other_slot):
+    start = slot.start
+    ticks = [start + dt.timedelta(minutes=5 * index) for index in range(100)]
+    other_slot.room = slot.room
+    other_slot.start = slot.start
+    other_slot.end = slot.end
+    starting, running, ending = ScheduleView._get_room_timeline(
+        [slot, other_slot], ticks
+    )
+    assert starting == {slot.start: slot}
+    assert ending == {slot.real_end: slot}
+    assert set(running) == {tick for tick in ticks if start < tick < slot.real_end}
+    assert set(running.values()) == {slot}
+
+
 @pytest.mark.django_db
 def test_versioned_schedule_page(
     client, django_assert_num_queries, event, speaker, slot, schedule, other_slot
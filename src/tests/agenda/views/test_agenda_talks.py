@@ -101,8 +101,9 @@ def test_can_see_talk_edit_btn(
 def test_can_see_talk_do_not_record(client, django_assert_num_queries, event, slot):
     slot.submission.do_not_record = True
     slot.submission.save()
-    with django_assert_num_queries(30):
-        response = client.get(slot.submission.urls.public, follow=True)
+    url = slot.submission.urls.public
+    with django_assert_num_queries(29):
+        response = client.get(url, follow=True)
     assert response.status_code == 200
     content = response.content.decode()
     assert "fa-edit" not in content  # edit btn
@@ -1,4 +1,21 @@
+import gzip
+import json
+
 import pytest
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import override_settings
+from django_scopes import scope
+
+from pretalx.agenda.widget import (
+    UPDATE_DELAY,
+    build_widget_data,
+    get_widget_data_name,
+    store_widget_data,
+    update_widget_data,
+)
+from pretalx.common import tasks
 
 
 @pytest.mark.parametrize("url", ("v1.en.js", "v1.json", "v1.css",))
@@ -13,10 +30,14 @@ def test_widget_pages(
     event.settings.show_schedule = show_schedule
     event.settings.show_widget_if_not_public = show_widget_if_not_public
     response = client.get(event.urls.schedule + "widget/" + url, follow=True)
-    assert response.status_code == expected
+    if url.endswith(".js") and expected == 200:
+        # Redirects to the media files, which are not served in tests
+        assert response.redirect_chain[0][1] == 302
+    else:
+        assert response.status_code == expected
 
 
-@pytest.mark.parametrize("locale,expected", (("lo", 404), ("en", 200),))
+@pytest.mark.parametrize("locale,expected", (("lo", 404), ("en", 302),))
 @pytest.mark.django_db
 def test_widget_wrong_locale(event, schedule, client, locale, expected):
     response = client.get(event.urls.schedule + "widget/v1." + locale + ".js")
@@ -29,3 +50,189 @@ def test_widget_with_primary_color(event, schedule, client):
     event.save()
     response = client.get(event.urls.schedule + "widget/v1.css")
     assert event.primary_color in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_widget_script_redirects_to_stored_file(event, other_event, client, mocker):
+    event.settings.show_widget_if_not_public = True
+    other_event.settings.show_widget_if_not_public = True
+    tasks._widget_js_files.clear()
+    generate_widget_js = mocker.spy(tasks, "generate_widget_js")
+    response = client.get(event.urls.schedule + "widget/v1.de.js")
+    assert response.status_code == 302
+    assert "max-age=300" in response["Cache-Control"]
+    file_name = response["Location"][len(default_storage.base_url) :]
+    assert file_name.startswith("widget/widget.de.")
+    content = default_storage.open(file_name).read()
+    assert content.startswith(b'const lang = "de";')
+    assert gzip.decompress(default_storage.open(file_name + ".gz").read()) == content
+    if tasks.brotli:
+        brotli_content = default_storage.open(file_name + ".br").read()
+        assert tasks.brotli.decompress(brotli_content) == content
+
+    response = client.get(other_event.urls.schedule + "widget/v1.de.js")
+    assert response["Location"] == default_storage.url(file_name)
+    assert generate_widget_js.call_count == 1
+
+    # Other processes find the stored files without compressing them again
+    tasks._widget_js_files.clear()
+    compress = mocker.spy(tasks.gzip, "compress")
+    response = client.get(event.urls.schedule + "widget/v1.de.js")
+    assert response["Location"] == default_storage.url(file_name)
+    assert not compress.called
+
+
+@pytest.mark.django_db
+def test_widget_script_in_debug_mode(event, client):
+    event.settings.show_widget_if_not_public = True
+    with override_settings(DEBUG=True):
+        response = client.get(event.urls.schedule + "widget/v1.en.js")
+    assert response.status_code == 200
+    assert response.content.startswith(b'const lang = "en";')
+
+
+@pytest.fixture
+def widget_data_files(event):
+    def clear():
+        for locale in ("en", "de"):
+            default_storage.delete(get_widget_data_name(event, locale))
+
+    clear()
+    yield
+    clear()
+
+
+@pytest.mark.django_db
+def test_store_widget_data(event, slot, widget_data_files):
+    event.locale_array = "en,de"
+    event.save()
+    content = store_widget_data(event)
+    data = json.loads(content)
+    assert data["schedule"][0]["rooms"][0]["talks"][0]["code"] == slot.submission.code
+    for locale in ("en", "de"):
+        name = get_widget_data_name(event, locale)
+        assert default_storage.open(name).read() == build_widget_data(event, locale)
+    modified = default_storage.get_modified_time(get_widget_data_name(event, "en"))
+
+    # Unchanged files are not written again
+    store_widget_data(event)
+    assert (
+        default_storage.get_modified_time(get_widget_data_name(event, "en")) == modified
+    )
+
+    event.is_public = False
+    event.save()
+    store_widget_data(event)
+    assert not default_storage.exists(get_widget_data_name(event, "en"))
+    assert not default_storage.exists(get_widget_data_name(event, "de"))
+
+
+@pytest.mark.django_db
+def test_widget_data_is_served_from_storage(
+    event, slot, client, widget_data_files, django_assert_max_num_queries
+):
+    url = event.urls.schedule + "widget/v1.json"
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response["Access-Control-Allow-Origin"] == "*"
+    assert json.loads(response.content)["schedule"]
+    name = get_widget_data_name(event, "en")
+    assert default_storage.open(name).read() == response.content
+
+    default_storage.delete(name)
+    default_storage.save(name, ContentFile(b'{"stored": true}'))
+    with django_assert_max_num_queries(10):
+        response = client.get(url + "?locale=xx")
+    assert response.content == b'{"stored": true}'
+    assert response["Last-Modified"]
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert response.status_code == 304
+
+
+@pytest.fixture
+def immediate_on_commit(mocker):
+    mocker.patch(
+        "pretalx.agenda.widget.transaction.on_commit", side_effect=lambda func: func()
+    )
+
+
+@pytest.mark.django_db
+def test_widget_data_update_is_debounced(event, mocker, immediate_on_commit):
+    from pretalx.agenda import tasks as agenda_tasks
+
+    cache = LocMemCache("widget", {})
+    mocker.patch("pretalx.agenda.widget.cache", cache)
+    mocker.patch("pretalx.agenda.tasks.cache", cache)
+    mocker.patch("pretalx.agenda.widget.store_widget_data")
+    apply_async = mocker.patch.object(
+        agenda_tasks.regenerate_widget_data, "apply_async"
+    )
+    with override_settings(HAS_CELERY=True):
+        update_widget_data(event)
+        update_widget_data(event)
+        apply_async.assert_called_once_with(
+            kwargs={"event_id": event.pk}, countdown=UPDATE_DELAY
+        )
+
+        agenda_tasks.regenerate_widget_data(event_id=event.pk)
+        update_widget_data(event)
+        assert apply_async.call_count == 2
+
+
+@pytest.mark.django_db
+def test_widget_data_update_without_celery(
+    event, slot, widget_data_files, immediate_on_commit
+):
+    store_widget_data(event)
+    assert default_storage.exists(get_widget_data_name(event, "en"))
+    update_widget_data(event)
+    assert not default_storage.exists(get_widget_data_name(event, "en"))
+
+
+@pytest.mark.django_db
+def test_widget_data_update_triggers(event, slot, unreleased_slot, mocker):
+    update = mocker.patch("pretalx.agenda.signals.update_widget_data")
+    with scope(event=event):
+        event.settings.cfp_request_abstract = False
+        unreleased_slot.save()
+        assert not update.called
+
+        event.settings.show_schedule = False
+        assert update.call_count == 1
+        slot.save()
+        assert update.call_count == 2
+
+
+@pytest.mark.django_db
+def test_widget_data_update_triggers_for_scheduled_submissions(
+    event, slot, submission, mocker
+):
+    update = mocker.patch("pretalx.agenda.signals.update_widget_data")
+    with scope(event=event):
+        submission.title = "Not scheduled"
+        submission.save()
+        assert not update.called
+
+        talk = slot.submission
+        talk.state = "accepted"
+        talk.title = "Accepted talk"
+        talk.save()
+        assert update.call_count == 1
+        talk.remove(force=True)
+        assert update.call_count == 2
+
+        speaker = talk.speakers.first()
+        speaker.name = "Renamed speaker"
+        speaker.save()
+        assert update.call_count == 3
+        speaker.save(update_fields=["last_login"])
+        assert update.call_count == 3
+
+
+@pytest.mark.django_db
+def test_regenerate_widget_data_task(event, slot, widget_data_files):
+    from pretalx.agenda.tasks import regenerate_widget_data
+
+    regenerate_widget_data(event_id=event.pk)
+    assert default_storage.exists(get_widget_data_name(event, "en"))
@@ -51,7 +51,13 @@ def test_question_serializer(answer):
 def test_submitter_serializer(submission):
     user = submission.speakers.first()
     data = SubmitterSerializer(user, context={"event": submission.event}).data
-    assert data.keys() == {"name", "code", "biography", "avatar"}
+    assert data.keys() == {
+        "name",
+        "code",
+        "biography",
+        "avatar",
+        "avatar_thumbnails",
+    }
     assert data["name"] == user.name
     assert data["code"] == user.code
 
@@ -62,7 +68,13 @@ def test_submitter_serializer_without_profile(submission):
         user = submission.speakers.first()
         user.profiles.all().delete()
         data = SubmitterSerializer(user, context={"event": submission.event}).data
-    assert data.keys() == {"name", "code", "biography", "avatar"}
+    assert data.keys() == {
+        "name",
+        "code",
+        "biography",
+        "avatar",
+        "avatar_thumbnails",
+    }
     assert data["name"] == user.name
     assert data["code"] == user.code
     assert data["biography"] == ""
@@ -75,7 +87,14 @@ def test_speaker_serializer(slot):
         user = user_profile.user
         data = SpeakerSerializer(user_profile).data
         assert slot.submission.code in data["submissions"]
-    assert data.keys() == {"name", "code", "biography", "submissions", "avatar"}
+    assert data.keys() == {
+        "name",
+        "code",
+        "biography",
+        "submissions",
+        "avatar",
+        "avatar_thumbnails",
+    }
     assert data["name"] == user.name
     assert data["code"] == user.code
 
@@ -92,6 +111,7 @@ def test_speaker_orga_serializer(slot):
         "biography",
         "submissions",
         "avatar",
+        "avatar_thumbnails",
         "answers",
         "email",
         "availabilities",
@@ -127,6 +147,7 @@ def test_submission_serializer_for_organiser(submission, orga_user, resource):
             "content_locale",
             "slot",
             "image",
+            "image_thumbnails",
             "answers",
             "track",
             "notes",
@@ -175,6 +196,7 @@ def test_submission_serializer(submission, resource):
             "content_locale",
             "slot",
             "image",
+            "image_thumbnails",
             "track",
             "resources",
         }
@@ -208,6 +230,7 @@ def test_submission_slot_serializer(slot):
             "content_locale",
             "slot",
             "image",
+            "image_thumbnails",
             "track",
             "resources",
         }
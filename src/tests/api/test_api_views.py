@@ -1,6 +1,7 @@
 import json
 
 import pytest
+from django.test import override_settings
 from django_scopes import scope
 
 
@@ -59,6 +60,37 @@ def test_orga_can_see_nonpublic_events(orga_client, event, other_event):
     assert content[0]["name"]["en"] == event.name
 
 
+@pytest.mark.django_db
+def test_reviewer_can_see_nonpublic_events(review_client, event, other_event):
+    event.is_public = False
+    event.save()
+    other_event.is_public = False
+    other_event.save()
+
+    response = review_client.get("/api/events", follow=True)
+    content = json.loads(response.content.decode())
+
+    assert response.status_code == 200
+    assert [e["slug"] for e in content] == [event.slug]
+
+
+@pytest.mark.django_db
+def test_event_list_cursor_pagination(client, event, other_event):
+    response = client.get("/api/events/?page_size=1", follow=True)
+    content = json.loads(response.content.decode())
+
+    assert response.status_code == 200
+    assert len(content["results"]) == 1
+    assert content["previous"] is None
+    first = content["results"][0]["slug"]
+
+    response = client.get(content["next"], follow=True)
+    content = json.loads(response.content.decode())
+    assert len(content["results"]) == 1
+    assert content["next"] is None
+    assert {first, content["results"][0]["slug"]} == {event.slug, other_event.slug}
+
+
 @pytest.mark.django_db
 def test_can_only_see_public_submissions(
     client, slot, accepted_submission, rejected_submission, submission
@@ -140,6 +172,37 @@ def test_can_only_see_public_talks(
         )
 
 
+@pytest.mark.django_db(transaction=True)
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "api",
+        }
+    }
+)
+def test_public_talks_are_cached_with_etag(client, slot):
+    url = slot.submission.event.api_urls.talks
+    response = client.get(url, follow=True)
+    assert response.status_code == 200
+    etag = response["ETag"]
+    content = json.loads(response.content.decode())
+    assert content["results"][0]["title"] == slot.submission.title
+
+    response = client.get(url, follow=True, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert not response.content
+
+    with scope(event=slot.submission.event):
+        slot.submission.title = "A new title"
+        slot.submission.save()
+    response = client.get(url, follow=True, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+    content = json.loads(response.content.decode())
+    assert content["results"][0]["title"] == "A new title"
+
+
 @pytest.mark.django_db
 def test_can_only_see_public_talks_if_public_schedule(
     client, slot, accepted_submission, rejected_submission, submission
@@ -283,6 +346,7 @@ def test_can_only_see_public_speakers(
         "biography",
         "submissions",
         "avatar",
+        "avatar_thumbnails",
     }
 
 
@@ -320,6 +384,7 @@ def test_orga_can_see_all_speakers(
         "submissions",
         "answers",
         "avatar",
+        "avatar_thumbnails",
         "availabilities",
     }
     assert set(content["results"][0]["answers"][0].keys()) == {
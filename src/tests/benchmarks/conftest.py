@@ -0,0 +1,57 @@
+"""Benchmarks of pretalx's most expensive pages and operations.
+
+The benchmarks run against a large event built with ``create_test_event
+--scale``, and are only collected if the ``PRETALX_BENCHMARK_SCALE``
+environment variable is set and pytest-benchmark is installed. Run them
+with ``tox -e benchmarks``, which compares the results with the stored
+baselines.
+"""
+import os
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from django_scopes import scopes_disabled
+
+from pretalx.event.models import Event
+from pretalx.person.models import User
+
+try:
+    import pytest_benchmark
+except ImportError:  # pragma: no cover
+    pytest_benchmark = None
+
+SCALE = int(os.environ.get("PRETALX_BENCHMARK_SCALE") or 0)
+
+if not SCALE or not pytest_benchmark:
+    collect_ignore_glob = ["test_*.py"]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def benchmark_cache():
+    """Measure pages with a real cache, as it would be used in production."""
+    with override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    ):
+        yield
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        User.objects.create_superuser(
+            email="benchmark@example.org", password="benchmark"
+        )
+        call_command("create_test_event", scale=SCALE, seed="1")
+
+
+@pytest.fixture
+def large_event(db):
+    with scopes_disabled():
+        return Event.objects.get(slug="democon")
+
+
+@pytest.fixture
+def admin_client(client, large_event):
+    client.force_login(User.objects.get(email="benchmark@example.org"))
+    return client
@@ -0,0 +1,32 @@
+import itertools
+
+import pytest
+from django_scopes import scope
+
+from pretalx.schedule.models import TalkSlot
+
+
+@pytest.mark.django_db
+def test_benchmark_schedule_freeze(benchmark, large_event):
+    versions = (f"benchmark-{number}" for number in itertools.count())
+
+    def setup():
+        # Move a few talks, so that every release comes with changes
+        slots = list(
+            TalkSlot.objects.filter(
+                schedule=large_event.wip_schedule, start__isnull=False
+            ).order_by("?")[:20]
+        )
+        for first, second in zip(slots[::2], slots[1::2]):
+            durations = (first.end - first.start, second.end - second.start)
+            first.start, second.start = second.start, first.start
+            first.room, second.room = second.room, first.room
+            first.end = first.start + durations[0]
+            second.end = second.start + durations[1]
+        TalkSlot.objects.bulk_update(slots, ["start", "end", "room"])
+        return (next(versions),), {}
+
+    with scope(event=large_event):
+        benchmark.pedantic(
+            lambda name: large_event.wip_schedule.freeze(name), setup=setup, rounds=5
+        )
@@ -0,0 +1,36 @@
+import json
+
+import pytest
+from django_scopes import scope
+from i18nfield.utils import I18nJSONEncoder
+
+from pretalx.common import serialize
+from pretalx.schedule.exporters import FrabJsonExporter
+
+
+@pytest.fixture
+def schedule_data(large_event):
+    with scope(event=large_event):
+        exporter = FrabJsonExporter(large_event)
+        exporter.schedule = large_event.current_schedule
+        exporter.is_orga = True
+        return {"schedule": exporter.get_data()}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("encoder", ("I18nJSONEncoder", "json", "orjson"))
+def test_benchmark_encode_schedule(benchmark, schedule_data, encoder, monkeypatch):
+    """Compares the encoder used before exporters built plain data with the
+    standard library and the optional orjson encoder."""
+    benchmark.group = "encode schedule"
+    if encoder == "I18nJSONEncoder":
+        content = benchmark(json.dumps, schedule_data, cls=I18nJSONEncoder)
+    else:
+        if encoder == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(serialize, "orjson", None)
+        content = benchmark(serialize.dumps, schedule_data)
+    assert json.loads(content) == json.loads(
+        json.dumps(schedule_data, cls=I18nJSONEncoder)
+    )
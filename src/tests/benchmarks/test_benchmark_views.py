@@ -0,0 +1,34 @@
+import pytest
+
+
+@pytest.mark.django_db
+def test_benchmark_schedule_page(benchmark, client, large_event):
+    response = benchmark(client.get, large_event.urls.schedule)
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("exporter", ("frab_xml", "frab_xcal", "frab_json"))
+def test_benchmark_frab_exporters(benchmark, client, large_event, exporter):
+    response = benchmark(client.get, getattr(large_event.urls, exporter))
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("endpoint", ("submissions", "talks", "speakers", "reviews"))
+def test_benchmark_api_lists(benchmark, admin_client, large_event, endpoint):
+    url = getattr(large_event.api_urls, endpoint)
+    response = benchmark(admin_client.get, f"{url}?limit=100")
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_benchmark_review_dashboard(benchmark, admin_client, large_event):
+    response = benchmark(admin_client.get, large_event.orga_urls.reviews)
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_benchmark_mail_outbox(benchmark, admin_client, large_event):
+    response = benchmark(admin_client.get, large_event.orga_urls.outbox)
+    assert response.status_code == 200
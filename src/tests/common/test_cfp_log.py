@@ -1,7 +1,11 @@
 import pytest
+from django.db import transaction
+from django.utils.timezone import now
 from django_scopes import scope
 
+from pretalx.common.mixins.models import buffered_logging
 from pretalx.common.models.log import LOG_NAMES, ActivityLog
+from pretalx.submission.models import Submission
 
 
 @pytest.fixture
@@ -46,3 +50,84 @@ def test_log_urls(activity_log, submission, choice_question, answer, mail_templa
 
         activity_log.content_object = mail_template
         assert activity_log.get_orga_url() == mail_template.urls.base
+
+
+@pytest.mark.django_db
+def test_log_action_without_buffer(submission, django_assert_num_queries):
+    with scope(event=submission.event):
+        submission.log_action("pretalx.submission.update")
+        count = submission.logged_actions().count()
+        with django_assert_num_queries(1):
+            submission.log_action("pretalx.submission.update", data={"foo": 1})
+        assert submission.logged_actions().count() == count + 1
+
+
+@pytest.mark.django_db
+def test_log_action_buffered(submission, other_submission, django_assert_num_queries):
+    with scope(event=submission.event):
+        submission.log_action("pretalx.submission.update")
+        other_submission.event = submission.event
+        count = ActivityLog.objects.count()
+        with django_assert_num_queries(2):  # One count, one insert
+            with buffered_logging():
+                with buffered_logging():
+                    submission.log_action("pretalx.submission.update")
+                    other_submission.log_action(
+                        "pretalx.submission.update", data={"password": "hunter2"}
+                    )
+                assert ActivityLog.objects.count() == count
+        assert ActivityLog.objects.count() == count + 2
+        entry = other_submission.logged_actions().first()
+        assert entry.content_object == other_submission
+        assert entry.event == submission.event
+        assert "hunter2" not in entry.data
+
+
+@pytest.mark.django_db
+def test_log_action_buffered_in_atomic_block(submission):
+    with scope(event=submission.event):
+        count = ActivityLog.objects.count()
+        with buffered_logging():
+            with pytest.raises(ValueError):
+                with transaction.atomic():
+                    submission.log_action("pretalx.submission.update")
+                    raise ValueError
+            with transaction.atomic():
+                submission.log_action("pretalx.submission.accept")
+            # Entries logged in an atomic block are written with its changes
+            assert ActivityLog.objects.count() == count + 1
+        assert ActivityLog.objects.count() == count + 1
+        assert submission.logged_actions().first().action_type == (
+            "pretalx.submission.accept"
+        )
+
+
+@pytest.mark.django_db
+def test_log_action_buffered_keeps_timestamp(submission):
+    with scope(event=submission.event):
+        with buffered_logging():
+            submission.log_action("pretalx.submission.update")
+            logged_at = now()
+        assert submission.logged_actions().first().timestamp <= logged_at
+
+
+@pytest.mark.django_db
+def test_log_actions_bulk(submission, other_submission, orga_user):
+    with scope(event=submission.event):
+        Submission.log_actions(
+            [submission, other_submission],
+            "pretalx.submission.accept",
+            person=orga_user,
+            orga=True,
+        )
+        for obj in (submission, other_submission):
+            entry = obj.logged_actions().first()
+            assert entry.action_type == "pretalx.submission.accept"
+            assert entry.person == orga_user
+            assert entry.is_orga_action
+
+
+@pytest.mark.django_db
+def test_log_data_must_be_dict(submission):
+    with pytest.raises(TypeError):
+        submission.log_action("pretalx.submission.update", data=["foo"])
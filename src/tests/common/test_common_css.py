@@ -87,3 +87,50 @@ def test_regenerate_css_no_event():
     from pretalx.common.tasks import regenerate_css
 
     regenerate_css(123)
+
+
+@pytest.mark.django_db
+@override_settings(COMPRESS_PRECOMPILERS=settings.COMPRESS_PRECOMPILERS_ORIGINAL)
+def test_regenerate_css_shares_files_between_events(event, other_event, mocker):
+    from pretalx.common import tasks
+
+    compile_scss = mocker.spy(tasks, "compile_scss")
+    compile_counts = []
+    for current_event in (event, other_event):
+        current_event.primary_color = "#00fe01"
+        current_event.settings.widget_css_checksum = "placeholder"
+        current_event.save()
+        tasks.regenerate_css(current_event.pk)
+        compile_counts.append(compile_scss.call_count)
+    event = Event.objects.get(pk=event.pk)
+    other_event = Event.objects.get(pk=other_event.pk)
+    for key in ("agenda_css_file", "cfp_css_file", "widget_css_checksum"):
+        assert event.settings.get(key) == other_event.settings.get(key)
+    assert event.settings.widget_css.name == other_event.settings.widget_css.name
+    assert compile_counts[0] == compile_counts[1]
+
+    other_event.primary_color = "#00fe02"
+    other_event.save()
+    tasks.regenerate_css(other_event.pk)
+    other_event = Event.objects.get(pk=other_event.pk)
+    assert event.settings.cfp_css_file != other_event.settings.cfp_css_file
+    assert (
+        event.settings.widget_css_checksum != other_event.settings.widget_css_checksum
+    )
+
+
+def test_get_scss_checksum(tmp_path):
+    from pretalx.common.tasks import get_scss_checksum
+
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "main.scss").write_text("a { color: red; }")
+    (tmp_path / "app" / "script.js").write_text("")
+    checksum = get_scss_checksum(tmp_path)
+    (tmp_path / "app" / "script.js").write_text("alert(1);")
+    get_scss_checksum.cache_clear()
+    assert get_scss_checksum(tmp_path) == checksum
+    (tmp_path / "app" / "main.scss").write_text("a { color: blue; }")
+    # The checksum is only computed once per process and directory
+    assert get_scss_checksum(tmp_path) == checksum
+    get_scss_checksum.cache_clear()
+    assert get_scss_checksum(tmp_path) != checksum
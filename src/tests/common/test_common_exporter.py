@@ -1,6 +1,9 @@
 import pytest
 
-from pretalx.common.exporter import BaseExporter
+from pretalx.common import exporter as exporter_module
+from pretalx.common.exporter import BaseExporter, get_exporter, get_exporters
+from pretalx.common.signals import register_data_exporters
+from pretalx.schedule.exporters import FrabJsonExporter
 
 
 def test_common_base_exporter_raises_proper_exceptions():
@@ -17,3 +20,38 @@ def test_common_base_exporter_raises_proper_exceptions():
         exporter.render()
     with pytest.raises(NotImplementedError):
         str(exporter)
+
+
+@pytest.fixture
+def exporter_registry(monkeypatch):
+    registry = {}
+    monkeypatch.setattr(exporter_module, "_exporter_registry", registry)
+    return registry
+
+
+@pytest.mark.django_db
+def test_get_exporters_is_cached_per_plugin_list(event, exporter_registry, mocker):
+    send = mocker.spy(register_data_exporters, "send")
+    exporters = get_exporters(event)
+    assert exporters["schedule.json"] is FrabJsonExporter
+    assert list(exporters) == [
+        exporter(event).identifier
+        for __, exporter in register_data_exporters.send(event)
+    ]
+    send.reset_mock()
+
+    assert get_exporters(event) is exporters
+    assert not send.called
+
+    event.plugins = "tests"
+    assert get_exporters(event) == exporters
+    assert send.call_count == 1
+    assert len(exporter_registry) == 2
+
+
+@pytest.mark.django_db
+def test_get_exporter(event, exporter_registry):
+    exporter = get_exporter(event, "schedule.json")
+    assert isinstance(exporter, FrabJsonExporter)
+    assert exporter.event == event
+    assert get_exporter(event, "nonexistent") is None
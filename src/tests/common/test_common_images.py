@@ -0,0 +1,183 @@
+from io import BytesIO
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django_scopes import scope
+from PIL import Image
+
+from pretalx.api.serializers.submission import SubmissionSerializer
+from pretalx.common.images import (
+    THUMBNAIL_SIZES,
+    create_thumbnails,
+    get_thumbnail_name,
+    get_thumbnail_size,
+    get_thumbnail_url,
+)
+from pretalx.common.tasks import generate_thumbnails
+from pretalx.common.templatetags.thumbnail import thumbnail, thumbnail_url
+
+
+def make_image(name="image.png", size=(1000, 500), mode="RGB", image_format="PNG"):
+    buffer = BytesIO()
+    Image.new(mode, size, "red").save(buffer, format=image_format)
+    return SimpleUploadedFile(name, buffer.getvalue())
+
+
+@pytest.fixture
+def thumbnail_task(mocker):
+    """Runs on_commit callbacks right away, and returns a spy on the
+    thumbnail task."""
+    mocker.patch(
+        "pretalx.common.mixins.models.transaction.on_commit",
+        side_effect=lambda func: func(),
+    )
+    return mocker.spy(generate_thumbnails, "apply_async")
+
+
+@pytest.mark.parametrize(
+    "size,expected", ((1, 64), (64, 64), (65, 160), (480, 480), (1000, 480))
+)
+def test_get_thumbnail_size(size, expected):
+    assert get_thumbnail_size(size) == expected
+
+
+@pytest.mark.parametrize(
+    "mode,extension,image_format",
+    (("RGB", "jpg", "JPEG"), ("RGBA", "png", "PNG"), ("L", "jpg", "JPEG")),
+)
+@pytest.mark.django_db
+def test_create_thumbnails(submission, mode, extension, image_format):
+    with scope(event=submission.event):
+        submission.image = make_image(mode=mode)
+        submission.save()
+        key = create_thumbnails(submission.image)
+    assert key.endswith(f".{extension}")
+    for size in THUMBNAIL_SIZES:
+        with default_storage.open(get_thumbnail_name(key, size)) as f:
+            image = Image.open(f)
+            assert image.format == image_format
+            assert image.size == (size, size // 2)
+        with default_storage.open(get_thumbnail_name(key, size, webp=True)) as f:
+            assert Image.open(f).format == "WEBP"
+    # Identical images share their thumbnails
+    with scope(event=submission.event):
+        submission.image = make_image(name="other.png", mode=mode)
+        submission.save()
+        assert create_thumbnails(submission.image) == key
+
+
+@pytest.mark.django_db
+def test_create_thumbnails_does_not_enlarge(speaker):
+    speaker.avatar = make_image(size=(100, 80), image_format="JPEG")
+    speaker.save()
+    key = create_thumbnails(speaker.avatar)
+    with default_storage.open(get_thumbnail_name(key, 480)) as f:
+        assert Image.open(f).size == (100, 80)
+    with default_storage.open(get_thumbnail_name(key, 64)) as f:
+        assert Image.open(f).size == (64, 51)
+
+
+@pytest.mark.django_db
+def test_thumbnails_are_generated_on_upload(speaker, thumbnail_task):
+    speaker.avatar = make_image()
+    speaker.save()
+    speaker.refresh_from_db()
+    assert speaker.avatar_thumbnails.endswith(".jpg")
+    assert get_thumbnail_url(speaker.avatar, 100) == default_storage.url(
+        get_thumbnail_name(speaker.avatar_thumbnails, 160)
+    )
+
+    assert thumbnail_task.call_count == 1
+    thumbnail_task.reset_mock()
+    speaker.name = "Changed"
+    speaker.save()
+    speaker.save(update_fields=["name"])
+    assert not thumbnail_task.called
+    speaker.refresh_from_db()
+    assert speaker.avatar_thumbnails
+
+    speaker.avatar = None
+    speaker.save(update_fields=["avatar"])
+    speaker.refresh_from_db()
+    assert speaker.avatar_thumbnails is None
+    assert not thumbnail_task.called
+
+
+@pytest.mark.django_db
+def test_generate_thumbnails_for_replaced_image(speaker):
+    speaker.avatar = make_image()
+    speaker.save()
+    old_name = speaker.avatar.name
+    speaker.avatar = make_image(name="new.png", mode="RGBA")
+    speaker.save()
+    # A late task for the old image must not overwrite anything
+    speaker.avatar.name = old_name
+    generate_thumbnails(speaker._meta.label, speaker.pk, "avatar")
+    speaker.refresh_from_db()
+    assert speaker.avatar_thumbnails.endswith(".png")
+
+
+@pytest.mark.django_db
+def test_generate_thumbnails_invalidates_api_cache(speaker, submission, mocker):
+    invalidate = mocker.patch("pretalx.api.mixins.invalidate_public_api_cache")
+    speaker.avatar = make_image()
+    speaker.save()
+    generate_thumbnails(speaker._meta.label, speaker.pk, "avatar")
+    invalidate.assert_called_once_with(submission.event)
+
+    invalidate.reset_mock()
+    with scope(event=submission.event):
+        submission.image = make_image()
+        submission.save()
+    generate_thumbnails(submission._meta.label, submission.pk, "image")
+    invalidate.assert_called_once_with(submission.event)
+
+
+@pytest.mark.django_db
+def test_thumbnail_templatetags(speaker):
+    assert thumbnail(speaker.avatar, 160) == ""
+    assert thumbnail_url(speaker.avatar, 160) == ""
+
+    speaker.avatar = make_image()
+    speaker.save()
+    assert thumbnail(speaker.avatar, 160, alt="Jane") == (
+        f'<img src="{speaker.avatar.url}" alt="Jane">'
+    )
+    assert thumbnail_url(speaker.avatar, 160) == speaker.avatar.url
+
+    generate_thumbnails(speaker._meta.label, speaker.pk, "avatar")
+    speaker.refresh_from_db()
+    webp_url = default_storage.url(
+        get_thumbnail_name(speaker.avatar_thumbnails, 160, webp=True)
+    )
+    jpg_url = default_storage.url(get_thumbnail_name(speaker.avatar_thumbnails, 160))
+    assert thumbnail(speaker.avatar, 160, alt="Jane") == (
+        f'<picture><source type="image/webp" srcset="{webp_url}">'
+        f'<img src="{jpg_url}" alt="Jane"></picture>'
+    )
+    assert thumbnail_url(speaker.avatar, 160) == jpg_url
+
+
+@pytest.mark.django_db
+def test_thumbnail_serializer_field(submission, rf):
+    with scope(event=submission.event):
+        assert SubmissionSerializer(submission).data["image_thumbnails"] is None
+        submission.image = make_image()
+        submission.save()
+        generate_thumbnails(submission._meta.label, submission.pk, "image")
+        submission.refresh_from_db()
+        request = rf.get("/")
+        request.event = submission.event
+        request.user = AnonymousUser()
+        data = SubmissionSerializer(submission, context={"request": request}).data
+    assert data["image_thumbnails"].keys() == {"64", "160", "480"}
+    assert data["image_thumbnails"]["64"] == {
+        "webp": "http://testserver"
+        + default_storage.url(
+            get_thumbnail_name(submission.image_thumbnails, 64, webp=True)
+        ),
+        "jpg": "http://testserver"
+        + default_storage.url(get_thumbnail_name(submission.image_thumbnails, 64)),
+    }
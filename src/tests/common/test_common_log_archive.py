@@ -0,0 +1,109 @@
+import datetime as dt
+
+import pytest
+from django.utils.timezone import now
+from django_scopes import scope, scopes_disabled
+
+from pretalx.common.log_archive import (
+    archive_log_entries,
+    get_archive_path,
+    read_archived_log_entries,
+)
+from pretalx.common.models import ActivityLog
+
+
+@pytest.fixture(autouse=True)
+def log_archive_root(settings, tmp_path):
+    settings.LOG_ARCHIVE_ROOT = tmp_path
+
+
+@pytest.mark.django_db
+def test_archive_log_entries(submission, other_submission, orga_user):
+    event = submission.event
+    with scope(event=event):
+        for index in range(5):
+            submission.log_action(
+                "pretalx.submission.update", person=orga_user, orga=True
+            )
+        other_submission.log_action("pretalx.submission.create")
+        ActivityLog.objects.filter(event=event).update(
+            timestamp=now() - dt.timedelta(days=400)
+        )
+        submission.log_action("pretalx.submission.accept", data={"a": 1})
+        recent = ActivityLog.objects.filter(event=event).first()
+        expected = list(
+            ActivityLog.objects.filter(event=event)
+            .exclude(pk=recent.pk)
+            .order_by("pk")
+            .values_list("pk", "action_type", "object_id", "data")
+        )
+
+    assert archive_log_entries(
+        event, before=now() - dt.timedelta(days=365), batch_size=2
+    ) == len(expected)
+    assert len(list(get_archive_path(event).iterdir())) == 3
+    with scopes_disabled():
+        assert list(ActivityLog.objects.filter(event=event)) == [recent]
+
+    archived = list(read_archived_log_entries(event))
+    assert [
+        (entry.pk, entry.action_type, entry.object_id, entry.data) for entry in archived
+    ] == expected
+    assert archived[0].content_object == submission
+    assert archived[0].person == orga_user
+    assert archived[0].is_orga_action is True
+    assert archived[0].timestamp < now() - dt.timedelta(days=365)
+
+
+@pytest.mark.django_db
+def test_read_archived_log_entries_without_archive(event):
+    assert list(read_archived_log_entries(event)) == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_shred_deletes_log_archive(submission):
+    event = submission.event
+    with scope(event=event):
+        submission.log_action("pretalx.submission.update")
+    archive_log_entries(event, before=now() + dt.timedelta(days=1))
+    assert get_archive_path(event).exists()
+    with scopes_disabled():
+        event.shred()
+    assert not get_archive_path(event).exists()
+
+
+@pytest.mark.django_db
+def test_logged_actions_with_archive(submission, other_submission):
+    event = submission.event
+    with scope(event=event):
+        submission.log_action("pretalx.submission.create")
+        other_submission.log_action("pretalx.submission.create")
+        submission.log_action("pretalx.submission.update")
+    archive_log_entries(event, before=now() + dt.timedelta(days=1))
+    with scope(event=event):
+        submission.log_action("pretalx.submission.accept")
+        assert [entry.action_type for entry in submission.logged_actions()] == [
+            "pretalx.submission.accept"
+        ]
+        assert [
+            entry.action_type for entry in submission.logged_actions_with_archive()
+        ] == [
+            "pretalx.submission.accept",
+            "pretalx.submission.update",
+            "pretalx.submission.create",
+        ]
+    newest = next(read_archived_log_entries(event, newest_first=True))
+    assert newest.action_type == "pretalx.submission.update"
+
+
+@pytest.mark.django_db
+def test_dashboard_history_shows_archived_entries(orga_client, submission):
+    event = submission.event
+    with scope(event=event):
+        submission.log_action("pretalx.submission.create")
+    archive_log_entries(event, before=now() + dt.timedelta(days=1))
+    response = orga_client.get(event.orga_urls.base)
+    assert response.status_code == 200
+    assert [entry.action_type for entry in response.context["history"]] == [
+        "pretalx.submission.create"
+    ]
@@ -1,6 +1,13 @@
+import datetime as dt
+
 import pytest
 from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils.timezone import now
+from django_scopes import scope, scopes_disabled
 
+from pretalx.common.log_archive import read_archived_log_entries
+from pretalx.common.models import ActivityLog
 from pretalx.event.models import Event
 
 
@@ -16,6 +23,26 @@ def test_common_test_event(administrator, stage):
     assert Event.objects.get(slug="democon")
 
 
+@pytest.mark.parametrize("stage", ("cfp", "schedule"))
+@pytest.mark.django_db
+def test_common_test_event_at_scale(administrator, stage):
+    call_command("create_test_event", stage=stage, scale=2, seed="1")
+    with scopes_disabled():
+        event = Event.objects.get(slug="democon")
+        assert event.submissions.count() == 200
+        assert event.rooms.count() == 2
+        if stage == "schedule":
+            assert event.reviews.count() == 2000
+            assert event.schedules.count() == 4
+            assert event.current_schedule.talks.filter(is_visible=True).exists()
+
+
+@pytest.mark.django_db
+def test_common_test_event_invalid_scale(administrator):
+    with pytest.raises(CommandError):
+        call_command("create_test_event", scale=0)
+
+
 @pytest.mark.django_db
 def test_common_test_event_without_user():
     call_command("create_test_event")
@@ -26,3 +53,24 @@ def test_common_test_event_without_user():
 def test_common_test_regenerate_css(event):
     call_command("regenerate_css")
     call_command("regenerate_css", event=event.slug)
+
+
+@pytest.mark.django_db
+def test_common_archive_logs(submission, settings, tmp_path):
+    settings.LOG_ARCHIVE_ROOT = tmp_path
+    with scope(event=submission.event):
+        submission.log_action("pretalx.submission.update")
+        ActivityLog.objects.update(timestamp=now() - dt.timedelta(days=30))
+    call_command("archive_logs", days=60)
+    with scopes_disabled():
+        assert ActivityLog.objects.count() == 1
+    call_command("archive_logs", days=7, event=submission.event.slug)
+    with scopes_disabled():
+        assert ActivityLog.objects.count() == 0
+    assert len(list(read_archived_log_entries(submission.event))) == 1
+
+
+@pytest.mark.django_db
+def test_common_archive_logs_unknown_event(event):
+    with pytest.raises(CommandError):
+        call_command("archive_logs", event="nope")
@@ -0,0 +1,78 @@
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from pretalx.common.cache import NamespacedCache
+from pretalx.common.metrics import (
+    collect_metrics,
+    get_metrics,
+    render_metrics,
+    start_collecting,
+    stop_collecting,
+)
+from pretalx.event.models import Event
+
+METRICS_SETTINGS = {
+    "METRICS_ENABLED": True,
+    "CACHES": {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+}
+
+
+@pytest.fixture
+def metrics_cache():
+    with override_settings(**METRICS_SETTINGS):
+        cache.clear()
+        yield
+        cache.clear()
+
+
+@pytest.mark.django_db
+def test_collect_metrics(metrics_cache):
+    namespace = NamespacedCache("test")
+    namespace.set("key", "value")
+    with collect_metrics("task", "pretalx.test"):
+        list(Event.objects.all())
+        list(Event.objects.all())
+        namespace.get("key")
+        namespace.get("other_key")
+    metrics = get_metrics()[("task", "pretalx.test")]
+    assert metrics["count"] == 1
+    assert metrics["queries"] == 2
+    assert metrics["cache_hits"] == 1
+    assert metrics["cache_misses"] == 1
+    assert metrics["duration"] >= metrics["query_duration"] > 0
+
+
+@pytest.mark.django_db
+def test_collect_nested_metrics(metrics_cache):
+    start_collecting()
+    list(Event.objects.all())
+    with collect_metrics("task", "inner"):
+        list(Event.objects.all())
+    stop_collecting("view", "outer", response_bytes=10)
+    metrics = get_metrics()
+    assert metrics[("task", "inner")]["queries"] == 1
+    assert metrics[("view", "outer")]["queries"] == 2
+    assert metrics[("view", "outer")]["response_bytes"] == 10
+
+
+@pytest.mark.django_db
+def test_metrics_disabled():
+    with collect_metrics("task", "pretalx.test"):
+        list(Event.objects.all())
+    stop_collecting("task", "other")  # Does nothing without a collector
+    assert render_metrics() == "\n"
+
+
+@pytest.mark.django_db
+def test_render_metrics(metrics_cache):
+    with collect_metrics("view", 'cfp:event."weird"'):
+        list(Event.objects.all())
+    with collect_metrics("task", "pretalx.test"):
+        pass
+    content = render_metrics()
+    assert "# TYPE pretalx_view_requests_total counter" in content
+    assert 'pretalx_view_requests_total{view="cfp:event.\\"weird\\""} 1' in content
+    assert 'pretalx_view_db_queries_total{view="cfp:event.\\"weird\\""} 1' in content
+    assert 'pretalx_task_runs_total{task="pretalx.test"} 1' in content
+    assert "pretalx_task_db_queries_total" not in content
@@ -0,0 +1,74 @@
+import datetime as dt
+import decimal
+import json
+import uuid
+
+import pytest
+import pytz
+from django.utils.translation import gettext_lazy
+from i18nfield.strings import LazyI18nString
+from i18nfield.utils import I18nJSONEncoder
+
+from pretalx.common import serialize
+from pretalx.common.serialize import dumps, json_default, serialize_datetime
+
+DATA = {
+    "i18n": LazyI18nString({"en": "Talk", "de": "Vortrag"}),
+    "plain_i18n": LazyI18nString("Talk"),
+    "lazy": gettext_lazy("Schedule"),
+    "datetime": dt.datetime(2020, 1, 2, 10, 30, 15, 123456, tzinfo=pytz.utc),
+    "local_datetime": pytz.timezone("Europe/Berlin").localize(
+        dt.datetime(2020, 1, 2, 10, 30)
+    ),
+    "naive_datetime": dt.datetime(2020, 1, 2, 10, 30),
+    "date": dt.date(2020, 1, 2),
+    "time": dt.time(10, 30, 0, 500000),
+    "duration": dt.timedelta(minutes=90),
+    "decimal": decimal.Decimal("1.50"),
+    "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "nested": [{"text": "Ümläut ☃", 1: None, "bool": True, "number": 1.5}],
+    "tuple": (1, 2),
+}
+
+
+@pytest.fixture(params=("orjson", "json"))
+def encoder(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialize, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        (
+            dt.datetime(2020, 1, 2, 10, 30, 15, 123456, tzinfo=pytz.utc),
+            "2020-01-02T10:30:15.123Z",
+        ),
+        (dt.datetime(2020, 1, 2, 10, 30), "2020-01-02T10:30:00"),
+        (dt.date(2020, 1, 2), "2020-01-02"),
+        (dt.time(10, 30, 0, 500000), "10:30:00.500"),
+    ),
+)
+def test_serialize_datetime(value, expected):
+    assert serialize_datetime(value) == expected
+
+
+@pytest.mark.django_db
+def test_dumps_matches_i18n_json_encoder(encoder):
+    content = dumps(DATA)
+    assert isinstance(content, bytes)
+    assert b", " not in content
+    assert json.loads(content) == json.loads(json.dumps(DATA, cls=I18nJSONEncoder))
+
+
+def test_dumps_unknown_type(encoder):
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+def test_json_default_aware_time():
+    with pytest.raises(ValueError):
+        json_default(dt.time(10, 30, tzinfo=pytz.utc))
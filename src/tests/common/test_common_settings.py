@@ -0,0 +1,56 @@
+import pytest
+from django.test import override_settings
+from i18nfield.strings import LazyI18nString
+
+from pretalx.common.models.settings import get_settings_snapshot
+from pretalx.event.models import Event
+
+
+@pytest.mark.django_db
+def test_settings_snapshot_values(event):
+    event.settings.custom_domain = "https://talks.example.org"
+    event.settings.show_schedule = False
+    snapshot = event.settings_snapshot
+    assert snapshot.custom_domain == "https://talks.example.org"
+    assert snapshot.show_schedule is False
+    assert snapshot.use_tracks is True
+    assert snapshot["show_schedule"] is False
+    assert isinstance(snapshot.mail_text_event_created, LazyI18nString)
+    assert snapshot.get("does_not_exist", "default") == "default"
+    assert snapshot.does_not_exist is None
+
+
+@pytest.mark.django_db
+def test_settings_snapshot_is_read_only(event):
+    with pytest.raises(AttributeError):
+        event.settings_snapshot.show_schedule = False
+    with pytest.raises(AttributeError):
+        del event.settings_snapshot.show_schedule
+
+
+@pytest.mark.django_db
+def test_settings_snapshot_is_dropped_on_change(event):
+    assert event.settings_snapshot.show_schedule is True
+    event.settings.show_schedule = False
+    assert event.settings_snapshot.show_schedule is False
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+def test_settings_snapshot_is_shared_and_invalidated(event):
+    event.settings.custom_domain = "https://old.example.org"
+    assert get_settings_snapshot(event).custom_domain == "https://old.example.org"
+
+    # Queryset updates send no signals, so the cached snapshot is used
+    event.settings._objects.filter(key="custom_domain").update(
+        value="https://talks.example.org"
+    )
+    other_instance = Event.objects.get(pk=event.pk)
+    assert other_instance.settings_snapshot.custom_domain == "https://old.example.org"
+
+    event.settings.show_schedule = False
+    other_instance = Event.objects.get(pk=event.pk)
+    assert other_instance.settings_snapshot.custom_domain == "https://talks.example.org"
+    assert other_instance.settings_snapshot.show_schedule is False
@@ -23,3 +23,56 @@ def test_cant_call_signal_without_event(event):
     with pytest.raises(Exception):
         footer_link.send("something", request="test")
     footer_link.send(event, request="test")
+
+
+@pytest.mark.django_db
+def test_active_receivers_are_cached_per_plugin_list(event, mocker):
+    signal = EventPluginSignal()
+    signal.connect(footer_link_test)
+    is_active = mocker.spy(EventPluginSignal, "_is_active")
+
+    event.plugins = None
+    assert signal.send(event, request=None) == []
+    assert is_active.call_count == 1
+    assert signal.send(event, request=None) == []
+    assert is_active.call_count == 1
+
+    event.plugins = "tests"
+    assert signal.send(event, request=None) == [
+        (footer_link_test, {"link": "/test", "label": "test"})
+    ]
+    assert signal.send_robust(event, request=None) == [
+        (footer_link_test, {"link": "/test", "label": "test"})
+    ]
+    assert is_active.call_count == 2
+
+
+@pytest.mark.django_db
+def test_active_receivers_cache_is_cleared_on_connect(event):
+    signal = EventPluginSignal()
+    event.plugins = "tests"
+    assert signal.send(event, request=None) == []
+
+    signal.connect(footer_link_test)
+    assert signal.send(event, request=None) == [
+        (footer_link_test, {"link": "/test", "label": "test"})
+    ]
+    signal.disconnect(footer_link_test)
+    assert signal.send(event, request=None) == []
+
+
+@pytest.mark.django_db
+def test_active_receivers_cache_drops_dead_receivers(event):
+    signal = EventPluginSignal()
+    event.plugins = "tests"
+
+    def receiver(sender, **kwargs):
+        return "response"
+
+    receiver.__module__ = footer_link_test.__module__
+    signal.connect(receiver)
+    assert signal.send(event) == [(receiver, "response")]
+
+    del receiver
+    assert signal.send(event) == []
+    assert not signal.receivers
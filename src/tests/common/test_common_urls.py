@@ -0,0 +1,52 @@
+import pytest
+from django_scopes import scope
+
+from pretalx.common.urls import EventUrlBuilder
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "custom_domain,html_export_url",
+    (
+        (None, None),
+        ("https://talks.example.org", None),
+        ("https://talks.example.org", "https://export.example.org/"),
+    ),
+)
+def test_event_url_builder_matches_urls(slot, speaker, custom_domain, html_export_url):
+    event = slot.submission.event
+    if custom_domain:
+        event.settings.custom_domain = custom_domain
+    if html_export_url:
+        event.settings.html_export_url = html_export_url
+    builder = EventUrlBuilder(event)
+    submission = slot.submission
+    submission.event = event
+    with scope(event=event):
+        profile = speaker.event_profile(event)
+        profile.event = event
+        schedule = slot.schedule
+
+    for full in (False, True):
+        for name in ("public", "ical", "feedback"):
+            expected = getattr(submission.urls, name)
+            assert builder.submission_url(submission.code, name, full=full) == (
+                expected.full() if full else expected
+            )
+        expected = submission.orga_urls.base
+        assert builder.submission_orga_url(submission.code, full=full) == (
+            expected.full() if full else expected
+        )
+        for name in ("public", "talks_ical"):
+            expected = getattr(profile.urls, name)
+            assert builder.speaker_url(speaker.code, name, full=full) == (
+                expected.full() if full else expected
+            )
+        expected = schedule.urls.public
+        assert builder.schedule_url(schedule.url_version, full=full) == (
+            expected.full() if full else expected
+        )
+        expected = event.urls.schedule
+        assert builder.event_url("schedule", full=full) == (
+            expected.full() if full else expected
+        )
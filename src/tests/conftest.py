@@ -4,6 +4,7 @@ import pytest
 import pytz
 from django.core import management
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
 from django.utils.timezone import now
 from django_scopes import scope, scopes_disabled
 
@@ -31,6 +32,14 @@ def collect_static(request):
     management.call_command("collectstatic", "--noinput", "--clear")
 
 
+@pytest.fixture(autouse=True)
+def reset_timezone():
+    """Requests activate the event's time zone, which must not leak into the
+    next test running in the same process."""
+    yield
+    timezone.deactivate()
+
+
 @pytest.fixture
 def template_patch(monkeypatch):
     # Patch out template rendering for performance improvements
@@ -7,7 +7,11 @@ from django.utils.timezone import now
 from django_scopes import scopes_disabled
 
 from pretalx.common.models.log import ActivityLog
-from pretalx.event.services import periodic_event_services, task_periodic_event_services
+from pretalx.event.services import (
+    periodic_event_services,
+    task_periodic_event_services,
+    task_periodic_schedule_export,
+)
 
 
 @pytest.mark.django_db
@@ -121,11 +125,68 @@ def test_periodic_event_services_schedule_export(
     ActivityLog.objects.create(event=event, content_object=event, action_type="test")
     event.cache.set("rebuild_schedule_export", should_rebuild_schedule)
     assert event.cache.get("rebuild_schedule_export") is should_rebuild_schedule
-    periodic_event_services(event.slug)
+    task_periodic_schedule_export(event.slug)
     event = event.__class__.objects.get(slug=event.slug)
     assert not event.cache.get("rebuild_schedule_export")
 
 
+@pytest.mark.django_db
+def test_periodic_event_services_skips_past_events(event, monkeypatch):
+    dispatched = []
+    monkeypatch.setattr(
+        task_periodic_event_services,
+        "apply_async",
+        lambda args: dispatched.append(args[0]),
+    )
+    with scopes_disabled():
+        event.date_from = now().date() - dt.timedelta(days=30)
+        event.date_to = now().date() - dt.timedelta(days=28)
+        event.save()
+        event.cfp.deadline = now() - dt.timedelta(days=60)
+        event.cfp.save()
+        ActivityLog.objects.filter(event=event).update(
+            timestamp=now() - dt.timedelta(days=11)
+        )
+    periodic_event_services(event.slug)
+    assert dispatched == []
+
+    ActivityLog.objects.create(event=event, content_object=event, action_type="test")
+    periodic_event_services(event.slug)
+    assert dispatched == [event.slug]
+
+
+@pytest.mark.django_db
+def test_periodic_event_services_updates_due_review_phases(event):
+    with scopes_disabled():
+        phases = list(event.review_phases.all().order_by("position"))
+        for phase in phases:
+            phase.is_active = False
+            phase.start = now() + dt.timedelta(days=10)
+            phase.end = None
+            phase.save()
+    periodic_event_services(event.slug)
+    with scopes_disabled():
+        assert not event.review_phases.filter(is_active=True).exists()
+
+    with scopes_disabled():
+        phases[0].start = now() - dt.timedelta(days=1)
+        phases[0].save()
+    periodic_event_services(event.slug)
+    with scopes_disabled():
+        assert event.review_phases.get(is_active=True) == phases[0]
+
+
 @pytest.mark.django_db
 def test_periodic_event_fail():
     task_periodic_event_services("lololol")
+
+
+@pytest.mark.django_db
+def test_task_periodic_event_created_without_log_entries(event):
+    djmail.outbox = []
+    with scopes_disabled():
+        ActivityLog.objects.filter(event=event).delete()
+    task_periodic_event_services(event.slug)
+    event = event.__class__.objects.get(slug=event.slug)
+    assert len(djmail.outbox) == 0
+    assert not event.settings.sent_mail_event_created
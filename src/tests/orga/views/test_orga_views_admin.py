@@ -2,6 +2,7 @@ import json
 
 import pytest
 import responses
+from django.test import Client, override_settings
 
 from pretalx.common.models.settings import GlobalSettings
 from pretalx.person.models import User
@@ -107,3 +108,34 @@ def test_trigger(client, user):
     client.post("/orga/admin/update/", {"trigger": "on"})
     gs.settings.flush()
     assert gs.settings.update_check_last
+
+
+@pytest.mark.django_db
+@override_settings(
+    METRICS_ENABLED=True,
+    METRICS_TOKEN="secret",
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+def test_metrics_view(orga_user, orga_client):
+    orga_user.is_administrator = True
+    orga_user.save()
+    assert orga_client.get("/orga/admin/").status_code == 200
+    response = orga_client.get("/orga/admin/metrics/")
+    assert response.status_code == 200
+    content = response.content.decode()
+    assert 'pretalx_view_requests_total{view="orga:admin.dashboard"}' in content
+    assert 'pretalx_view_response_bytes_total{view="orga:admin.dashboard"}' in content
+
+    client = Client()
+    assert client.get("/orga/admin/metrics/").status_code == 401
+    response = client.get("/orga/admin/metrics/", HTTP_AUTHORIZATION="Bearer wrong")
+    assert response.status_code == 401
+    response = client.get("/orga/admin/metrics/", HTTP_AUTHORIZATION="Bearer secret")
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_metrics_view_disabled(orga_user, orga_client):
+    orga_user.is_administrator = True
+    orga_user.save()
+    assert orga_client.get("/orga/admin/metrics/").status_code == 404
@@ -271,3 +271,59 @@ def test_orga_can_regenerate_emails(
         assert (
             event.queued_mails.filter(sent__isnull=True).count() == 2
         )  # One for the accepted, one for the rejected, none for the submitted
+
+
+@pytest.mark.django_db
+def test_orga_can_accept_and_reject_in_bulk(
+    orga_client, orga_user, submission, other_submission, accepted_submission, event
+):
+    with scope(event=event):
+        event.queued_mails.all().delete()
+        speakers = list(submission.speakers.all())
+    response = orga_client.post(
+        event.orga_urls.reviews,
+        follow=True,
+        data={
+            f"s-{submission.pk}": "accept",
+            f"s-{other_submission.pk}": "reject",
+            f"s-{accepted_submission.pk}": "reject",
+            "s-999999": "accept",
+            "s-foo": "reject",
+            "s-0": "nonsense",
+        },
+    )
+    assert response.status_code == 200
+    assert "1 submissions were accepted, 1 submissions were rejected" in (
+        response.content.decode()
+    )
+    assert "unable to change the state of 3 submissions" in response.content.decode()
+    with scope(event=event):
+        submission.refresh_from_db()
+        other_submission.refresh_from_db()
+        accepted_submission.refresh_from_db()
+        assert submission.state == "accepted"
+        assert other_submission.state == "rejected"
+        assert accepted_submission.state == "accepted"
+        assert submission.slots.filter(schedule=event.wip_schedule).count() == 1
+        assert other_submission.slots.count() == 0
+        assert submission.logged_actions().get().action_type == (
+            "pretalx.submission.accept"
+        )
+        assert other_submission.logged_actions().get().person == orga_user
+        assert event.queued_mails.count() == 2
+        mail = event.queued_mails.get(to_users__in=speakers)
+        assert submission.title in mail.text
+        assert mail.to is None
+
+
+@pytest.mark.django_db
+def test_reviewer_cannot_accept_in_bulk(review_client, submission):
+    response = review_client.post(
+        submission.event.orga_urls.reviews,
+        follow=True,
+        data={f"s-{submission.pk}": "accept"},
+    )
+    assert response.status_code == 200
+    with scope(event=submission.event):
+        submission.refresh_from_db()
+        assert submission.state == "submitted"
@@ -36,6 +36,95 @@ def test_talk_list_with_filter(orga_client, event, schedule):
     assert content["results"][0]["title"]
 
 
+@pytest.mark.django_db
+def test_talk_list_since_token(orga_client, event, break_slot, room):
+    url = reverse("orga:schedule.api.talks", kwargs={"event": event.slug})
+    content = json.loads(orga_client.get(url, follow=True).content.decode())
+    assert content["full"] is True
+    token = content["change_token"]
+
+    content = json.loads(
+        orga_client.get(url, data={"since": token}, follow=True).content.decode()
+    )
+    assert content["full"] is False
+    assert content["results"] == []
+    assert content["deleted"] == []
+    assert content["change_token"] == token
+
+    with scope(event=event):
+        new_break = TalkSlot.objects.create(
+            schedule=event.wip_schedule,
+            room=room,
+            start=now(),
+            end=now(),
+            change_counter=event.wip_schedule.bump_change_counter(),
+        )
+        old_break = event.wip_schedule.talks.exclude(pk=new_break.pk).get()
+        deleted_pk = old_break.pk
+        old_break.delete()
+    content = json.loads(
+        orga_client.get(url, data={"since": token}, follow=True).content.decode()
+    )
+    assert content["full"] is False
+    assert [talk["id"] for talk in content["results"]] == [new_break.pk]
+    assert content["deleted"] == [deleted_pk]
+    assert content["change_token"] != token
+
+    content = json.loads(
+        orga_client.get(url, data={"since": "bogus"}, follow=True).content.decode()
+    )
+    assert content["full"] is True
+    assert [talk["id"] for talk in content["results"]] == [new_break.pk]
+
+
+@pytest.mark.django_db
+def test_talk_schedule_api_batch_update(orga_client, event, schedule, slot, room):
+    with scope(event=event):
+        slot = event.wip_schedule.talks.first()
+        break_slot = TalkSlot.objects.create(schedule=event.wip_schedule, room=room)
+        counter = event.wip_schedule.change_counter
+    start = now()
+    response = orga_client.patch(
+        reverse("orga:schedule.api.talks", kwargs={"event": event.slug}),
+        data=json.dumps(
+            [
+                {"id": slot.pk, "room": room.pk, "start": start.isoformat()},
+                {
+                    "id": break_slot.pk,
+                    "room": room.pk,
+                    "start": start.isoformat(),
+                    "duration": 10,
+                },
+            ]
+        ),
+        follow=True,
+    )
+    assert response.status_code == 200
+    content = json.loads(response.content.decode())
+    assert {talk["id"] for talk in content["results"]} == {slot.pk, break_slot.pk}
+    with scope(event=event):
+        slot.refresh_from_db()
+        break_slot.refresh_from_db()
+        assert slot.start == start
+        assert slot.room == room
+        assert break_slot.duration == 10
+        event.wip_schedule.refresh_from_db()
+        assert content["change_token"] == event.wip_schedule.change_token
+        # The whole batch is recorded as one change
+        assert event.wip_schedule.change_counter == counter + 1
+        assert slot.change_counter == break_slot.change_counter == counter + 1
+
+
+@pytest.mark.django_db
+def test_talk_schedule_api_batch_update_unknown_slot(orga_client, event, schedule):
+    response = orga_client.patch(
+        reverse("orga:schedule.api.talks", kwargs={"event": event.slug}),
+        data=json.dumps([{"id": 12345, "start": now().isoformat()}]),
+        follow=True,
+    )
+    assert response.status_code == 404
+
+
 @pytest.mark.django_db
 def test_talk_schedule_api_create_break(orga_client, event, schedule, room):
     with scope(event=event):
@@ -0,0 +1,93 @@
+import pytest
+from django.template.loader import get_template
+from django.utils import timezone
+from django_scopes import scope
+
+from pretalx import __version__
+from pretalx.common.urls import get_base_url
+from pretalx.schedule.exporters import FrabXCalExporter, FrabXmlExporter
+
+SPECIAL = "Tëst & <talk> \"double\" 'single' \x07☃"
+
+
+def render_template(name, exporter):
+    """Renders the schedule with the template that the exporters used
+    before they wrote their output directly."""
+    url = get_base_url(exporter.event)
+    context = {
+        "data": exporter.data,
+        "metadata": exporter.metadata,
+        "schedule": exporter.schedule,
+        "event": exporter.event,
+        "version": __version__,
+        "base_url": url,
+        "url": url,
+        "domain": url.split("//")[-1].split("/")[0],
+    }
+    return get_template(name).render(context=context)
+
+
+@pytest.fixture
+def special_schedule(slot, other_slot, break_slot, track, other_speaker):
+    event = slot.event
+    with scope(event=event):
+        event.name = SPECIAL
+        event.save()
+        slot.room.name = SPECIAL
+        slot.room.save()
+        submission = slot.submission
+        submission.title = SPECIAL
+        submission.abstract = SPECIAL
+        submission.description = None
+        submission.do_not_record = True
+        submission.track = track
+        submission.save()
+        submission.speakers.add(other_speaker)
+        other_speaker.name = SPECIAL
+        other_speaker.save()
+    return slot.schedule
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "exporter_class,template,expected",
+    (
+        (FrabXmlExporter, "agenda/schedule.xml", "<track>Test Track</track>"),
+        (FrabXCalExporter, "agenda/schedule.xcal", "<attendee>Jane Speaker</attendee>"),
+    ),
+)
+@pytest.mark.parametrize("tz", ("UTC", "America/New_York"))
+def test_frab_writers_match_templates(
+    special_schedule, exporter_class, template, expected, tz
+):
+    event = special_schedule.event
+    with scope(event=event), timezone.override(tz):
+        exporter = exporter_class(event, schedule=special_schedule)
+        __, __, content = exporter.render()
+        assert content == render_template(template, exporter)
+    assert expected in content
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "exporter_class,template",
+    (
+        (FrabXmlExporter, "agenda/schedule.xml"),
+        (FrabXCalExporter, "agenda/schedule.xcal"),
+    ),
+)
+def test_frab_writers_match_templates_without_schedule(event, exporter_class, template):
+    with scope(event=event):
+        exporter = exporter_class(event)
+        assert exporter.render()[2] == render_template(template, exporter)
+
+
+@pytest.mark.django_db
+def test_xcal_contains_event_name_and_stable_uids(slot):
+    event = slot.event
+    with scope(event=event):
+        content = FrabXCalExporter(event, schedule=slot.schedule).render()[2]
+    code = slot.submission.code
+    assert f"<x-wr-calname>{event.name}</x-wr-calname>" in content
+    assert f"<uid>{code}@@" in content
+    assert f"<pentabarf:event-slug>-{code}<" in content
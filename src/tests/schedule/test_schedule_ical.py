@@ -0,0 +1,95 @@
+import datetime as dt
+
+import pytest
+import pytz
+from django.test import override_settings
+from django_scopes import scope
+
+from pretalx.schedule.ical import escape_text, fold_line, render_ical
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        (None, ""),
+        ("Talk", "Talk"),
+        ("A, B; C", "A\\, B\\; C"),
+        ("back\\slash", "back\\\\slash"),
+        ("two\nlines\r\nthree", "two\\nlines\\nthree"),
+    ),
+)
+def test_ical_escape_text(value, expected):
+    assert escape_text(value) == expected
+
+
+def test_ical_fold_short_line():
+    assert fold_line("SUMMARY:Talk") == "SUMMARY:Talk\r\n"
+
+
+@pytest.mark.parametrize("char", ("a", "ä", "€", "🎉"))
+def test_ical_fold_long_line(char):
+    line = "SUMMARY:" + char * 100
+    folded = fold_line(line)
+    assert folded.endswith("\r\n")
+    lines = folded[:-2].split("\r\n")
+    assert len(lines) > 1
+    assert all(len(part.encode()) <= 75 for part in lines)
+    assert all(part.startswith(" ") for part in lines[1:])
+    assert "".join(part[1:] for part in lines[1:]) == line[len(lines[0]) :]
+
+
+@pytest.mark.django_db
+def test_ical_render(slot, other_slot):
+    event = slot.submission.event
+    creation_time = dt.datetime(2020, 1, 1, 12, tzinfo=pytz.utc)
+    with scope(event=event):
+        slot.submission.title = "Talk, with; special characters"
+        slot.submission.save()
+        speaker = slot.submission.speakers.first()
+        content = render_ical(
+            event,
+            slot.schedule.talks.filter(pk=slot.pk),
+            prodid="-//pretalx//example.com//",
+            netloc="example.com",
+            creation_time=creation_time,
+        )
+    lines = content.split("\r\n")
+    assert lines[:3] == [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//pretalx//example.com//",
+    ]
+    assert lines[-2:] == ["END:VCALENDAR", ""]
+    assert lines.count("BEGIN:VEVENT") == 1
+    assert f"UID:pretalx-{event.slug}-{slot.submission.code}@example.com" in lines
+    assert "DTSTAMP:20200101T120000Z" in lines
+    assert (
+        f"DTSTART:{slot.start.astimezone(pytz.utc).strftime('%Y%m%dT%H%M%SZ')}" in lines
+    )
+    assert (
+        f"SUMMARY:Talk\\, with\\; special characters - {speaker.name}"
+        in content.replace("\r\n ", "")
+    )
+    assert f"LOCATION:{slot.room.name}" in lines
+    assert f"URL:{slot.submission.urls.public.full()}" in content.replace("\r\n ", "")
+    assert other_slot.submission.title not in content
+
+
+@pytest.mark.django_db
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+def test_single_ical_is_cached_per_schedule_version(
+    slot, client, django_assert_max_num_queries
+):
+    first = client.get(slot.submission.urls.ical)
+    assert first.status_code == 200
+    with django_assert_max_num_queries(12):
+        second = client.get(slot.submission.urls.ical)
+    assert second.content == first.content
+
+    with scope(event=slot.event):
+        slot.event.release_schedule("new version")
+    third = client.get(slot.submission.urls.ical)
+    assert third.status_code == 200
+    assert slot.submission.title in third.content.decode()
@@ -0,0 +1,144 @@
+import io
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django_scopes import scope, scopes_disabled
+
+from pretalx.person.models import User
+from pretalx.schedule.importers import import_frab_schedule, read_frab_header
+from pretalx.submission.models import Submission
+
+TALK = """
+      <event guid='{guid}' id='{id}'>
+        <date>2016-10-24T09:30:00+02:00</date>
+        <start>{start}</start>
+        <duration>00:30</duration>
+        <room>{room}</room>
+        <recording><optout>{optout}</optout></recording>
+        <title>Talk {id}</title>
+        <subtitle />
+        <track>{track}</track>
+        <type>lecture</type>
+        <language>de</language>
+        <abstract>Abstract {id}</abstract>
+        <description />
+        <persons>{persons}</persons>
+      </event>"""
+
+
+def build_frab_file(count, version="1.0", rooms=("Room A", "Room B")):
+    talks = {room: [] for room in rooms}
+    for index in range(count):
+        room = rooms[index % len(rooms)]
+        talks[room].append(
+            TALK.format(
+                id=1000 + index,
+                guid=f"{index:08d}-1111-2222-3333-444444444444",
+                start=f"{9 + index // 10:02d}:{(index % 10) * 5:02d}",
+                room=room,
+                optout="true" if index % 2 else "false",
+                track=f"Track {index % 3}",
+                persons="".join(
+                    f"<person id='{number}'>Speaker {number}</person>"
+                    for number in {index % 7, (index + 1) % 7}
+                ),
+            )
+        )
+    room_xml = "".join(
+        f"<room name='{room}'>{''.join(room_talks)}</room>"
+        for room, room_talks in talks.items()
+    )
+    return io.BytesIO(
+        f"""<?xml version='1.0' encoding='utf-8'?>
+<schedule>
+  <version>{version}</version>
+  <conference><acronym>imp</acronym><title>Import</title></conference>
+  <day date='2016-10-24' index='1'>{room_xml}</day>
+</schedule>""".encode()
+    )
+
+
+def test_read_frab_header():
+    version, conference = read_frab_header(build_frab_file(3, version="2.0"))
+    assert version == "2.0"
+    assert conference.find("acronym").text == "imp"
+
+
+@pytest.mark.django_db
+def test_import_frab_schedule(event):
+    version = import_frab_schedule(build_frab_file(30), event, batch_size=7)
+    assert version == "1.0"
+    with scope(event=event):
+        assert event.current_schedule.version == "1.0"
+        assert event.submissions.count() == 30
+        assert event.rooms.count() == 2
+        assert event.tracks.filter(name__startswith="Track").count() == 3
+        assert event.submission_types.filter(name="lecture").count() == 1
+        assert event.speakers.count() == 7
+        assert User.objects.filter(name__startswith="Speaker").count() == 7
+        submission = event.submissions.get(code="1001")
+        assert submission.title == "Talk 1001"
+        assert submission.abstract == "Abstract 1001"
+        assert submission.do_not_record is True
+        assert submission.state == "confirmed"
+        assert set(submission.speakers.values_list("name", flat=True)) == {
+            "Speaker 1",
+            "Speaker 2",
+        }
+        slots = event.current_schedule.talks.all()
+        assert slots.count() == 30
+        assert all(slot.is_visible and slot.room for slot in slots)
+        assert event.wip_schedule.talks.count() == 30
+
+
+@pytest.mark.django_db
+def test_import_frab_schedule_queries_do_not_grow_with_talks(event):
+    def count_queries(count, version):
+        with CaptureQueriesContext(connection) as context:
+            import_frab_schedule(
+                build_frab_file(count, version=version), event, batch_size=1000
+            )
+        return len(context.captured_queries)
+
+    # Creates all rooms, tracks, speakers and the submission type
+    import_frab_schedule(build_frab_file(7, version="1.0"), event)
+    assert count_queries(10, "2.0") == count_queries(40, "3.0")
+
+
+@pytest.mark.django_db
+def test_import_frab_schedule_updates_existing_data(event, speaker):
+    import_frab_schedule(build_frab_file(4), event)
+    with scopes_disabled():
+        speaker.name = "Speaker 8"
+        speaker.save()
+        Submission.objects.filter(code="1000").update(title="Changed")
+
+    data = build_frab_file(10, version="1.1").read().replace(b"Speaker 0", b"Speaker 8")
+    import_frab_schedule(io.BytesIO(data), event)
+    with scope(event=event):
+        assert event.submissions.count() == 10
+        assert event.submissions.get(code="1000").title == "Talk 1000"
+        assert speaker in event.speakers
+        assert event.current_schedule.talks.count() == 10
+        assert event.wip_schedule.talks.count() == 10
+
+
+@pytest.mark.django_db
+def test_import_frab_schedule_uses_guid_for_taken_codes(event, other_event):
+    import_frab_schedule(build_frab_file(2), other_event)
+    import_frab_schedule(build_frab_file(2), event)
+    with scope(event=event):
+        assert set(event.submissions.values_list("code", flat=True)) == {
+            "00000000-1111-22",
+            "00000001-1111-22",
+        }
+
+
+@pytest.mark.django_db
+def test_import_frab_schedule_existing_version(event):
+    import_frab_schedule(build_frab_file(2), event)
+    with pytest.raises(Exception):
+        import_frab_schedule(build_frab_file(5), event)
+    with scope(event=event):
+        assert event.submissions.count() == 2
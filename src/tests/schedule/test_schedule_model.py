@@ -2,11 +2,12 @@ import datetime as dt
 
 import pytest
 from django.core import mail as djmail
+from django.db import models
 from django.utils.timezone import now
 from django_scopes import scope
 
 from pretalx.mail.models import QueuedMail
-from pretalx.schedule.models import Schedule, TalkSlot
+from pretalx.schedule.models import Schedule, TalkSlot, TalkSlotTombstone
 from pretalx.submission.models import Submission
 
 
@@ -254,3 +255,96 @@ def test_schedule_changes(event, slot, room, accepted_submission):
         schedule, _ = event.wip_schedule.freeze("test4")
         assert schedule.changes["count"] == 1
         assert len(schedule.changes["canceled_talks"]) == 1
+
+
+@pytest.mark.django_db
+def test_schedule_changes_are_stored_on_release(event, slot, room):
+    with scope(event=event):
+        wip_slot = slot.submission.slots.get(schedule=event.wip_schedule)
+        wip_slot.start += dt.timedelta(hours=1)
+        wip_slot.end += dt.timedelta(hours=1)
+        wip_slot.save()
+        expected = event.wip_schedule.changes
+        assert len(expected["moved_talks"]) == 1
+
+        schedule, __ = event.wip_schedule.freeze("stored", notify_speakers=False)
+        assert schedule.changelog
+        stored = Schedule.objects.get(pk=schedule.pk)
+        assert stored.changes == expected
+        assert stored.changes["moved_talks"][0]["new_start"] == wip_slot.start
+
+
+@pytest.mark.django_db
+def test_schedule_changes_are_stored_for_old_releases(event, slot):
+    with scope(event=event):
+        slot.schedule.changelog = None
+        slot.schedule.save()
+        schedule = Schedule.objects.get(pk=slot.schedule.pk)
+        changes = schedule.changes
+        assert schedule.changelog
+        assert Schedule.objects.get(pk=schedule.pk).changes == changes
+
+
+@pytest.mark.django_db
+def test_bump_change_counter(event, slot):
+    with scope(event=event):
+        wip_schedule = event.wip_schedule
+        counter = wip_schedule.change_counter
+        assert wip_schedule.bump_change_counter() == counter + 1
+        wip_schedule.refresh_from_db()
+        assert wip_schedule.change_counter == counter + 1
+
+        # Saving a slot does not change the counter by itself
+        slot = wip_schedule.talks.first()
+        slot.save()
+        wip_schedule.refresh_from_db()
+        assert wip_schedule.change_counter == counter + 1
+
+        # Released schedules are not edited anymore
+        released = slot.schedule if slot.schedule.version else event.current_schedule
+        released_counter = released.change_counter
+        assert released.bump_change_counter() == released_counter
+        released.refresh_from_db()
+        assert released.change_counter == released_counter
+
+
+@pytest.mark.django_db
+def test_delete_talks_records_tombstones(event, slot, django_assert_num_queries):
+    with scope(event=event):
+        wip_schedule = event.wip_schedule
+        talks = wip_schedule.talks.all()
+        talk_ids = set(talks.values_list("pk", flat=True))
+        counter = wip_schedule.change_counter
+        with django_assert_num_queries(5):
+            wip_schedule.delete_talks(talks)
+        assert not wip_schedule.talks.exists()
+        assert (
+            set(wip_schedule.tombstones.values_list("slot_id", flat=True)) == talk_ids
+        )
+        assert set(
+            wip_schedule.tombstones.values_list("change_counter", flat=True)
+        ) == {counter + 1}
+
+
+@pytest.mark.django_db
+def test_freeze_prunes_tombstones(event, slot):
+    with scope(event=event):
+        wip_schedule = event.wip_schedule
+        wip_schedule.talks.first().delete()
+        assert wip_schedule.tombstones.exists()
+        wip_schedule.freeze("new")
+        assert not TalkSlotTombstone.objects.filter(schedule=wip_schedule).exists()
+
+
+@pytest.mark.django_db
+def test_unfreeze_does_not_record_tombstones(event, slot, mocker):
+    deleted = mocker.Mock()
+    models.signals.post_delete.connect(deleted, sender=TalkSlot)
+    try:
+        with scope(event=event):
+            slot.schedule.unfreeze()
+    finally:
+        models.signals.post_delete.disconnect(deleted, sender=TalkSlot)
+    assert not deleted.called
+    with scope(event=event):
+        assert not TalkSlotTombstone.objects.exists()
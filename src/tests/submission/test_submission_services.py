@@ -0,0 +1,68 @@
+import pytest
+from django_scopes import scope
+
+from pretalx.submission.models import SubmissionStates
+from pretalx.submission.services import change_submission_states
+from pretalx.submission.signals import submission_state_change_bulk
+
+
+@pytest.mark.django_db
+def test_change_submission_states(
+    submission, other_submission, confirmed_submission, orga_user, mocker
+):
+    event = submission.event
+    signal = mocker.patch.object(submission_state_change_bulk, "send_robust")
+    with scope(event=event):
+        other_submission.slot_count = 2
+        other_submission.save()
+        event.queued_mails.all().delete()
+        counter = event.wip_schedule.change_counter
+        changed, failed = change_submission_states(
+            event,
+            [submission, other_submission],
+            SubmissionStates.ACCEPTED,
+            person=orga_user,
+        )
+        assert changed == [submission, other_submission]
+        assert failed == []
+        for sub in changed:
+            sub.refresh_from_db()
+            assert sub.state == SubmissionStates.ACCEPTED
+            assert sub.logged_actions().get().person == orga_user
+        slots = event.wip_schedule.talks.filter(
+            submission__in=[submission, other_submission]
+        )
+        assert slots.filter(submission=submission).count() == 1
+        assert slots.filter(submission=other_submission).count() == 2
+        assert all(slot.change_counter > counter for slot in slots)
+        assert event.queued_mails.count() == 2
+        assert set(event.queued_mails.values_list("to_users", flat=True)) == set(
+            submission.speakers.all()
+            .union(other_submission.speakers.all())
+            .values_list("pk", flat=True)
+        )
+        signal.assert_called_once_with(
+            event,
+            submissions=changed,
+            old_states={
+                submission.pk: SubmissionStates.SUBMITTED,
+                other_submission.pk: SubmissionStates.SUBMITTED,
+            },
+            user=orga_user,
+        )
+
+        changed, failed = change_submission_states(
+            event, [submission, confirmed_submission], SubmissionStates.REJECTED
+        )
+        assert changed == [submission]
+        assert failed == [confirmed_submission]
+        assert not event.wip_schedule.talks.filter(submission=submission).exists()
+        assert event.queued_mails.count() == 3
+
+
+@pytest.mark.django_db
+def test_change_submission_states_only_accepts_or_rejects(submission):
+    with pytest.raises(ValueError):
+        change_submission_states(
+            submission.event, [submission], SubmissionStates.CONFIRMED
+        )